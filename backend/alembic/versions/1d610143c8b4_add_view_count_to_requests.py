@@ -0,0 +1,26 @@
+"""add view_count to requests
+
+Revision ID: 1d610143c8b4
+Revises: d837e110ad16
+Create Date: 2026-10-19 06:52:55.514554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d610143c8b4'
+down_revision: Union[str, None] = 'd837e110ad16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('requests', sa.Column('view_count', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('requests', 'view_count')
@@ -0,0 +1,64 @@
+"""create analytics summary tables
+
+Revision ID: 1e3ee47f9617
+Revises: 2b03e6a53366
+Create Date: 2026-10-19 07:00:08.735051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e3ee47f9617'
+down_revision: Union[str, None] = '2b03e6a53366'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing enum types of the requests, bids and users tables
+bid_status = postgresql.ENUM(name='bidstatus', create_type=False)
+request_status = postgresql.ENUM(name='requeststatus', create_type=False)
+request_category = postgresql.ENUM(name='requestcategory', create_type=False)
+user_role = postgresql.ENUM(name='userrole', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table('analytics_bid_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', bid_status, nullable=False),
+    sa.Column('bids', sa.Integer(), nullable=False),
+    sa.Column('amount_total', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status')
+    )
+    op.create_table('analytics_refreshes',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('watermark', sa.DateTime(), nullable=True),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+    sa.Column('full_refreshed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('analytics_request_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', request_status, nullable=False),
+    sa.Column('category', request_category, nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('requests', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status', 'category', 'city')
+    )
+    op.create_table('analytics_users',
+    sa.Column('role', user_role, nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('users', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('role', 'city')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('analytics_users')
+    op.drop_table('analytics_request_daily')
+    op.drop_table('analytics_refreshes')
+    op.drop_table('analytics_bid_daily')
@@ -0,0 +1,52 @@
+"""add bid and request counters
+
+Revision ID: 2b03e6a53366
+Revises: 1d610143c8b4
+Create Date: 2026-10-19 06:56:09.616687
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b03e6a53366'
+down_revision: Union[str, None] = '1d610143c8b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('requests', sa.Column('bid_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('requests', sa.Column('pending_bid_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('open_request_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('active_bid_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the existing rows (afterwards scripts/reconcile_counters.py)
+    op.execute("""
+        UPDATE requests SET
+            bid_count = (SELECT count(*) FROM bids WHERE bids.request_id = requests.id),
+            pending_bid_count = (
+                SELECT count(*) FROM bids WHERE bids.request_id = requests.id AND bids.status = 'PENDING'
+            )
+        WHERE EXISTS (SELECT 1 FROM bids WHERE bids.request_id = requests.id)
+    """)
+    op.execute("""
+        UPDATE users SET
+            open_request_count = (
+                SELECT count(*) FROM requests WHERE requests.society_id = users.id AND requests.status = 'OPEN'
+            ),
+            active_bid_count = (
+                SELECT count(*) FROM bids
+                WHERE bids.contractor_id = users.id AND bids.status IN ('PENDING', 'ACCEPTED')
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'active_bid_count')
+    op.drop_column('users', 'open_request_count')
+    op.drop_column('requests', 'pending_bid_count')
+    op.drop_column('requests', 'bid_count')
@@ -0,0 +1,26 @@
+"""add resource_id to idempotency_keys
+
+Revision ID: 7c49ab0d1099
+Revises: 1e3ee47f9617
+Create Date: 2026-10-19 07:23:43.368684
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c49ab0d1099'
+down_revision: Union[str, None] = '1e3ee47f9617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('idempotency_keys', sa.Column('resource_id', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_keys', 'resource_id')
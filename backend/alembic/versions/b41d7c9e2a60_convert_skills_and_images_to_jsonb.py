@@ -0,0 +1,91 @@
+"""convert_skills_and_images_to_jsonb
+
+Revision ID: b41d7c9e2a60
+Revises: f73f78d72d56
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d7c9e2a60'
+down_revision: Union[str, None] = 'f73f78d72d56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add JSONB columns alongside the comma-separated text columns
+    op.add_column('requests', sa.Column('required_skills_json', postgresql.JSONB(), nullable=True))
+    op.add_column('requests', sa.Column('images_json', postgresql.JSONB(), nullable=True))
+
+    # Backfill: skills are trimmed, lower-cased and de-duplicated (first
+    # occurrence wins); image URLs are trimmed. Empty items are dropped.
+    op.execute("""
+        UPDATE requests SET required_skills_json = COALESCE((
+            SELECT jsonb_agg(skill ORDER BY first_pos)
+            FROM (
+                SELECT lower(btrim(item)) AS skill, min(pos) AS first_pos
+                FROM unnest(string_to_array(requests.required_skills, ',')) WITH ORDINALITY AS t(item, pos)
+                WHERE btrim(item) <> ''
+                GROUP BY lower(btrim(item))
+            ) AS skills
+        ), '[]'::jsonb)
+        WHERE required_skills IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE requests SET images_json = COALESCE((
+            SELECT jsonb_agg(btrim(item) ORDER BY pos)
+            FROM unnest(string_to_array(requests.images, ',')) WITH ORDINALITY AS t(item, pos)
+            WHERE btrim(item) <> ''
+        ), '[]'::jsonb)
+        WHERE images IS NOT NULL
+    """)
+
+    # Swap the columns
+    op.drop_column('requests', 'required_skills')
+    op.drop_column('requests', 'images')
+    op.alter_column('requests', 'required_skills_json', new_column_name='required_skills')
+    op.alter_column('requests', 'images_json', new_column_name='images')
+
+    # GIN index for skill containment filters (required_skills @> '["plumbing"]')
+    op.create_index(
+        'ix_requests_required_skills',
+        'requests',
+        ['required_skills'],
+        postgresql_using='gin',
+        postgresql_ops={'required_skills': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_requests_required_skills', table_name='requests')
+
+    op.add_column('requests', sa.Column('required_skills_text', sa.Text(), nullable=True))
+    op.add_column('requests', sa.Column('images_text', sa.Text(), nullable=True))
+
+    # Join the lists back into comma-separated strings
+    op.execute("""
+        UPDATE requests SET required_skills_text = (
+            SELECT string_agg(value, ', ' ORDER BY pos)
+            FROM jsonb_array_elements_text(requests.required_skills) WITH ORDINALITY AS t(value, pos)
+        )
+        WHERE required_skills IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE requests SET images_text = (
+            SELECT string_agg(value, ',' ORDER BY pos)
+            FROM jsonb_array_elements_text(requests.images) WITH ORDINALITY AS t(value, pos)
+        )
+        WHERE images IS NOT NULL
+    """)
+
+    op.drop_column('requests', 'required_skills')
+    op.drop_column('requests', 'images')
+    op.alter_column('requests', 'required_skills_text', new_column_name='required_skills')
+    op.alter_column('requests', 'images_text', new_column_name='images')
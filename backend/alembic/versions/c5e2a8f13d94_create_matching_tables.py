@@ -0,0 +1,64 @@
+"""create_matching_tables
+
+Revision ID: c5e2a8f13d94
+Revises: b41d7c9e2a60
+Create Date: 2026-10-19 11:40:07.518263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2a8f13d94'
+down_revision: Union[str, None] = 'b41d7c9e2a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    match_term_type = sa.Enum('CATEGORY', 'SKILL', 'CITY', name='matchtermtype')
+
+    op.create_table('request_match_terms',
+    sa.Column('term_type', match_term_type, nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('request_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['request_id'], ['requests.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('term_type', 'term', 'request_id')
+    )
+    op.create_index(op.f('ix_request_match_terms_request_id'), 'request_match_terms', ['request_id'], unique=False)
+
+    op.create_table('contractor_match_terms',
+    sa.Column('term_type', match_term_type, nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('contractor_id', sa.Integer(), nullable=False),
+    sa.Column('weight', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['contractor_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('term_type', 'term', 'contractor_id')
+    )
+    op.create_index(op.f('ix_contractor_match_terms_contractor_id'), 'contractor_match_terms', ['contractor_id'], unique=False)
+
+    op.create_table('contractor_recommendations',
+    sa.Column('contractor_id', sa.Integer(), nullable=False),
+    sa.Column('request_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['contractor_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['request_id'], ['requests.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('contractor_id', 'request_id')
+    )
+    op.create_index('ix_contractor_recommendations_feed', 'contractor_recommendations', ['contractor_id', 'score'], unique=False)
+    op.create_index(op.f('ix_contractor_recommendations_request_id'), 'contractor_recommendations', ['request_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contractor_recommendations_request_id'), table_name='contractor_recommendations')
+    op.drop_index('ix_contractor_recommendations_feed', table_name='contractor_recommendations')
+    op.drop_table('contractor_recommendations')
+    op.drop_index(op.f('ix_contractor_match_terms_contractor_id'), table_name='contractor_match_terms')
+    op.drop_table('contractor_match_terms')
+    op.drop_index(op.f('ix_request_match_terms_request_id'), table_name='request_match_terms')
+    op.drop_table('request_match_terms')
+    sa.Enum(name='matchtermtype').drop(op.get_bind(), checkfirst=True)
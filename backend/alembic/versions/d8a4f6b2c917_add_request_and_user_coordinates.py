@@ -0,0 +1,47 @@
+"""add_request_and_user_coordinates
+
+Revision ID: d8a4f6b2c917
+Revises: c5e2a8f13d94
+Create Date: 2026-10-19 13:05:44.270391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a4f6b2c917'
+down_revision: Union[str, None] = 'c5e2a8f13d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('requests', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('requests', sa.Column('longitude', sa.Float(), nullable=True))
+    op.add_column('requests', sa.Column('geohash', sa.String(length=12), nullable=True))
+    op.add_column('users', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('users', sa.Column('longitude', sa.Float(), nullable=True))
+    op.add_column('users', sa.Column('geohash', sa.String(length=12), nullable=True))
+
+    # Pattern ops so prefix matches (geohash LIKE 'te7u%') can use the index
+    op.create_index(
+        'ix_requests_geohash',
+        'requests',
+        ['geohash'],
+        postgresql_ops={'geohash': 'varchar_pattern_ops'},
+    )
+
+    # Existing rows are located with: python scripts/import_pincodes.py --backfill
+
+
+def downgrade() -> None:
+    op.drop_index('ix_requests_geohash', table_name='requests')
+    op.drop_column('users', 'geohash')
+    op.drop_column('users', 'longitude')
+    op.drop_column('users', 'latitude')
+    op.drop_column('requests', 'geohash')
+    op.drop_column('requests', 'longitude')
+    op.drop_column('requests', 'latitude')
@@ -0,0 +1,43 @@
+"""add_sync_tombstones_and_updated_at_indexes
+
+Revision ID: e3b7c1d9f482
+Revises: d8a4f6b2c917
+Create Date: 2026-10-19 14:21:09.836152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7c1d9f482'
+down_revision: Union[str, None] = 'd8a4f6b2c917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.Enum('REQUEST', 'BID', name='syncentitytype'), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sync_tombstones_deleted_at_id', 'sync_tombstones', ['deleted_at', 'id'], unique=False)
+
+    # Keyset indexes for delta sync
+    op.create_index('ix_requests_updated_at_id', 'requests', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_bids_updated_at_id', 'bids', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bids_updated_at_id', table_name='bids')
+    op.drop_index('ix_requests_updated_at_id', table_name='requests')
+    op.drop_index('ix_sync_tombstones_deleted_at_id', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    sa.Enum(name='syncentitytype').drop(op.get_bind(), checkfirst=True)
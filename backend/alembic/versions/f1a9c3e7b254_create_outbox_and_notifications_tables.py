@@ -0,0 +1,66 @@
+"""create_outbox_and_notifications_tables
+
+Revision ID: f1a9c3e7b254
+Revises: e3b7c1d9f482
+Create Date: 2026-10-19 16:02:47.215384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a9c3e7b254'
+down_revision: Union[str, None] = 'e3b7c1d9f482'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+notification_type = postgresql.ENUM(
+    'BID_SUBMITTED', 'BID_ACCEPTED', 'REQUEST_STATUS_CHANGED',
+    name='notificationtype',
+    create_type=False
+)
+
+
+def upgrade() -> None:
+    notification_type.create(op.get_bind(), checkfirst=True)
+
+    op.create_table('outbox_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', notification_type, nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['id'], unique=False, postgresql_where=sa.text('processed_at IS NULL'))
+
+    op.create_table('notifications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('type', notification_type, nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_user_id_id', 'notifications', ['user_id', 'id'], unique=False)
+    op.create_index('ix_notifications_undelivered', 'notifications', ['created_at'], unique=False, postgresql_where=sa.text('delivered_at IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_undelivered', table_name='notifications', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.drop_index('ix_notifications_user_id_id', table_name='notifications')
+    op.drop_table('notifications')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events', postgresql_where=sa.text('processed_at IS NULL'))
+    op.drop_table('outbox_events')
+    sa.Enum(name='notificationtype').drop(op.get_bind(), checkfirst=True)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from jose import JWTError
 
 from app.core.database import get_db
+from app.core.revocation import revocations
 from app.core.security import decode_token
 from app.repositories.user_repository import UserRepository
 from app.models.user import User
@@ -58,6 +59,10 @@ def get_current_user(
         if user_id is None:
             print(f"🔐 DEBUG get_current_user - user_id is None!")
             raise credentials_exception
+        
+        # Bloom filter check; only a possible hit reaches the database
+        if revocations.is_revoked(payload.get("jti"), db):
+            raise credentials_exception
             
     except JWTError:
         print(f"🔐 DEBUG get_current_user - JWTError occurred!")
@@ -1,35 +1,70 @@
 """
-API v1 router - combines all v1 endpoints.
+API v1 routers - combines all v1 endpoints.
+
+The core routers (including admin analytics and the dashboards) are always
+mounted. The optional ones (sync, notifications, realtime) are imported
+only when listed in OPTIONAL_ROUTERS, so deployments that do not serve them
+skip their modules at startup.
+
+Sub-routers are included straight into the app rather than through an
+intermediate APIRouter: FastAPI rebuilds every route (dependencies and
+response fields) at each include level, so the extra level cost a full
+copy of the route table at startup.
 """
 
-from fastapi import APIRouter
-
-from app.api.v1 import auth, users, requests, bids
-
-# Create main API v1 router
-api_router = APIRouter()
-
-# Include sub-routers with prefixes and tags
-api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["Authentication"],
-)
-
-api_router.include_router(
-    users.router,
-    prefix="/users",
-    tags=["Users"],
-)
-
-api_router.include_router(
-    requests.router,
-    prefix="/requests",
-    tags=["Requests"],
-)
-
-api_router.include_router(
-    bids.router,
-    prefix="/bids",
-    tags=["Bids"],
-)
+from importlib import import_module
+
+from fastapi import FastAPI
+
+from app.api.v1 import analytics, auth, dashboard, users, requests, bids
+from app.core.config import settings
+
+# Sub-routers with their prefixes and tags
+CORE_ROUTERS = [
+    (auth, {"prefix": "/auth", "tags": ["Authentication"]}),
+    (users, {"prefix": "/users", "tags": ["Users"]}),
+    (requests, {"prefix": "/requests", "tags": ["Requests"]}),
+    (bids, {"prefix": "/bids", "tags": ["Bids"]}),
+    (analytics, {"prefix": "/analytics", "tags": ["Analytics"]}),
+    (dashboard, {"prefix": "/dashboard", "tags": ["Dashboard"]}),
+]
+
+# Core routers may still be listed in OPTIONAL_ROUTERS (analytics and dashboard used to be optional)
+CORE_ROUTER_NAMES = {module.__name__.rsplit(".", 1)[-1] for module, _ in CORE_ROUTERS}
+
+# Optional routers: name -> include_router keyword arguments
+OPTIONAL_ROUTERS = {
+    "sync": {"prefix": "/sync", "tags": ["Sync"]},
+    "notifications": {"prefix": "/notifications", "tags": ["Notifications"]},
+    "realtime": {"tags": ["Realtime"]},
+}
+
+
+def include_routers(app: FastAPI, prefix: str = "/api/v1") -> None:
+    """
+    Mount the core routers and the enabled optional ones on the app.
+    
+    Args:
+        app: FastAPI application
+        prefix: Path prefix for every v1 route
+    
+    Raises:
+        ValueError: If OPTIONAL_ROUTERS names an unknown router
+    """
+    modules = list(CORE_ROUTERS)
+    for name in settings.enabled_optional_routers:
+        if name in CORE_ROUTER_NAMES:
+            continue
+        if name not in OPTIONAL_ROUTERS:
+            raise ValueError(
+                f"Unknown optional router: {name}. "
+                f"Valid options: {', '.join(OPTIONAL_ROUTERS)}"
+            )
+        modules.append((import_module(f"app.api.v1.{name}"), OPTIONAL_ROUTERS[name]))
+    
+    for module, options in modules:
+        app.include_router(
+            module.router,
+            prefix=prefix + options.get("prefix", ""),
+            tags=options["tags"],
+        )
@@ -0,0 +1,149 @@
+"""
+Admin analytics endpoints.
+
+Served from the summary tables (see app/services/analytics_service.py),
+never from the live requests, bids and users tables.
+"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.api.dependencies import get_admin_user
+from app.models.bid import BidStatus
+from app.models.request import RequestCategory, RequestStatus
+from app.models.user import User, UserRole
+from app.services.analytics_service import AnalyticsService
+from app.schemas.analytics import (
+    AnalyticsRefreshResponse,
+    AnalyticsResponse,
+    BidAnalyticsGroup,
+    RequestAnalyticsGroup,
+    UserAnalyticsGroup,
+)
+
+router = APIRouter(tags=["Analytics"])  # Remove prefix here, it's added in __init__.py
+
+
+def get_analytics_service(db: Session = Depends(get_db)) -> AnalyticsService:
+    """Dependency to get AnalyticsService instance."""
+    return AnalyticsService(db)
+
+
+@router.get(
+    "/requests",
+    response_model=AnalyticsResponse,
+    summary="Request counts",
+    description="""
+    Count requests by day (of creation), status, category or city, optionally
+    filtered by a creation day range and the other dimensions.
+    
+    Figures are as of the last summary refresh (`refreshed_at`).
+    
+    **Admin only.**
+    """,
+    responses={
+        200: {"description": "Counts retrieved successfully"},
+        400: {"description": "Invalid day range"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not an admin"}
+    }
+)
+async def request_analytics(
+    group_by: RequestAnalyticsGroup = Query(RequestAnalyticsGroup.STATUS, description="Dimension to group by"),
+    start: Optional[date] = Query(None, description="First creation day (UTC) to include"),
+    end: Optional[date] = Query(None, description="Last creation day (UTC) to include"),
+    status: Optional[RequestStatus] = Query(None, description="Filter by status"),
+    category: Optional[RequestCategory] = Query(None, description="Filter by category"),
+    city: Optional[str] = Query(None, description="Filter by city"),
+    current_user: User = Depends(get_admin_user),
+    service: AnalyticsService = Depends(get_analytics_service)
+) -> AnalyticsResponse:
+    """Count requests by one dimension (admin only)."""
+    return service.request_analytics(group_by, start, end, request_status=status, category=category, city=city)
+
+
+@router.get(
+    "/bids",
+    response_model=AnalyticsResponse,
+    summary="Bid counts",
+    description="""
+    Count bids, with total and average amount, by day (of creation) or status.
+    
+    Figures are as of the last summary refresh (`refreshed_at`).
+    
+    **Admin only.**
+    """,
+    responses={
+        200: {"description": "Counts retrieved successfully"},
+        400: {"description": "Invalid day range"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not an admin"}
+    }
+)
+async def bid_analytics(
+    group_by: BidAnalyticsGroup = Query(BidAnalyticsGroup.STATUS, description="Dimension to group by"),
+    start: Optional[date] = Query(None, description="First creation day (UTC) to include"),
+    end: Optional[date] = Query(None, description="Last creation day (UTC) to include"),
+    status: Optional[BidStatus] = Query(None, description="Filter by status"),
+    current_user: User = Depends(get_admin_user),
+    service: AnalyticsService = Depends(get_analytics_service)
+) -> AnalyticsResponse:
+    """Count bids by one dimension (admin only)."""
+    return service.bid_analytics(group_by, start, end, bid_status=status)
+
+
+@router.get(
+    "/users",
+    response_model=AnalyticsResponse,
+    summary="User counts",
+    description="""
+    Count users by role or city. Users without a city are counted under `""`.
+    
+    Figures are as of the last summary refresh (`refreshed_at`).
+    
+    **Admin only.**
+    """,
+    responses={
+        200: {"description": "Counts retrieved successfully"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not an admin"}
+    }
+)
+async def user_analytics(
+    group_by: UserAnalyticsGroup = Query(UserAnalyticsGroup.ROLE, description="Dimension to group by"),
+    role: Optional[UserRole] = Query(None, description="Filter by role"),
+    city: Optional[str] = Query(None, description="Filter by city"),
+    current_user: User = Depends(get_admin_user),
+    service: AnalyticsService = Depends(get_analytics_service)
+) -> AnalyticsResponse:
+    """Count users by one dimension (admin only)."""
+    return service.user_analytics(group_by, role=role, city=city)
+
+
+@router.post(
+    "/refresh",
+    response_model=AnalyticsRefreshResponse,
+    summary="Refresh summaries",
+    description="""
+    Bring the summary tables up to date now instead of waiting for
+    scripts/refresh_analytics.py. With `full=true` the daily summaries are
+    rebuilt from scratch (this scans the requests and bids tables).
+    
+    **Admin only.**
+    """,
+    responses={
+        200: {"description": "Summaries refreshed"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not an admin"}
+    }
+)
+def refresh_analytics(
+    full: bool = Query(False, description="Rebuild from scratch"),
+    current_user: User = Depends(get_admin_user),
+    service: AnalyticsService = Depends(get_analytics_service)
+) -> AnalyticsRefreshResponse:
+    """Refresh the summary tables (admin only)."""
+    return service.refresh(full=full)
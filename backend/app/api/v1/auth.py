@@ -2,15 +2,20 @@
 Authentication API endpoints.
 """
 
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.passwords import PasswordHasherBusy
+from app.core.revocation import revocations
+from app.core.security import decode_token
 from app.services.auth_service import AuthService
-from app.api.dependencies import get_current_user, get_current_active_user
+from app.api.dependencies import get_current_user, get_current_active_user, security
 from app.schemas.user import UserCreate, UserResponse, UserProfile
 from app.schemas.otp import OTPRequest, OTPVerify, OTPResponse
-from app.schemas.token import Token, RefreshToken, TokenRefreshResponse
+from app.schemas.token import Token, RefreshToken, TokenRefreshResponse, LogoutRequest
 from app.models.user import User
 
 router = APIRouter()
@@ -56,10 +61,11 @@ router = APIRouter()
             }
         },
         400: {"description": "User already exists or invalid data"},
-        422: {"description": "Validation error"}
+        422: {"description": "Validation error"},
+        503: {"description": "Too many registrations in progress, retry shortly"}
     }
 )
-async def register(
+def register(
     user_data: UserCreate,
     db: Session = Depends(get_db)
 ):
@@ -73,6 +79,12 @@ async def register(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
 
 
 @router.post(
@@ -164,15 +176,18 @@ async def login(
     responses={
         200: {"description": "Login successful, tokens returned"},
         400: {"description": "Invalid credentials or account issues"},
-        422: {"description": "Validation error"}
+        422: {"description": "Validation error"},
+        503: {"description": "Too many password logins in progress, retry shortly"}
     }
 )
-async def login_with_password(
+def login_with_password(
     phone_number: str,
     password: str,
     db: Session = Depends(get_db)
 ):
     """Login with phone number and password."""
+    # Plain def: FastAPI runs it in the threadpool, so waiting on the
+    # password hashing pool never blocks the event loop
     try:
         auth_service = AuthService(db)
         result = auth_service.login_with_password(phone_number, password)
@@ -182,6 +197,12 @@ async def login_with_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
 
 
 @router.post(
@@ -304,13 +325,14 @@ async def refresh_token(
 ):
     """Refresh access token using refresh token."""
     try:
-        from app.core.security import decode_token
-        
         # Decode refresh token
         payload = decode_token(refresh_data.refresh_token)
         if payload is None or payload.get("type") != "refresh":
             raise ValueError("Invalid refresh token")
         
+        if revocations.is_revoked(payload.get("jti"), db):
+            raise ValueError("Refresh token has been revoked")
+        
         user_id = payload.get("user_id")
         if user_id is None:
             raise ValueError("Invalid refresh token")
@@ -379,36 +401,55 @@ async def get_current_user_profile(
 @router.post(
     "/logout",
     status_code=status.HTTP_200_OK,
-    summary="Logout (Client-side)",
+    summary="Logout",
     description="""
-    Logout endpoint (informational only).
+    Revoke the access token used to call this endpoint and, if sent, the
+    refresh token, so neither can be used again.
+    
+    **Authentication Required:**
+    Include JWT access token in Authorization header.
     
-    **Note:** JWT tokens are stateless, so logout is handled client-side.
+    **Request body (optional):**
+    - refresh_token: Refresh token to revoke as well
     
     **Client should:**
     1. Delete access_token from storage
     2. Delete refresh_token from storage
     3. Clear any user session data
     
-    **Server-side logout (future):**
-    - Token blacklisting can be implemented with Redis
-    - Refresh token can be revoked in database
+    **Note:** Revocation applies immediately on the server that handled the
+    logout and within a few seconds on all others.
     """,
     responses={
         200: {
-            "description": "Logout successful (client-side)",
+            "description": "Logout successful, tokens revoked",
             "content": {
                 "application/json": {
                     "example": {
-                        "message": "Logged out successfully. Please delete tokens from client."
+                        "message": "Logged out successfully. Please delete tokens from client storage."
                     }
                 }
             }
-        }
+        },
+        400: {"description": "Invalid refresh token"},
+        401: {"description": "Not authenticated"}
     }
 )
-async def logout():
-    """Logout endpoint (client-side token deletion)."""
-    return {
-        "message": "Logged out successfully. Please delete tokens from client storage."
-    }
+async def logout(
+    logout_data: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Logout by revoking the current tokens."""
+    try:
+        auth_service = AuthService(db)
+        return auth_service.logout(
+            decode_token(credentials.credentials),
+            logout_data.refresh_token if logout_data else None
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -3,17 +3,31 @@ Bid management API endpoints.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.idempotency import get_idempotency_key, run_idempotent
+from app.core.http_cache import (
+    ConditionalHeaders,
+    get_conditional_headers,
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.core.responses import FastJSONResponse
 from app.api.dependencies import get_current_user
 from app.models.user import User
-from app.models.bid import BidStatus
+from app.models.bid import Bid, BidStatus
 from app.repositories.bid_repository import BidRepository
 from app.repositories.request_repository import RequestRepository
 from app.repositories.user_repository import UserRepository
+from app.repositories.matching_repository import MatchingRepository
+from app.repositories.notification_repository import NotificationRepository
 from app.services.bid_service import BidService
+from app.services.matching_service import MatchingService
+from app.services.notification_service import NotificationService
 from app.schemas.bid import (
     BidCreate,
     BidUpdate,
@@ -31,7 +45,9 @@ def get_bid_service(db: Session = Depends(get_db)) -> BidService:
     bid_repo = BidRepository(db)
     request_repo = RequestRepository(db)
     user_repo = UserRepository(db)
-    return BidService(bid_repo, request_repo, user_repo)
+    matching_service = MatchingService(MatchingRepository(db))
+    notification_service = NotificationService(NotificationRepository(db))
+    return BidService(bid_repo, request_repo, user_repo, matching_service, notification_service)
 
 
 @router.post(
@@ -55,23 +71,35 @@ def get_bid_service(db: Session = Depends(get_db)) -> BidService:
     - proposal: Detailed work proposal (min 50 chars)
     
     After submission, bid status will be PENDING until society accepts or rejects it.
+    
+    **Retries:** Send an `Idempotency-Key` header to make retries safe: a
+    retry with the same key and body returns the original bid
+    (`Idempotent-Replayed: true`) instead of failing as a duplicate.
     """,
     responses={
         201: {"description": "Bid submitted successfully"},
         400: {"description": "Invalid bid (duplicate, closed request, etc.)"},
         403: {"description": "User is not a contractor"},
         404: {"description": "Request not found"},
-        401: {"description": "Not authenticated"}
+        401: {"description": "Not authenticated"},
+        409: {"description": "A request with this Idempotency-Key is still being processed"},
+        422: {"description": "Invalid body, or Idempotency-Key reused for a different request"}
     }
 )
 async def submit_bid(
     bid_data: BidCreate,
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
     current_user: User = Depends(get_current_user),
-    service: BidService = Depends(get_bid_service)
+    service: BidService = Depends(get_bid_service),
+    db: Session = Depends(get_db)
 ) -> BidResponse:
     """Submit a bid on a request (contractor only)."""
-    bid = service.submit_bid(bid_data, current_user.id)
-    return BidResponse.model_validate(bid)
+    return run_idempotent(
+        db, current_user.id, idempotency_key, "POST /bids", bid_data,
+        lambda: BidResponse.model_validate(service.submit_bid(bid_data, current_user.id)),
+        Bid,
+        lambda bid_id: BidResponse.model_validate(service.get_bid(bid_id))
+    )
 
 
 @router.get(
@@ -92,9 +120,12 @@ async def submit_bid(
     
     **Pagination:**
     - skip, limit: Standard pagination parameters
+    
+    **Caching:** Supports conditional GET (`ETag`, `Last-Modified`).
     """,
     responses={
         200: {"description": "List of bids"},
+        304: {"description": "Not modified since the cached version"},
         404: {"description": "Request not found"},
         401: {"description": "Not authenticated"}
     }
@@ -104,17 +135,28 @@ async def list_bids_for_request(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[BidStatus] = Query(None, description="Filter by status"),
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     current_user: User = Depends(get_current_user),
     service: BidService = Depends(get_bid_service)
 ) -> BidListResponse:
     """List all bids for a request."""
-    return service.list_bids_for_request(
+    # Visibility depends on the caller, so the ETag is scoped to the user;
+    # resolving it first also 404s before a stale ETag can get a 304
+    own_bid_only = service.get_request_bids_visibility(request_id, current_user.id)
+    count, last_modified = service.get_request_bids_version(request_id, status, current_user.id, own_bid_only)
+    etag = make_etag("request-bids", request_id, current_user.id, count, last_modified, skip, limit, status)
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    
+    payload = service.list_bids_for_request(
         request_id=request_id,
         skip=skip,
         limit=limit,
         status=status,
-        user_id=current_user.id
+        user_id=current_user.id,
+        own_bid_only=own_bid_only
     )
+    return set_cache_headers(FastJSONResponse(payload), etag, last_modified)
 
 
 @router.get(
@@ -132,10 +174,13 @@ async def list_bids_for_request(
     **Pagination:**
     - skip, limit: Standard pagination
     
+    **Caching:** Supports conditional GET (`ETag`, `Last-Modified`).
+    
     **Authentication required.**
     """,
     responses={
         200: {"description": "List of contractor's bids"},
+        304: {"description": "Not modified since the cached version"},
         401: {"description": "Not authenticated"}
     }
 )
@@ -143,16 +188,23 @@ async def get_my_bids(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[BidStatus] = Query(None, description="Filter by status"),
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     current_user: User = Depends(get_current_user),
     service: BidService = Depends(get_bid_service)
 ) -> BidListResponse:
     """Get bids submitted by current contractor."""
-    return service.get_my_bids(
+    count, last_modified = service.get_my_bids_version(current_user.id, status)
+    etag = make_etag("my-bids", current_user.id, count, last_modified, skip, limit, status)
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    
+    payload = service.get_my_bids(
         contractor_id=current_user.id,
         skip=skip,
         limit=limit,
         status=status
     )
+    return set_cache_headers(FastJSONResponse(payload), etag, last_modified)
 
 
 @router.get(
@@ -167,21 +219,32 @@ async def get_my_bids(
     - Society owner of the request: Can see all bids on their request
     - Admin: Can see any bid
     
+    **Caching:** Supports conditional GET (`ETag`, `Last-Modified`).
+    
     **Authentication required.**
     """,
     responses={
         200: {"description": "Bid details"},
+        304: {"description": "Not modified since the cached version"},
         404: {"description": "Bid not found"},
         401: {"description": "Not authenticated"}
     }
 )
 async def get_bid(
     bid_id: int,
+    response: Response,
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     current_user: User = Depends(get_current_user),
     service: BidService = Depends(get_bid_service)
 ) -> BidResponse:
     """Get bid by ID."""
+    last_modified = service.get_bid_version(bid_id)
+    etag = make_etag("bid", bid_id, last_modified)
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    
     bid = service.get_bid(bid_id)
+    set_cache_headers(response, etag, last_modified)
     return BidResponse.model_validate(bid)
 
 
@@ -0,0 +1,82 @@
+"""
+Dashboard endpoints for the mobile home screens.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.http_cache import PRIVATE_CACHE_CONTROL
+from app.core.responses import FastJSONResponse
+from app.api.dependencies import get_contractor_user, get_society_user
+from app.models.user import User
+from app.repositories.bid_repository import BidRepository
+from app.repositories.request_repository import RequestRepository
+from app.services.dashboard_service import DashboardService
+from app.schemas.dashboard import ContractorDashboardResponse, SocietyDashboardResponse
+
+router = APIRouter(tags=["Dashboard"])  # Remove prefix here, it's added in __init__.py
+
+
+def get_dashboard_service(db: Session = Depends(get_db)) -> DashboardService:
+    """Dependency to get DashboardService instance."""
+    return DashboardService(RequestRepository(db), BidRepository(db))
+
+
+@router.get(
+    "/society",
+    response_model=SocietyDashboardResponse,
+    summary="Society home screen",
+    description="""
+    Everything the society app shows on launch, in one call:
+    
+    - `open_requests`: number of open requests
+    - `requests`: first page of `/requests/my-requests`
+    - `bid_statistics`: `/bids/request/{id}/statistics` for every request on
+      that page, keyed by request ID
+    
+    **Society users only.**
+    """,
+    responses={
+        200: {"description": "Dashboard retrieved successfully"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not a society user"}
+    }
+)
+async def get_society_dashboard(
+    limit: int = Query(20, ge=1, le=100, description="Requests to include"),
+    current_user: User = Depends(get_society_user),
+    service: DashboardService = Depends(get_dashboard_service)
+) -> SocietyDashboardResponse:
+    """Get the current society's dashboard."""
+    payload = service.get_society_dashboard(current_user, limit)
+    return FastJSONResponse(payload, headers={"Cache-Control": PRIVATE_CACHE_CONTROL})
+
+
+@router.get(
+    "/contractor",
+    response_model=ContractorDashboardResponse,
+    summary="Contractor home screen",
+    description="""
+    Everything the contractor app shows on launch, in one call:
+    
+    - `active_bids`: number of pending or accepted bids
+    - `bids`: first page of `/bids/my-bids`
+    - `assigned`: first page of `/requests/assigned-to-me`
+    
+    **Contractor users only.**
+    """,
+    responses={
+        200: {"description": "Dashboard retrieved successfully"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not a contractor"}
+    }
+)
+async def get_contractor_dashboard(
+    limit: int = Query(20, ge=1, le=100, description="Bids and assigned requests to include (each)"),
+    current_user: User = Depends(get_contractor_user),
+    service: DashboardService = Depends(get_dashboard_service)
+) -> ContractorDashboardResponse:
+    """Get the current contractor's dashboard."""
+    payload = service.get_contractor_dashboard(current_user, limit)
+    return FastJSONResponse(payload, headers={"Cache-Control": PRIVATE_CACHE_CONTROL})
@@ -0,0 +1,78 @@
+"""
+Notification inbox endpoints.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.api.dependencies import get_current_user
+from app.models.user import User
+from app.repositories.notification_repository import NotificationRepository
+from app.services.notification_service import NotificationService
+from app.schemas.notification import (
+    NotificationListResponse,
+    NotificationReadRequest,
+    NotificationReadResponse
+)
+
+router = APIRouter(tags=["Notifications"])  # Remove prefix here, it's added in __init__.py
+
+
+def get_notification_service(db: Session = Depends(get_db)) -> NotificationService:
+    """Dependency to get NotificationService instance."""
+    return NotificationService(NotificationRepository(db))
+
+
+@router.get(
+    "",
+    response_model=NotificationListResponse,
+    summary="List notifications",
+    description="""
+    Get the current user's notifications, newest first.
+    
+    Societies are notified of new bids on their requests, contractors when
+    their bid is accepted, and both sides when a request's status changes.
+    Unread notifications are also sent as a periodic SMS/email digest.
+    
+    **Authentication required.**
+    """,
+    responses={
+        200: {"description": "Notifications retrieved successfully"},
+        401: {"description": "Not authenticated"}
+    }
+)
+async def list_notifications(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum records to return"),
+    unread_only: bool = Query(False, description="Only unread notifications"),
+    current_user: User = Depends(get_current_user),
+    service: NotificationService = Depends(get_notification_service)
+) -> NotificationListResponse:
+    """List the current user's notifications."""
+    return service.list_notifications(current_user.id, skip, limit, unread_only)
+
+
+@router.post(
+    "/read",
+    response_model=NotificationReadResponse,
+    summary="Mark notifications as read",
+    description="""
+    Mark the given notifications as read, or all of them when `ids` is omitted.
+    
+    Notifications read before the next digest is due are left out of it.
+    
+    **Authentication required.**
+    """,
+    responses={
+        200: {"description": "Notifications marked as read"},
+        401: {"description": "Not authenticated"}
+    }
+)
+async def mark_notifications_read(
+    body: NotificationReadRequest,
+    current_user: User = Depends(get_current_user),
+    service: NotificationService = Depends(get_notification_service)
+) -> NotificationReadResponse:
+    """Mark notifications as read."""
+    return NotificationReadResponse(updated=service.mark_read(current_user.id, body.ids))
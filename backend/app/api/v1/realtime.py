@@ -0,0 +1,94 @@
+"""
+Real-time WebSocket endpoint.
+"""
+
+import asyncio
+import time
+from typing import Optional
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, status
+
+from app.core.database import SessionLocal
+from app.core.realtime import realtime
+from app.core.revocation import revocations
+from app.core.security import decode_token, verify_token_type
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+
+router = APIRouter(tags=["Realtime"])
+
+
+def _authenticate(token: Optional[str]) -> tuple[Optional[User], float]:
+    """
+    Resolve the user and token expiry for a WebSocket handshake.
+    
+    Args:
+        token: JWT access token
+    
+    Returns:
+        Tuple of (active user or None, seconds until the token expires)
+    """
+    payload = decode_token(token) if token else None
+    if not payload or not verify_token_type(payload, "access") or payload.get("user_id") is None:
+        return None, 0.0
+    
+    db = SessionLocal()
+    try:
+        if revocations.is_revoked(payload.get("jti"), db):
+            return None, 0.0
+        user = UserRepository(db).get_by_id(payload["user_id"])
+    finally:
+        db.close()
+    
+    if user is None or not user.is_active:
+        return None, 0.0
+    return user, payload["exp"] - time.time()
+
+
+async def _receive(websocket: WebSocket) -> None:
+    """Answer client keep-alive pings until the socket closes."""
+    while True:
+        message = await websocket.receive_text()
+        if message == "ping":
+            await websocket.send_text("pong")
+
+
+@router.websocket("/ws")
+async def events_socket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None, description="JWT access token")
+):
+    """
+    Push bid and request events to the authenticated user.
+    
+    Connect to `/api/v1/ws?token=<access_token>` (or send the token in an
+    `Authorization: Bearer` header). Each event is a JSON text frame:
+        
+        {"type": "bid.submitted", "data": {...}, "sent_at": "..."}
+    
+    Event types: `bid.submitted` (to the society that posted the request),
+    `bid.accepted` (to the contractor), `request.status_changed` (to the
+    society and the assigned contractor).
+    
+    Send `ping` to receive `pong`. The socket is closed with code 1008 when
+    the token is invalid or expires; reconnect with a fresh token.
+    """
+    if token is None:
+        authorization = websocket.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            token = authorization[7:]
+    
+    user, expires_in = _authenticate(token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Could not validate credentials")
+        return
+    
+    await realtime.connect(user.id, websocket)
+    print(f"🔌 Realtime: user {user.id} connected ({realtime.connection_count()} sockets)")
+    try:
+        await asyncio.wait_for(_receive(websocket), timeout=max(expires_in, 0))
+    except asyncio.TimeoutError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Token expired")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        realtime.disconnect(user.id, websocket)
@@ -2,35 +2,64 @@
 Request management API endpoints.
 """
 
-from typing import Optional
+from typing import List, Optional, Union
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.idempotency import get_idempotency_key, run_idempotent
+from app.core.http_cache import (
+    ConditionalHeaders,
+    get_conditional_headers,
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    public_cache_control,
+    set_cache_headers,
+)
+from app.core.responses import FastJSONResponse
+from app.core.write_behind import write_behind
+from app.schemas.serializers import serialize_recommendation_list
 from app.api.dependencies import get_current_user
-from app.models.user import User
-from app.models.request import RequestStatus, RequestCategory
+from app.models.user import User, UserRole
+from app.models.request import Request, RequestStatus, RequestCategory
 from app.repositories.request_repository import RequestRepository
 from app.repositories.user_repository import UserRepository
+from app.repositories.matching_repository import MatchingRepository
+from app.repositories.notification_repository import NotificationRepository
 from app.services.request_service import RequestService
+from app.services.matching_service import MatchingService
+from app.services.notification_service import NotificationService
 from app.schemas.request import (
     RequestCreate,
     RequestUpdate,
     RequestStatusUpdate,
     RequestResponse,
     RequestListResponse,
-    RequestSearchFilters
+    RequestSearchFilters,
+    RequestSummaryListResponse,
+    RequestView,
+    RecommendedRequestListResponse
 )
 
 
 router = APIRouter(tags=["Requests"])  # Remove prefix here, it's added in __init__.py
 
 
-def get_request_service(db: Session = Depends(get_db)) -> RequestService:
+def get_matching_service(db: Session = Depends(get_db)) -> MatchingService:
+    """Dependency to get MatchingService instance."""
+    return MatchingService(MatchingRepository(db))
+
+
+def get_request_service(
+    db: Session = Depends(get_db),
+    matching_service: MatchingService = Depends(get_matching_service)
+) -> RequestService:
     """Dependency to get RequestService instance."""
     request_repo = RequestRepository(db)
     user_repo = UserRepository(db)
-    return RequestService(request_repo, user_repo)
+    notification_service = NotificationService(NotificationRepository(db))
+    return RequestService(request_repo, user_repo, matching_service, notification_service)
 
 
 @router.post(
@@ -48,29 +77,42 @@ def get_request_service(db: Session = Depends(get_db)) -> RequestService:
     - location details: address, city, state, pincode
     
     **Optional fields:**
-    - required_skills: Comma-separated skills needed
+    - required_skills: Skills needed (list or comma-separated string)
     - expected_start_date, expected_completion_date: Timeline
-    - images: Comma-separated image URLs
+    - images: Image URLs (list or comma-separated string)
+    
+    **Retries:** Send an `Idempotency-Key` header (unique per new request)
+    to make retries safe: a retry with the same key and body returns the
+    original response (`Idempotent-Replayed: true`) instead of creating a
+    duplicate.
     """,
     responses={
         201: {"description": "Request created successfully"},
         403: {"description": "User is not a society"},
-        401: {"description": "Not authenticated"}
+        401: {"description": "Not authenticated"},
+        409: {"description": "A request with this Idempotency-Key is still being processed"},
+        422: {"description": "Invalid body, or Idempotency-Key reused for a different request"}
     }
 )
 async def create_request(
     request_data: RequestCreate,
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
     current_user: User = Depends(get_current_user),
-    service: RequestService = Depends(get_request_service)
+    service: RequestService = Depends(get_request_service),
+    db: Session = Depends(get_db)
 ) -> RequestResponse:
     """Create a new request (society only)."""
-    request = service.create_request(request_data, current_user.id)
-    return RequestResponse.model_validate(request)
+    return run_idempotent(
+        db, current_user.id, idempotency_key, "POST /requests", request_data,
+        lambda: RequestResponse.model_validate(service.create_request(request_data, current_user.id)),
+        Request,
+        lambda request_id: RequestResponse.model_validate(service.get_request(request_id))
+    )
 
 
 @router.get(
     "/",
-    response_model=RequestListResponse,
+    response_model=Union[RequestSummaryListResponse, RequestListResponse],
     summary="List all requests",
     description="""
     Get a paginated list of requests with optional filters.
@@ -85,69 +127,139 @@ async def create_request(
     - skip: Number of records to skip (default: 0)
     - limit: Number of records to return (default: 20, max: 100)
     
+    **Projection:**
+    - view=summary (default): feed card fields only, without description,
+      location, required_skills and images
+    - view=full: complete request rows
+    
     Public endpoint - no authentication required for browsing.
-    """
+    
+    **Caching:** Supports conditional GET via `ETag`/`If-None-Match` and
+    `Last-Modified`/`If-Modified-Since`; unchanged pages return `304 Not Modified`.
+    """,
+    responses={
+        200: {"description": "Paginated list of requests"},
+        304: {"description": "Not modified since the cached version"}
+    }
 )
-async def list_requests(
+def list_requests(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum records to return"),
     status: Optional[RequestStatus] = Query(None, description="Filter by status"),
     category: Optional[RequestCategory] = Query(None, description="Filter by category"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state"),
+    view: RequestView = Query(RequestView.SUMMARY, description="Summary or full rows"),
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     service: RequestService = Depends(get_request_service)
-) -> RequestListResponse:
+) -> RequestSummaryListResponse:
     """List requests with pagination and filters."""
-    return service.list_requests(
+    # Plain def: a cache miss can wait on another worker's load (see MultiLevelCache.get_or_load)
+    count, last_modified = service.get_list_version(
+        status=status,
+        category=category,
+        city=city,
+        state=state
+    )
+    etag = make_etag("requests", view.value, count, last_modified, skip, limit, status, category, city, state)
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified, public_cache_control())
+    
+    payload = service.list_requests(
         skip=skip,
         limit=limit,
         status=status,
         category=category,
         city=city,
-        state=state
+        state=state,
+        view=view
     )
+    return set_cache_headers(FastJSONResponse(payload), etag, last_modified, public_cache_control())
 
 
 @router.get(
     "/search",
-    response_model=RequestListResponse,
+    response_model=Union[RequestSummaryListResponse, RequestListResponse],
     summary="Search requests",
     description="""
     Advanced search for requests with multiple filters.
     
     **Search:**
     - search_query: Search in title, description, and required skills
+    - skills: Exact skill match; the request must require every listed skill.
+      Repeat the parameter or comma-separate (`skills=plumbing,tiling`).
+      Matching is case-insensitive and index-backed.
     
     **Filters:**
     - category: Work category
     - status: Request status
     - city, state: Location filters
+    - near_pincode, radius_km: Requests within radius_km (default 10, max 100)
+      of a pincode, including neighbouring suburbs with a different city name
     
     **Pagination:**
     - skip, limit: Standard pagination parameters
-    """
+    
+    **Projection:**
+    - view=summary (default) or view=full, as for the list endpoint
+    
+    **Caching:** Supports conditional GET (`ETag`, `Last-Modified`).
+    """,
+    responses={
+        200: {"description": "Search results"},
+        304: {"description": "Not modified since the cached version"},
+        400: {"description": "Unknown pincode"}
+    }
 )
-async def search_requests(
+def search_requests(
     search_query: Optional[str] = Query(None, description="Search in title and description"),
     category: Optional[RequestCategory] = Query(None, description="Filter by category"),
     status: Optional[RequestStatus] = Query(None, description="Filter by status"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state"),
+    skills: Optional[List[str]] = Query(None, description="Required skills (all must match)"),
+    near_pincode: Optional[str] = Query(None, pattern=r"^\d{3} ?\d{3}$", description="Only requests near this pincode"),
+    radius_km: float = Query(10, gt=0, le=100, description="Radius around near_pincode, in km"),
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Records to return"),
+    view: RequestView = Query(RequestView.SUMMARY, description="Summary or full rows"),
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     service: RequestService = Depends(get_request_service)
-) -> RequestListResponse:
+) -> RequestSummaryListResponse:
     """Search requests with advanced filters."""
+    # Plain def: a cache miss can wait on another worker's load (see MultiLevelCache.get_or_load)
     filters = RequestSearchFilters(
         search_query=search_query,
         category=category,
         status=status,
         city=city,
         state=state,
+        skills=skills,
+        near_pincode=near_pincode,
+        radius_km=radius_km,
         skip=skip,
         limit=limit
     )
-    return service.search_requests(filters)
+    near = service.resolve_near(filters.near_pincode, filters.radius_km)
+    count, last_modified = service.get_list_version(
+        status=status,
+        category=category,
+        city=city,
+        state=state,
+        search_query=search_query,
+        skills=filters.skills,
+        near=near
+    )
+    etag = make_etag(
+        "requests-search", view.value, count, last_modified, search_query,
+        skip, limit, status, category, city, state, ",".join(filters.skills or []),
+        filters.near_pincode, radius_km if near else None
+    )
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified, public_cache_control())
+    
+    payload = service.search_requests(filters, view=view, near=near)
+    return set_cache_headers(FastJSONResponse(payload), etag, last_modified, public_cache_control())
 
 
 @router.get(
@@ -174,7 +286,7 @@ async def get_my_requests(
 ) -> RequestListResponse:
     """Get requests posted by current user."""
     print(f"🔐 DEBUG endpoint get_my_requests - Role: {current_user.role}")
-    return service.get_my_requests(current_user.id, skip, limit)
+    return FastJSONResponse(service.get_my_requests(current_user.id, skip, limit))
 
 
 @router.get(
@@ -200,7 +312,82 @@ async def get_assigned_requests(
     service: RequestService = Depends(get_request_service)
 ) -> RequestListResponse:
     """Get requests assigned to current contractor."""
-    return service.get_assigned_requests(current_user.id, skip, limit)
+    return FastJSONResponse(service.get_assigned_requests(current_user.id, skip, limit))
+
+
+@router.get(
+    "/nearby",
+    response_model=Union[RequestSummaryListResponse, RequestListResponse],
+    summary="Get nearby requests",
+    description="""
+    Get open requests within radius_km of the current user's profile pincode.
+    
+    **Filters:**
+    - radius_km: Search radius in km (default 10, max 100)
+    - category: Work category
+    
+    **Projection:**
+    - view=summary (default) or view=full, as for the list endpoint
+    
+    **Authentication required.** The profile must have a known pincode.
+    """,
+    responses={
+        200: {"description": "Nearby open requests"},
+        400: {"description": "Profile has no known pincode"},
+        401: {"description": "Not authenticated"}
+    }
+)
+def get_nearby_requests(
+    radius_km: float = Query(10, gt=0, le=100, description="Search radius in km"),
+    category: Optional[RequestCategory] = Query(None, description="Filter by category"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    view: RequestView = Query(RequestView.SUMMARY, description="Summary or full rows"),
+    current_user: User = Depends(get_current_user),
+    service: RequestService = Depends(get_request_service)
+) -> RequestSummaryListResponse:
+    """Get open requests near the current user."""
+    # Plain def: a cache miss can wait on another worker's load (see MultiLevelCache.get_or_load)
+    return FastJSONResponse(
+        service.get_nearby_requests(current_user, radius_km, category, skip, limit, view)
+    )
+
+
+@router.get(
+    "/recommended",
+    response_model=RecommendedRequestListResponse,
+    summary="Get recommended requests",
+    description="""
+    Get open requests recommended for the current contractor, best match first.
+    
+    Requests are scored against the contractor's profile:
+    - categories of requests they have bid on
+    - skills and categories named in their profile description
+    - their city (adds to the score, but never matches on its own)
+    
+    The feed is precomputed and kept up to date as requests are posted,
+    edited or closed, and as the contractor's profile or bids change.
+    Requests the contractor has already bid on are left out.
+    
+    Returns an empty list for society and admin users.
+    
+    **Authentication required.**
+    """,
+    responses={
+        200: {"description": "Recommended requests"},
+        401: {"description": "Not authenticated"}
+    }
+)
+async def get_recommended_requests(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    matching_service: MatchingService = Depends(get_matching_service)
+) -> RecommendedRequestListResponse:
+    """Get the current contractor's recommendation feed."""
+    if current_user.role != UserRole.CONTRACTOR:
+        return FastJSONResponse(serialize_recommendation_list([], 0, skip, limit))
+    return FastJSONResponse(matching_service.get_recommended(current_user.id, skip, limit))
 
 
 @router.get(
@@ -217,19 +404,31 @@ async def get_assigned_requests(
     - Society and contractor info (if assigned)
     
     Public endpoint - no authentication required.
+    
+    **Caching:** The `ETag` is derived from the request's `updated_at`;
+    revalidation with `If-None-Match` returns `304` without loading the row.
     """,
     responses={
         200: {"description": "Request details"},
+        304: {"description": "Not modified since the cached version"},
         404: {"description": "Request not found"}
     }
 )
-async def get_request(
+def get_request(
     request_id: int,
+    conditional: ConditionalHeaders = Depends(get_conditional_headers),
     service: RequestService = Depends(get_request_service)
 ) -> RequestResponse:
     """Get request by ID."""
-    request = service.get_request(request_id)
-    return RequestResponse.model_validate(request)
+    # Plain def: a cache miss can wait on another worker's load (see MultiLevelCache.get_or_load)
+    last_modified = service.get_request_version(request_id)
+    write_behind.record_view(request_id)  # Buffered; flushed in batches
+    etag = make_etag("request", request_id, last_modified)
+    if is_not_modified(conditional, etag, last_modified):
+        return not_modified_response(etag, last_modified, public_cache_control())
+    
+    payload = service.get_request_detail(request_id)
+    return set_cache_headers(FastJSONResponse(payload), etag, last_modified, public_cache_control())
 
 
 @router.put(
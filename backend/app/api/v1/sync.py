@@ -0,0 +1,65 @@
+"""
+Delta-sync endpoint for the mobile client.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.http_cache import PRIVATE_CACHE_CONTROL
+from app.core.responses import FastJSONResponse
+from app.api.dependencies import get_current_user
+from app.models.user import User
+from app.repositories.sync_repository import SyncRepository
+from app.services.sync_service import SyncService
+from app.schemas.sync import SyncResponse
+
+router = APIRouter(tags=["Sync"])  # Remove prefix here, it's added in __init__.py
+
+
+def get_sync_service(db: Session = Depends(get_db)) -> SyncService:
+    """Dependency to get SyncService instance."""
+    return SyncService(SyncRepository(db))
+
+
+@router.get(
+    "",
+    response_model=SyncResponse,
+    summary="Delta sync",
+    description="""
+    Get requests, bids and profile changes since the last sync.
+    
+    **Usage:**
+    1. On first launch call without `since` and store the rows and `cursor`.
+    2. On every later launch call with `since=<cursor>`, upsert the returned
+       rows, drop the `deleted` IDs and store the new `cursor`.
+    3. While `has_more` is true, call again straight away with the new cursor.
+    4. If `full_resync` is true, discard local data first (the old cursor
+       was older than the 30-day deletion history).
+    
+    **What is synced:**
+    - Societies: their requests and the bids on them
+    - Contractors: the request feed (open requests, plus requests they bid
+      on or are assigned to) and their own bids
+    - Everyone: their own profile, when it changed
+    
+    Rows are returned oldest change first, at most `limit` of each kind per call.
+    
+    **Authentication required.**
+    """,
+    responses={
+        200: {"description": "Changes since the cursor"},
+        400: {"description": "Invalid cursor"},
+        401: {"description": "Not authenticated"}
+    }
+)
+async def sync(
+    since: Optional[str] = Query(None, description="Cursor from the previous sync"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum rows of each kind"),
+    current_user: User = Depends(get_current_user),
+    service: SyncService = Depends(get_sync_service)
+) -> SyncResponse:
+    """Get changes since the cursor."""
+    payload = service.sync(current_user, since, limit)
+    return FastJSONResponse(payload, headers={"Cache-Control": PRIVATE_CACHE_CONTROL})
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.responses import FastJSONResponse
 from app.services.user_service import UserService
 from app.api.dependencies import get_current_active_user, get_current_verified_user
 from app.schemas.user import UserUpdate, UserProfile, UserResponse
@@ -117,8 +118,7 @@ async def list_all_users(
     user_service = UserService(db)
     users = user_service.list_users(skip=skip, limit=limit)
     print(f"👥 DEBUG list_all_users - Retrieved {len(users)} users")
-    print(f"👥 DEBUG list_all_users - Users: {users}")
-    return users
+    return FastJSONResponse(users)
 
 
 @router.put(
@@ -0,0 +1,327 @@
+"""
+Multi-level read cache: an in-process LRU/TTL tier in front of a shared Redis tier.
+
+Entries are addressed by namespace, generation and normalised parameters.
+Write paths bump a namespace's generation counter instead of deleting keys,
+so stale entries are simply no longer addressed and age out on their own.
+Concurrent misses on the same key are coalesced (single-flight) within a
+worker, and across workers through a short-lived Redis lock.
+
+The cache is synchronous and a miss can wait on another worker's load, so
+call it from plain ``def`` handlers (FastAPI runs those in the threadpool),
+never from ``async def`` ones.
+"""
+
+import hashlib
+import json
+import secrets
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is a pinned dependency
+    redis = None
+
+
+# Namespaces
+REQUEST_FEED_NAMESPACE = "requests:feed"
+
+
+def request_namespace(request_id: int) -> str:
+    """Namespace for a single request's cached entries."""
+    return f"request:{request_id}"
+
+
+# Seconds to skip Redis after a connection failure
+REDIS_RETRY_SECONDS = 30.0
+
+# Delete a load lock only if it still holds our token: once it has expired
+# another worker may hold it, and deleting that would let a third one in
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _normalise(value: Any) -> Any:
+    """Normalise a key parameter so equivalent filters share one entry."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        value = value.strip().lower()
+        return value or None
+    if isinstance(value, (list, tuple)):
+        return [_normalise(item) for item in value]
+    return value
+
+
+def make_key_digest(params: Dict[str, Any]) -> str:
+    """
+    Build a stable digest for cache key parameters.
+    
+    None values are dropped and strings are trimmed and lower-cased, so
+    ``{"city": " Mumbai"}`` and ``{"city": "mumbai", "state": None}`` collide.
+    
+    Args:
+        params: Key parameters (filters, pagination, ids)
+    
+    Returns:
+        Hex digest
+    """
+    normalised = {
+        key: _normalise(value)
+        for key, value in params.items()
+    }
+    normalised = {key: value for key, value in normalised.items() if value is not None}
+    raw = json.dumps(normalised, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    """An in-progress load shared by concurrent callers of the same key."""
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class MultiLevelCache:
+    """
+    Two-tier cache with generation-based invalidation and single-flight loads.
+    
+    Values must be JSON-serialisable (e.g. ``model_dump(mode="json")`` output).
+    Redis is optional: when it is disabled or unreachable the cache degrades
+    to the in-process tier with local generation counters.
+    """
+    
+    def __init__(
+        self,
+        enabled: bool = True,
+        local_maxsize: int = 2048,
+        local_ttl_seconds: float = 10.0,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 60,
+        generation_ttl_seconds: float = 1.0,
+        lock_timeout_ms: int = 2000
+    ):
+        """Initialize cache tiers."""
+        self.enabled = enabled
+        self.redis_url = redis_url
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.generation_ttl_seconds = generation_ttl_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+        
+        self._local = TTLCache(maxsize=local_maxsize, ttl=local_ttl_seconds)
+        self._local_lock = threading.Lock()
+        
+        # namespace -> (generation, fetched_at)
+        self._generations: Dict[str, tuple[int, float]] = {}
+        
+        self._inflight: Dict[str, _Flight] = {}
+        self._inflight_lock = threading.Lock()
+        
+        self._redis = None
+        self._redis_down_until = 0.0
+    
+    # ------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------
+    
+    def _get_redis(self):
+        """Get the Redis client, or None if Redis is disabled or marked down."""
+        if not self.redis_url or redis is None:
+            return None
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                self.redis_url,
+                socket_timeout=0.25,
+                socket_connect_timeout=0.25
+            )
+        return self._redis
+    
+    def _redis_failed(self, error: Exception) -> None:
+        """Mark Redis as down for a while after an error."""
+        print(f"⚠️ Cache: Redis unavailable, using in-process tier only ({error})")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+    
+    # ------------------------------------------------------------------
+    # Generations
+    # ------------------------------------------------------------------
+    
+    def generation(self, namespace: str) -> int:
+        """
+        Get the current generation of a namespace.
+        
+        The value read from Redis is reused locally for ``generation_ttl_seconds``,
+        which bounds how long another worker's write can go unnoticed.
+        """
+        cached = self._generations.get(namespace)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.generation_ttl_seconds:
+            return cached[0]
+        
+        client = self._get_redis()
+        if client is None:
+            return cached[0] if cached else 0
+        
+        try:
+            value = client.get(f"cache:gen:{namespace}")
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return cached[0] if cached else 0
+        
+        generation = int(value) if value else 0
+        self._generations[namespace] = (generation, now)
+        return generation
+    
+    def bump(self, *namespaces: str) -> None:
+        """
+        Invalidate namespaces by advancing their generation counters.
+        
+        Args:
+            namespaces: Namespaces touched by a write
+        """
+        if not self.enabled:
+            return
+        
+        client = self._get_redis()
+        now = time.monotonic()
+        for namespace in namespaces:
+            if client is not None:
+                try:
+                    generation = client.incr(f"cache:gen:{namespace}")
+                    self._generations[namespace] = (int(generation), now)
+                    continue
+                except redis.RedisError as e:
+                    self._redis_failed(e)
+                    client = None
+            
+            # Local-only bump: generations may now diverge from Redis, so drop
+            # the in-process tier rather than risk addressing a stale entry.
+            cached = self._generations.get(namespace)
+            self._generations[namespace] = ((cached[0] if cached else 0) + 1, now)
+            with self._local_lock:
+                self._local.clear()
+    
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    
+    def get_or_load(
+        self,
+        namespace: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Any]
+    ) -> Any:
+        """
+        Get a value from the cache, loading it once on a miss.
+        
+        Args:
+            namespace: Invalidation namespace of the entry
+            params: Parameters identifying the entry (normalised into the key)
+            loader: Callable producing a JSON-serialisable value on a miss
+        
+        Returns:
+            Cached or freshly loaded value
+        """
+        if not self.enabled:
+            return loader()
+        
+        key = f"cache:{namespace}:{self.generation(namespace)}:{make_key_digest(params)}"
+        
+        with self._local_lock:
+            value = self._local.get(key)
+        if value is not None:
+            return value
+        
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+        
+        if not is_leader:
+            if flight.event.wait(self.lock_timeout_ms / 1000):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            return loader()
+        
+        try:
+            flight.value = self._load_shared(key, loader)
+            with self._local_lock:
+                self._local[key] = flight.value
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.event.set()
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _load_shared(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Read through the Redis tier, coalescing misses across workers."""
+        client = self._get_redis()
+        if client is None:
+            return loader()
+        
+        try:
+            raw = client.get(key)
+            if raw is not None:
+                return json.loads(raw)
+            
+            # Only one worker loads; the others poll for its result
+            lock_key = f"{key}:lock"
+            token = secrets.token_hex(16)
+            is_owner = bool(client.set(lock_key, token, nx=True, px=self.lock_timeout_ms))
+            if not is_owner:
+                deadline = time.monotonic() + self.lock_timeout_ms / 1000
+                while time.monotonic() < deadline:
+                    time.sleep(0.01)
+                    raw = client.get(key)
+                    if raw is not None:
+                        return json.loads(raw)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return loader()
+        
+        value = loader()
+        try:
+            client.set(key, json.dumps(value, separators=(",", ":")), ex=self.redis_ttl_seconds)
+            if is_owner:
+                client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+        return value
+    
+    def clear_local(self) -> None:
+        """Drop the in-process tier (e.g. in tests or after a failover)."""
+        with self._local_lock:
+            self._local.clear()
+        self._generations.clear()
+
+
+# Global cache instance
+cache = MultiLevelCache(
+    enabled=settings.cache_enabled,
+    local_maxsize=settings.cache_local_maxsize,
+    local_ttl_seconds=settings.cache_local_ttl_seconds,
+    redis_url=settings.redis_url if settings.cache_redis_enabled else None,
+    redis_ttl_seconds=settings.cache_redis_ttl_seconds,
+    generation_ttl_seconds=settings.cache_generation_ttl_seconds,
+    lock_timeout_ms=settings.cache_lock_timeout_ms,
+)
@@ -2,9 +2,7 @@
 Database configuration and session management.
 """
 
-from typing import AsyncGenerator
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -18,8 +16,10 @@ sync_engine = create_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    # Sized per worker from DB_MAX_CONNECTIONS and WEB_CONCURRENCY
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
 )
 
 # Create session factory for synchronous operations
@@ -0,0 +1,212 @@
+"""
+Offline geo lookups for radius search.
+
+Pincodes are resolved to coordinates from the dataset bundled at
+app/data/pincodes.csv (refresh it with scripts/import_pincodes.py). Points
+are indexed by geohash: a radius query scans the 3x3 block of geohash cells
+around the centre, using a prefix match on the indexed column, and then
+applies an exact distance check to what is left.
+"""
+
+import csv
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+# Bundled pincode -> (latitude, longitude) dataset
+PINCODE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "pincodes.csv"
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Stored geohash length (~150 m cells); radius queries use a shorter prefix
+GEOHASH_PRECISION = 7
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+class GeoPoint(NamedTuple):
+    """Latitude/longitude in decimal degrees."""
+    latitude: float
+    longitude: float
+
+
+class GeoRadius(NamedTuple):
+    """Circle for "within N km of" queries."""
+    latitude: float
+    longitude: float
+    radius_km: float
+
+
+def normalize_pincode(pincode: Optional[str]) -> Optional[str]:
+    """
+    Normalise a pincode to its six digits.
+    
+    Args:
+        pincode: Raw pincode, e.g. "400 001"
+    
+    Returns:
+        Six-digit pincode, or None if it is not a valid Indian pincode
+    """
+    digits = "".join((pincode or "").split())
+    if len(digits) == 6 and digits.isdigit():
+        return digits
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_pincodes() -> Tuple[Dict[str, GeoPoint], Dict[str, GeoPoint]]:
+    """
+    Load the bundled dataset, once per process.
+    
+    Returns:
+        Tuple of (pincode -> point, 3-digit sorting district -> centroid)
+    """
+    pincodes: Dict[str, GeoPoint] = {}
+    with open(PINCODE_DATA_PATH, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            pincodes[row["pincode"]] = GeoPoint(float(row["latitude"]), float(row["longitude"]))
+    
+    # Centroid of each sorting district (first three digits), used for
+    # pincodes missing from the dataset
+    sums: Dict[str, List[float]] = {}
+    for pincode, point in pincodes.items():
+        total = sums.setdefault(pincode[:3], [0.0, 0.0, 0])
+        total[0] += point.latitude
+        total[1] += point.longitude
+        total[2] += 1
+    districts = {
+        prefix: GeoPoint(lat / count, lng / count)
+        for prefix, (lat, lng, count) in sums.items()
+    }
+    
+    return pincodes, districts
+
+
+def lookup_pincode(pincode: Optional[str]) -> Optional[GeoPoint]:
+    """
+    Resolve a pincode to coordinates.
+    
+    Pincodes missing from the dataset fall back to the centroid of their
+    sorting district.
+    
+    Args:
+        pincode: Pincode to resolve
+    
+    Returns:
+        GeoPoint, or None if the pincode is invalid or its district unknown
+    """
+    pincode = normalize_pincode(pincode)
+    if not pincode:
+        return None
+    
+    pincodes, districts = _load_pincodes()
+    return pincodes.get(pincode) or districts.get(pincode[:3])
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Encode a point as a geohash.
+    
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        precision: Geohash length
+    
+    Returns:
+        Geohash string
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # Bits alternate longitude, latitude, starting with longitude
+    
+    while len(chars) < precision:
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            bounds[0] = mid
+        else:
+            bits <<= 1
+            bounds[1] = mid
+        even = not even
+        
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """Geohash cell (height, width) in degrees at the given precision."""
+    lat_bits = 5 * precision // 2
+    lng_bits = 5 * precision - lat_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def geohash_cells(area: GeoRadius) -> List[str]:
+    """
+    Get the geohash prefixes covering a circle.
+    
+    Picks the longest prefix whose cells are at least the radius in both
+    directions, so the centre cell and its eight neighbours always contain
+    the whole circle.
+    
+    Args:
+        area: Circle to cover
+    
+    Returns:
+        Up to nine geohash prefixes
+    """
+    # Longitude degrees shrink towards the poles; size for the widest latitude
+    max_latitude = min(abs(area.latitude) + area.radius_km / KM_PER_DEGREE, 89.0)
+    lng_km_per_degree = KM_PER_DEGREE * math.cos(math.radians(max_latitude))
+    
+    precision = 1
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(candidate)
+        if height * KM_PER_DEGREE >= area.radius_km and width * lng_km_per_degree >= area.radius_km:
+            precision = candidate
+            break
+    
+    height, width = _cell_size(precision)
+    cells = []
+    for d_lat in (-height, 0.0, height):
+        latitude = area.latitude + d_lat
+        if not -90.0 <= latitude <= 90.0:
+            continue
+        for d_lng in (-width, 0.0, width):
+            longitude = (area.longitude + d_lng + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(latitude, longitude, precision)
+            if cell not in cells:
+                cells.append(cell)
+    
+    return cells
+
+
+def locate_pincode(pincode: Optional[str]) -> Dict[str, Optional[object]]:
+    """
+    Get the location columns to store for a pincode.
+    
+    Args:
+        pincode: Pincode being saved
+    
+    Returns:
+        Dict with latitude, longitude and geohash (all None if unresolved)
+    """
+    point = lookup_pincode(pincode)
+    if point is None:
+        return {"latitude": None, "longitude": None, "geohash": None}
+    return {
+        "latitude": point.latitude,
+        "longitude": point.longitude,
+        "geohash": encode_geohash(point.latitude, point.longitude),
+    }
@@ -0,0 +1,139 @@
+"""
+HTTP caching helpers for conditional GET support.
+
+ETags are derived from ``updated_at`` timestamps (or a collection fingerprint
+of row count and latest ``updated_at``), so a revalidation request can be
+answered with ``304 Not Modified`` before the full rows are loaded.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Header, Response
+
+from app.core.config import settings
+
+
+@dataclass
+class ConditionalHeaders:
+    """Validators sent by the client on a conditional GET."""
+    if_none_match: Optional[str] = None
+    if_modified_since: Optional[str] = None
+
+
+def get_conditional_headers(
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+    if_modified_since: Optional[str] = Header(None, include_in_schema=False),
+) -> ConditionalHeaders:
+    """Dependency collecting conditional request headers."""
+    return ConditionalHeaders(
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since
+    )
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the given version parts.
+    
+    Args:
+        parts: Values identifying the representation (timestamps, counts, filters)
+    
+    Returns:
+        Weak ETag string, e.g. W/"3f2a..."
+    """
+    raw = "|".join(
+        part.isoformat() if isinstance(part, datetime) else ("" if part is None else str(part))
+        for part in parts
+    )
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive UTC datetime as an HTTP date."""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak prefix so tags are compared weakly."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(
+    conditional: ConditionalHeaders,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Check whether the client's cached representation is still current.
+    
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    
+    Args:
+        conditional: Conditional headers sent by the client
+        etag: Current ETag of the resource
+        last_modified: Current modification time of the resource
+    
+    Returns:
+        True if a 304 response can be sent
+    """
+    if conditional.if_none_match:
+        tags = [_opaque_tag(tag) for tag in conditional.if_none_match.split(",")]
+        return "*" in tags or _opaque_tag(etag) in tags
+    
+    if conditional.if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(conditional.if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        return last_modified.replace(microsecond=0) <= since
+    
+    return False
+
+
+def public_cache_control() -> str:
+    """Cache-Control value for public browse endpoints."""
+    return f"public, max-age={settings.public_cache_max_age}"
+
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PRIVATE_CACHE_CONTROL
+) -> Response:
+    """
+    Attach validator and cache headers to a response.
+    
+    Args:
+        response: Response to decorate
+        etag: ETag of the representation
+        last_modified: Modification time of the representation
+        cache_control: Cache-Control header value
+    
+    Returns:
+        The same response
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PRIVATE_CACHE_CONTROL
+) -> Response:
+    """Build an empty 304 Not Modified response with cache headers."""
+    return set_cache_headers(Response(status_code=304), etag, last_modified, cache_control)
@@ -0,0 +1,188 @@
+"""
+Idempotency-Key support for POST endpoints that create resources.
+
+Mobile clients retry POSTs after timeouts, and without a key each retry runs
+validation again and can create a duplicate. With an ``Idempotency-Key``
+header the first request claims the key in the idempotency_keys table and
+stores its response; a retry with the same key and body gets that response
+back (with ``Idempotent-Replayed: true``) from a single primary-key lookup,
+without the handler running again.
+
+Keys are scoped to the authenticated user. Reusing a key for a different
+request is rejected with 422, and a retry that arrives while the first
+request is still running gets 409. Only successful responses are stored: if
+the handler raises, the claim is released so the client can retry.
+
+The response is stored in its own commit after the handler's, so the key is
+also linked to the created request or bid (resource_id) in the handler's
+own transaction, from an after_flush hook. A retry for a key that has its
+resource but no response (the first request died between the two commits)
+replays the resource as it is now instead of running the handler again. A
+claim older than IDEMPOTENCY_LOCK_SECONDS without a resource is taken over
+by the retry; if the first request was only slow, its commit then fails
+with 409 (its claim is no longer the key's), so at most one of them creates
+the resource.
+
+A key is kept for IDEMPOTENCY_TTL_HOURS; after that it is treated as unused
+(and scripts/prune_idempotency_keys.py deletes it).
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Union
+
+from fastapi import Header, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.repositories.idempotency_repository import IdempotencyKeyRepository
+
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def get_idempotency_key(
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Unique value per logical request; retries with the same key return the original response",
+    ),
+) -> Optional[str]:
+    """Dependency reading the optional Idempotency-Key header."""
+    return idempotency_key or None
+
+
+def request_fingerprint(scope: str, payload: BaseModel) -> str:
+    """
+    Hash an endpoint and its validated request body.
+    
+    Args:
+        scope: Endpoint identifier, e.g. "POST /requests"
+        payload: Parsed request body
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    body = json.dumps(payload.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{scope}\n{body}".encode("utf-8")).hexdigest()
+
+
+def run_idempotent(
+    db: Session,
+    user_id: int,
+    key: Optional[str],
+    scope: str,
+    payload: BaseModel,
+    handler: Callable[[], BaseModel],
+    resource_model: type,
+    replay: Callable[[int], BaseModel],
+    status_code: int = status.HTTP_201_CREATED,
+) -> Union[BaseModel, Response]:
+    """
+    Run a handler at most once per idempotency key.
+    
+    Args:
+        db: Database session
+        user_id: Authenticated user (keys are per user)
+        key: Idempotency-Key header value, or None to just run the handler
+        scope: Endpoint identifier, part of the fingerprint
+        payload: Parsed request body, part of the fingerprint
+        handler: Runs the business logic and returns the response model
+        resource_model: Model class of the resource the handler creates
+        replay: Builds the response model for an already created resource ID
+        status_code: Status of a successful response
+    
+    Returns:
+        The handler's result when there is no key, otherwise a JSON response
+        (the stored one for a retry)
+    
+    Raises:
+        HTTPException: 422 if the key was used for a different request,
+            409 if the first request with the key is still running, or if
+            a retry took over this request's claim before it committed
+    """
+    if key is None:
+        return handler()
+    
+    repo = IdempotencyKeyRepository(db)
+    fingerprint = request_fingerprint(scope, payload)
+    now = datetime.utcnow()
+    
+    # A retry is answered from this one lookup; a first request then claims the key
+    record = repo.get(user_id, key)
+    if record is not None and record.expires_at < now:
+        repo.expire(record, now)
+        record = None
+    expires_at = now + timedelta(hours=settings.idempotency_ttl_hours)
+    claimed = record is None and repo.claim(user_id, key, fingerprint, now, expires_at)
+    if not claimed:
+        # Stored response, a different request, or one still running
+        record = record or repo.get(user_id, key)
+        if record is None:
+            # Released by a failed first request in the meantime
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still being processed"
+            )
+        if record.fingerprint != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request"
+            )
+        if record.status_code is not None:
+            return Response(
+                content=record.response_body,
+                status_code=record.status_code,
+                media_type="application/json",
+                headers={REPLAYED_HEADER: "true"}
+            )
+        if record.resource_id is not None:
+            # Created, but the first request died before storing its response
+            response = FastJSONResponse(
+                content=jsonable_encoder(replay(record.resource_id)),
+                status_code=status_code,
+                headers={REPLAYED_HEADER: "true"}
+            )
+            repo.complete(user_id, key, status_code, response.body.decode("utf-8"))
+            return response
+        stale_before = now - timedelta(seconds=settings.idempotency_lock_seconds)
+        if not repo.take_over(user_id, key, stale_before, now):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still being processed"
+            )
+    
+    def link_resource(session: Session, flush_context) -> None:
+        """Link the key to the resource in the flush that inserts it."""
+        if linked:
+            return
+        for instance in session.new:
+            if isinstance(instance, resource_model):
+                if not repo.record_resource(user_id, key, now, instance.id):
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="A retry with this Idempotency-Key took over the request"
+                    )
+                linked.append(instance.id)
+                return
+    
+    linked = []
+    event.listen(db, "after_flush", link_resource)
+    try:
+        result = handler()
+    except Exception:
+        db.rollback()
+        repo.release(user_id, key, now)
+        raise
+    finally:
+        event.remove(db, "after_flush", link_resource)
+    
+    response = FastJSONResponse(content=jsonable_encoder(result), status_code=status_code)
+    repo.complete(user_id, key, status_code, response.body.decode("utf-8"))
+    return response
@@ -0,0 +1,236 @@
+"""
+Password hashing off the request path.
+
+bcrypt is deliberately slow (hundreds of milliseconds of CPU per call), so
+hashes and checks run in a process pool sized to the machine's cores instead
+of on an API worker. At most PASSWORD_HASH_MAX_PENDING calls may be queued or
+running per API worker; callers beyond that wait up to
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS for a slot and then get PasswordHasherBusy,
+so a burst of password logins is shed instead of stalling the worker.
+"""
+
+import os
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password operations are already queued."""
+
+
+@lru_cache(maxsize=4)
+def get_crypt_context(rounds: int) -> CryptContext:
+    """
+    Get the passlib context for a bcrypt cost.
+    
+    Hashes made with another cost report needs_update, so they are
+    re-hashed at the current cost on the next successful login.
+    """
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def _hash_in_worker(password: str, rounds: int) -> Tuple[str, float]:
+    """Hash a password (runs in a pool process); returns (hash, start time)."""
+    started = time.time()
+    return get_crypt_context(rounds).hash(password), started
+
+
+def _warm_worker(rounds: int) -> int:
+    """Build the bcrypt context in a pool process; returns the process ID."""
+    get_crypt_context(rounds)
+    return os.getpid()
+
+
+def _verify_in_worker(password: str, password_hash: str, rounds: int) -> Tuple[bool, Optional[str], float]:
+    """
+    Check a password (runs in a pool process).
+    
+    Returns:
+        Tuple of (matches, replacement hash if the cost changed, start time)
+    """
+    started = time.time()
+    try:
+        matches, new_hash = get_crypt_context(rounds).verify_and_update(password, password_hash)
+    except ValueError:
+        # Not a recognised hash
+        matches, new_hash = False, None
+    return matches, new_hash, started
+
+
+class PasswordHasher:
+    """Process-pool bcrypt with admission control and queue-time metrics."""
+    
+    def __init__(
+        self,
+        rounds: int = 12,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        queue_timeout_seconds: float = 1.0
+    ):
+        """
+        Initialize the hasher (the pool starts on first use).
+        
+        Args:
+            rounds: bcrypt cost factor
+            workers: Pool processes (default: CPU count)
+            max_pending: Calls queued or running at once (default: 2 per process)
+            queue_timeout_seconds: How long a caller waits for a slot
+        """
+        self.rounds = rounds
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.queue_timeout_seconds = queue_timeout_seconds
+        
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_seconds_total = 0.0
+        self._queue_seconds_max = 0.0
+        self._run_seconds_total = 0.0
+    
+    # ------------------------------------------------------------------
+    # Pool lifecycle
+    # ------------------------------------------------------------------
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the pool if needed."""
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn, not fork: the API process has threads and open sockets
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+    
+    def warm_up(self) -> int:
+        """
+        Start every pool process now instead of on the first logins.
+        
+        Returns:
+            Number of processes that answered
+        """
+        pool = self._get_pool()
+        # Submitted together, so each call finds no idle process and spawns one
+        futures = [pool.submit(_warm_worker, self.rounds) for _ in range(self.workers)]
+        return len({future.result() for future in futures})
+    
+    def shutdown(self) -> None:
+        """Stop the pool, cancelling queued calls."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+    
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+    
+    def _run(self, fn, *args) -> Any:
+        """
+        Run a function in the pool, waiting for an admission slot first.
+        
+        Raises:
+            PasswordHasherBusy: If no slot frees up within the queue timeout
+        """
+        submitted = time.time()
+        if not self._slots.acquire(timeout=self.queue_timeout_seconds):
+            with self._stats_lock:
+                self._rejected += 1
+            raise PasswordHasherBusy("Too many password checks in progress, please retry")
+        
+        with self._stats_lock:
+            self._pending += 1
+        try:
+            try:
+                result = self._get_pool().submit(fn, *args).result()
+            except BrokenProcessPool:
+                # A pool process died (e.g. OOM-killed); start a new pool once
+                with self._pool_lock:
+                    self._pool = None
+                result = self._get_pool().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+            with self._stats_lock:
+                self._pending -= 1
+        
+        finished = time.time()
+        started = result[-1]
+        with self._stats_lock:
+            queued = max(started - submitted, 0.0)
+            self._completed += 1
+            self._queue_seconds_total += queued
+            self._queue_seconds_max = max(self._queue_seconds_max, queued)
+            self._run_seconds_total += finished - started
+        return result[:-1]
+    
+    def hash(self, password: str) -> str:
+        """
+        Hash a password at the configured cost.
+        
+        Args:
+            password: Plain text password
+        
+        Returns:
+            bcrypt hash
+        
+        Raises:
+            PasswordHasherBusy: If the hasher is saturated
+        """
+        (password_hash,) = self._run(_hash_in_worker, password, self.rounds)
+        return password_hash
+    
+    def verify(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password, re-hashing it if the stored cost is outdated.
+        
+        Args:
+            password: Plain text password
+            password_hash: Stored hash
+        
+        Returns:
+            Tuple of (matches, new hash to store or None)
+        
+        Raises:
+            PasswordHasherBusy: If the hasher is saturated
+        """
+        matches, new_hash = self._run(_verify_in_worker, password, password_hash, self.rounds)
+        return matches, new_hash
+    
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring (per API worker)."""
+        with self._stats_lock:
+            completed = self._completed or 1
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_queue_ms": round(self._queue_seconds_total / completed * 1000, 1),
+                "max_queue_ms": round(self._queue_seconds_max * 1000, 1),
+                "avg_run_ms": round(self._run_seconds_total / completed * 1000, 1),
+            }
+
+
+# Global password hasher (by default the CPUs are shared between the API workers)
+password_hasher = PasswordHasher(
+    rounds=settings.bcrypt_rounds,
+    workers=settings.password_hash_workers or max(1, (os.cpu_count() or 1) // settings.web_concurrency),
+    max_pending=settings.password_hash_max_pending,
+    queue_timeout_seconds=settings.password_hash_queue_timeout_seconds,
+)
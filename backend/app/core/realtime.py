@@ -0,0 +1,206 @@
+"""
+Real-time event push over WebSockets.
+
+Services publish events addressed to user IDs. With Redis enabled, events go
+through a pub/sub channel that every worker subscribes to, so a user is
+reached whichever worker holds their socket. Without Redis (or while it is
+unreachable) events are delivered to sockets held by the publishing worker
+only.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Set
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+
+try:
+    import redis
+    import redis.asyncio as redis_async
+except ImportError:  # pragma: no cover - redis is a pinned dependency
+    redis = None
+    redis_async = None
+
+
+# Pub/sub channel shared by all workers
+EVENTS_CHANNEL = "contractorconnect:events"
+
+# Seconds before resubscribing after a Redis failure
+REDIS_RETRY_SECONDS = 30.0
+
+# Seconds a single socket send may take before the socket is dropped
+SEND_TIMEOUT_SECONDS = 5.0
+
+
+class EventType(str, Enum):
+    """Events pushed to clients."""
+    BID_SUBMITTED = "bid.submitted"
+    BID_ACCEPTED = "bid.accepted"
+    REQUEST_STATUS_CHANGED = "request.status_changed"
+
+
+class ConnectionManager:
+    """
+    Per-user WebSocket registry with cross-worker fan-out.
+    
+    ``publish`` is synchronous so services can call it directly; delivery
+    itself always runs on the event loop the manager was started on.
+    """
+    
+    def __init__(self, redis_url: Optional[str] = None):
+        """Initialize the registry."""
+        self.redis_url = redis_url
+        
+        # user_id -> open sockets (a user may be connected from several devices)
+        self._connections: Dict[int, Set[WebSocket]] = {}
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._publisher = None
+    
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    
+    async def start(self) -> None:
+        """Bind to the running loop and subscribe to the events channel."""
+        self._loop = asyncio.get_running_loop()
+        if self.redis_url and redis_async is not None:
+            self._listener = asyncio.create_task(self._listen())
+    
+    async def stop(self) -> None:
+        """Stop the subscriber and close every socket."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._subscribed = False
+        
+        for sockets in list(self._connections.values()):
+            for websocket in list(sockets):
+                try:
+                    await websocket.close()
+                except Exception:
+                    pass
+        self._connections.clear()
+    
+    async def _listen(self) -> None:
+        """Deliver events from the Redis channel, resubscribing after failures."""
+        while True:
+            client = redis_async.Redis.from_url(self.redis_url)
+            try:
+                pubsub = client.pubsub()
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                self._subscribed = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        await self._deliver(json.loads(message["data"]))
+            except (redis.RedisError, OSError) as e:
+                print(f"⚠️ Realtime: Redis unavailable, delivering events locally ({e})")
+            finally:
+                self._subscribed = False
+                await client.aclose()
+            await asyncio.sleep(REDIS_RETRY_SECONDS)
+    
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    
+    async def connect(self, user_id: int, websocket: WebSocket) -> None:
+        """Accept a socket and register it for the user's events."""
+        await websocket.accept()
+        self._connections.setdefault(user_id, set()).add(websocket)
+    
+    def disconnect(self, user_id: int, websocket: WebSocket) -> None:
+        """Unregister a socket."""
+        sockets = self._connections.get(user_id)
+        if sockets:
+            sockets.discard(websocket)
+            if not sockets:
+                del self._connections[user_id]
+    
+    def connection_count(self) -> int:
+        """Number of open sockets on this worker."""
+        return sum(len(sockets) for sockets in self._connections.values())
+    
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    
+    def publish(self, user_ids: Iterable[Optional[int]], event: EventType, data: Dict[str, Any]) -> None:
+        """
+        Push an event to every socket of the given users.
+        
+        Fire-and-forget: failures are logged, never raised to the caller.
+        
+        Args:
+            user_ids: Recipients (None entries are ignored)
+            event: Event type
+            data: JSON-serialisable event payload
+        """
+        recipients = sorted({user_id for user_id in user_ids if user_id is not None})
+        if not recipients:
+            return
+        
+        message = {
+            "user_ids": recipients,
+            "event": {
+                "type": event.value,
+                "data": data,
+                "sent_at": datetime.utcnow().isoformat(),
+            },
+        }
+        
+        if self._subscribed:
+            try:
+                if self._publisher is None:
+                    self._publisher = redis.Redis.from_url(
+                        self.redis_url,
+                        socket_timeout=0.25,
+                        socket_connect_timeout=0.25
+                    )
+                self._publisher.publish(EVENTS_CHANNEL, json.dumps(message, default=str))
+                return
+            except redis.RedisError as e:
+                print(f"⚠️ Realtime: publish failed, delivering locally ({e})")
+        
+        if self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._deliver(message), self._loop)
+    
+    async def _deliver(self, message: Dict[str, Any]) -> None:
+        """Send an event to this worker's sockets for its recipients."""
+        targets = [
+            (user_id, websocket)
+            for user_id in message["user_ids"]
+            for websocket in list(self._connections.get(user_id, ()))
+        ]
+        if not targets:
+            return
+        
+        raw = json.dumps(message["event"], default=str)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(raw), SEND_TIMEOUT_SECONDS)
+                for _, websocket in targets
+            ),
+            return_exceptions=True
+        )
+        
+        # Drop sockets that failed or stalled
+        for (user_id, websocket), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self.disconnect(user_id, websocket)
+
+
+# Global connection manager
+realtime = ConnectionManager(
+    redis_url=settings.redis_url if settings.realtime_redis_enabled else None,
+)
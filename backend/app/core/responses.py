@@ -0,0 +1,28 @@
+"""
+Response classes for fast JSON rendering.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed.
+    
+    Returning this class directly from an endpoint also skips FastAPI's
+    response_model re-validation, so it should only wrap payloads that are
+    already shaped like the declared response model.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
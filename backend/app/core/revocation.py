@@ -0,0 +1,196 @@
+"""
+Token revocation with an in-process Bloom filter in front of the database.
+
+Revoked token IDs (jti claims) are stored in the revoked_tokens table. Each
+worker keeps a Bloom filter of them, refreshed from the table every
+TOKEN_REVOCATION_SYNC_SECONDS, so checking a token that was never revoked
+(almost every request) touches no database. Only a filter hit is confirmed
+with a primary-key lookup. A revocation made on this worker applies at once;
+other workers pick it up on their next sync.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+# False-positive rate of the filter; each false positive costs one lookup
+BLOOM_ERROR_RATE = 0.001
+
+# The filter is rebuilt from scratch this often, dropping expired tokens
+REBUILD_SECONDS = 3600
+
+# Incremental syncs re-read this much history, for rows committed late
+SYNC_OVERLAP_SECONDS = 5
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+    
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        Size the filter for an expected number of items.
+        
+        Args:
+            capacity: Items the filter is sized for
+            error_rate: False-positive rate at that many items
+        """
+        self.capacity = max(capacity, 1)
+        self.size = max(64, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item: str) -> List[int]:
+        """Bit positions for an item (double hashing over one digest)."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        """False means definitely absent; True means possibly present."""
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationList:
+    """Per-worker view of revoked token IDs."""
+    
+    def __init__(self, capacity: int = 100000, sync_seconds: float = 5.0):
+        """
+        Initialize an empty filter; it is loaded on first use.
+        
+        Args:
+            capacity: Revoked, unexpired tokens the filter is sized for
+            sync_seconds: How often to pull new revocations from the database
+        """
+        self.capacity = capacity
+        self.sync_seconds = sync_seconds
+        
+        self._filter = BloomFilter(capacity)
+        self._synced_until: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._next_rebuild = 0.0
+        self._sync_lock = threading.Lock()
+        
+        # Revoked here since the last sync; re-added if the filter is rebuilt
+        self._local: List[str] = []
+        self._local_lock = threading.Lock()
+    
+    def _sync(self) -> None:
+        """Pull revocations from the database (rebuilding the filter when due)."""
+        now = datetime.utcnow()
+        rebuild = self._synced_until is None or time.monotonic() >= self._next_rebuild
+        since = None if rebuild else self._synced_until - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+        
+        db = SessionLocal()
+        try:
+            rows = RevokedTokenRepository(db).get_revoked_since(since, now)
+        finally:
+            db.close()
+        
+        with self._local_lock:
+            if rebuild:
+                bloom = BloomFilter(max(self.capacity, 2 * len(rows)))
+                for jti in self._local:
+                    bloom.add(jti)
+                self._next_rebuild = time.monotonic() + REBUILD_SECONDS
+            else:
+                bloom = self._filter
+            for jti, _ in rows:
+                bloom.add(jti)
+            self._filter = bloom
+            self._local = []
+        
+        if self._filter.count > self._filter.capacity:
+            # Too full for its error rate; resize on the next sync
+            self._next_rebuild = 0.0
+        self._synced_until = now
+    
+    def _maybe_sync(self) -> None:
+        """Sync if the interval has passed (one thread at a time, never waiting)."""
+        if time.monotonic() < self._next_sync or not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            self._sync()
+        except Exception as e:
+            print(f"⚠️ Token revocation sync failed, keeping the current filter: {str(e)}")
+        finally:
+            self._next_sync = time.monotonic() + self.sync_seconds
+            self._sync_lock.release()
+    
+    def refresh(self) -> None:
+        """
+        Load the filter now instead of on the first authenticated request.
+        
+        Raises:
+            Exception: If the database cannot be read
+        """
+        with self._sync_lock:
+            self._sync()
+            self._next_sync = time.monotonic() + self.sync_seconds
+    
+    def is_revoked(self, jti: Optional[str], db: Session) -> bool:
+        """
+        Check whether a token has been revoked.
+        
+        Args:
+            jti: Token ID claim (tokens without one cannot be revoked)
+            db: Database session, used only to confirm a filter hit
+        
+        Returns:
+            True if revoked
+        """
+        if not jti:
+            return False
+        self._maybe_sync()
+        if jti not in self._filter:
+            return False
+        return RevokedTokenRepository(db).is_revoked(jti)
+    
+    def revoke(self, payload: Dict[str, Any], db: Session) -> bool:
+        """
+        Revoke a decoded token until it expires.
+        
+        Args:
+            payload: Verified token claims
+            db: Database session
+        
+        Returns:
+            False if the token has no jti and cannot be revoked
+        """
+        jti = payload.get("jti")
+        if not jti:
+            return False
+        
+        RevokedTokenRepository(db).revoke(
+            jti,
+            expires_at=datetime.utcfromtimestamp(payload["exp"]),
+            user_id=payload.get("user_id")
+        )
+        with self._local_lock:
+            self._filter.add(jti)
+            self._local.append(jti)
+        return True
+
+
+# Global revocation list
+revocations = RevocationList(
+    capacity=settings.token_revocation_bloom_capacity,
+    sync_seconds=settings.token_revocation_sync_seconds,
+)
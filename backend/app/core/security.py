@@ -3,23 +3,24 @@ Security utilities for authentication and authorization.
 Includes JWT token handling, password hashing, and permission checking.
 """
 
+import hashlib
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.passwords import get_crypt_context
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (inline; the API hashes via app.core.passwords)
+pwd_context = get_crypt_context(settings.bcrypt_rounds)
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -69,7 +70,8 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
-    to_encode.update({"exp": expire, "type": "access"})
+    # jti identifies the token for revocation (logout)
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
     
     encoded_jwt = jwt.encode(
         to_encode,
@@ -93,7 +95,7 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
     
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
     
     encoded_jwt = jwt.encode(
         to_encode,
@@ -104,25 +106,68 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+# Longest a verified token without an exp claim stays cached, in seconds
+TOKEN_CACHE_MAX_SECONDS = 300
+
+
+def _token_expiry(key: bytes, payload: Dict[str, Any], now: float) -> float:
+    """Cache expiry for a verified token: its exp claim."""
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        return exp
+    return now + TOKEN_CACHE_MAX_SECONDS
+
+
+# Verified tokens: sha256(token) -> claims, evicted least-recently-used or at
+# the token's expiry, whichever comes first. Only valid tokens are cached.
+_token_cache = (
+    TLRUCache(maxsize=settings.token_cache_size, ttu=_token_expiry, timer=time.time)
+    if settings.token_cache_size > 0
+    else None
+)
+_token_cache_lock = threading.Lock()
+
+
+def clear_token_cache() -> None:
+    """Forget every verified token (they are re-verified on next use)."""
+    if _token_cache is not None:
+        with _token_cache_lock:
+            _token_cache.clear()
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and verify a JWT token.
     
+    A token verified earlier is answered from an in-process cache until it
+    expires, skipping the signature check and JSON parse.
+    
     Args:
         token: JWT token to decode
         
     Returns:
         Decoded token payload or None if invalid
     """
+    key = hashlib.sha256(token.encode()).digest()
+    if _token_cache is not None:
+        with _token_cache_lock:
+            payload = _token_cache.get(key)
+        if payload is not None:
+            return dict(payload)
+    
     try:
         payload = jwt.decode(
             token,
             settings.secret_key,
             algorithms=[settings.algorithm]
         )
-        return payload
     except JWTError:
         return None
+    
+    if _token_cache is not None:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+    return dict(payload)
 
 
 def verify_token_type(payload: Dict[str, Any], token_type: str) -> bool:
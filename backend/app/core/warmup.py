@@ -0,0 +1,191 @@
+"""
+Startup warm-up for new workers.
+
+Without it, the first requests on a fresh worker pay for opening database
+connections, configuring the ORM mappers and compiling the hot statements,
+building the OTP providers, spawning the bcrypt pool, loading the token
+revocation filter and generating the OpenAPI schema. The warm-up runs those
+steps in the background as soon as the app starts, and /ready answers 503
+until it has finished, so a load balancer only routes to warm workers.
+
+A failed step is logged and shown by /ready but does not keep the worker
+out of rotation: warm-up only moves work earlier, and the request that
+needs the broken piece reports the real error.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.orm import Session, configure_mappers
+
+from app.core.config import settings
+from app.core.database import SessionLocal, sync_engine
+from app.core.passwords import password_hasher
+from app.core.revocation import revocations
+from app.repositories.bid_repository import BidRepository
+from app.repositories.otp_repository import OTPRepository
+from app.repositories.request_repository import RequestRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.serializers import serialize_bid_list, serialize_request_list
+from app.services.providers import get_fallback_provider, get_shared_provider
+
+
+# Read paths behind OTP login, the request feed and bid lists. SQLAlchemy
+# compiles a statement on its first execution and caches it per engine;
+# the lookups match no rows, so they cost a round trip each.
+HOT_QUERIES: List[Callable[[Session], Any]] = [
+    lambda db: UserRepository(db).get_by_phone(""),
+    lambda db: UserRepository(db).get_by_id(0),
+    lambda db: OTPRepository(db).count_recent_attempts(""),
+    lambda db: OTPRepository(db).get_valid_otp("", ""),
+    lambda db: RequestRepository(db).get_by_id(0),
+    lambda db: serialize_request_list(*RequestRepository(db).get_all(limit=1, summary=True), 0, 1, summary=True),
+    lambda db: serialize_request_list(*RequestRepository(db).get_all(limit=1), 0, 1),
+    lambda db: serialize_bid_list(*BidRepository(db).get_by_request(0, limit=1), 1, 1, 0),
+    lambda db: BidRepository(db).get_by_id(0),
+]
+
+
+def prime_connection_pool(connections: int) -> int:
+    """
+    Open connections and hand them back to the pool for the first requests.
+    
+    Args:
+        connections: Connections to open (at most the pool size, or the
+            extra ones are closed again on return)
+    
+    Returns:
+        Number of connections opened
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = sync_engine.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+def compile_hot_statements() -> int:
+    """
+    Configure the mappers and run each hot query once.
+    
+    Returns:
+        Number of queries run
+    """
+    configure_mappers()
+    db = SessionLocal()
+    try:
+        for query in HOT_QUERIES:
+            query(db)
+    finally:
+        db.rollback()
+        db.close()
+    return len(HOT_QUERIES)
+
+
+def build_providers() -> List[str]:
+    """
+    Build the shared OTP provider and import the fallback's SDK.
+    
+    Returns:
+        Names of the providers built
+    """
+    names = [get_shared_provider().get_provider_name()]
+    fallback = get_fallback_provider()
+    if fallback is not None:
+        names.append(fallback.get_provider_name())
+    return names
+
+
+def build_email_provider() -> str:
+    """Build the shared email provider used for email OTPs."""
+    return get_shared_provider("email").get_provider_name()
+
+
+class WarmUp:
+    """Runs the warm-up steps once and tracks readiness."""
+    
+    def __init__(self):
+        """Initialize as not ready."""
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _step(self, name: str, fn: Callable, *args) -> None:
+        """Run one blocking step in a thread and record its outcome."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(fn, *args)
+            self.steps[name] = {"ok": True, "result": result}
+        except Exception as e:
+            print(f"⚠️ Warm-up step '{name}' failed: {str(e)}")
+            self.steps[name] = {"ok": False, "error": str(e)}
+        self.steps[name]["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    def start(self, app: FastAPI) -> None:
+        """Schedule run() on the running loop; startup does not wait for it."""
+        self._task = asyncio.create_task(self.run(app))
+    
+    async def run(self, app: FastAPI) -> None:
+        """
+        Run every enabled step, then mark the worker ready.
+        
+        The database steps run one after the other (compiling needs a
+        pooled connection anyway); the rest run alongside them.
+        
+        Args:
+            app: Application whose OpenAPI schema is generated
+        """
+        self.started_at = time.perf_counter()
+        
+        async def database() -> None:
+            await self._step(
+                "connection_pool",
+                prime_connection_pool,
+                min(settings.warmup_db_connections, settings.db_pool_size)
+            )
+            await self._step("statements", compile_hot_statements)
+            await self._step("revocation_filter", revocations.refresh)
+        
+        steps = [
+            database(),
+            self._step("providers", build_providers),
+            self._step("openapi", lambda: len(app.openapi()["paths"])),
+        ]
+        if settings.smtp_enabled and settings.otp_delivery_method != "fake":
+            steps.append(self._step("email_provider", build_email_provider))
+        if settings.warmup_password_pool:
+            steps.append(self._step("password_pool", password_hasher.warm_up))
+        
+        await asyncio.gather(*steps)
+        self.mark_ready()
+        failed = [name for name, step in self.steps.items() if not step["ok"]]
+        print(
+            f"🔥 Warm-up finished in {self.stats()['ms']:.0f} ms"
+            + (f" (failed: {', '.join(failed)})" if failed else "")
+        )
+    
+    def mark_ready(self) -> None:
+        """Mark the worker ready (also used when warm-up is disabled)."""
+        self.finished_at = time.perf_counter()
+        self.ready = True
+    
+    def stats(self) -> Dict[str, Any]:
+        """Readiness, total duration and per-step outcome."""
+        ms = None
+        if self.started_at is not None and self.finished_at is not None:
+            ms = round((self.finished_at - self.started_at) * 1000, 1)
+        return {"ready": self.ready, "ms": ms, "steps": self.steps}
+
+
+# Global warm-up state for this worker
+warm_up = WarmUp()
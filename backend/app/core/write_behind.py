@@ -0,0 +1,175 @@
+"""
+Write-behind buffer for non-critical counters and timestamps.
+
+Writing last_login_at on every login and a view counter on every request
+detail view turns reads into row updates, and a popular request becomes a
+hot row every worker is waiting to lock. Each worker instead collects these
+writes in memory - the latest login per user, the number of views per
+request - and a background thread flushes them every
+WRITE_BEHIND_FLUSH_SECONDS as one executemany UPDATE per table, so a
+request viewed a thousand times between flushes costs one row update.
+
+The data is allowed to be slightly stale and is lost if a worker is killed
+without a clean shutdown (at most one interval's worth); the shutdown event
+flushes whatever is pending. A failed flush keeps its data for the next one.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.request_repository import RequestRepository
+from app.repositories.user_repository import UserRepository
+
+
+class WriteBehindBuffer:
+    """Per-worker buffer of login times and view counts."""
+    
+    def __init__(self, flush_seconds: float = 5.0, max_pending: int = 10000):
+        """
+        Initialize an empty buffer; the flush thread starts with start().
+        
+        Args:
+            flush_seconds: Interval between flushes
+            max_pending: Buffered rows that trigger an early flush
+        """
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_login: Dict[int, datetime] = {}
+        self._views: Counter = Counter()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.failures = 0
+        self.rows_written = 0
+    
+    @property
+    def pending(self) -> int:
+        """Rows waiting for the next flush."""
+        return len(self._last_login) + len(self._views)
+    
+    def record_login(self, user_id: int, at: Optional[datetime] = None) -> None:
+        """
+        Buffer a login; only the latest one per user is written.
+        
+        Args:
+            user_id: User who logged in
+            at: Login time (default: now)
+        """
+        at = at or datetime.utcnow()
+        with self._lock:
+            previous = self._last_login.get(user_id)
+            if previous is None or at > previous:
+                self._last_login[user_id] = at
+        self._check_pending()
+    
+    def record_view(self, request_id: int, views: int = 1) -> None:
+        """
+        Buffer views of a request.
+        
+        Args:
+            request_id: Request that was viewed
+            views: Number of views to add
+        """
+        with self._lock:
+            self._views[request_id] += views
+        self._check_pending()
+    
+    def _check_pending(self) -> None:
+        """Wake the flush thread early when the buffer is large."""
+        if self.pending >= self.max_pending:
+            self._wake.set()
+    
+    def flush(self) -> int:
+        """
+        Write everything buffered so far.
+        
+        Runs in the flush thread, and in the caller on shutdown. On failure
+        the data is merged back into the buffer for the next flush.
+        
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                logins, self._last_login = self._last_login, {}
+                views, self._views = self._views, Counter()
+            if not logins and not views:
+                return 0
+            
+            db = SessionLocal()
+            try:
+                written = UserRepository(db).bulk_update_last_login(logins)
+                logins = {}
+                written += RequestRepository(db).increment_view_counts(dict(views))
+                views = Counter()
+            except Exception as e:
+                db.rollback()
+                self.failures += 1
+                print(f"⚠️ Write-behind flush failed, keeping {len(logins) + len(views)} rows: {str(e)}")
+                with self._lock:
+                    for user_id, at in logins.items():
+                        previous = self._last_login.get(user_id)
+                        if previous is None or at > previous:
+                            self._last_login[user_id] = at
+                    self._views.update(views)
+                return 0
+            finally:
+                db.close()
+            
+            self.flushes += 1
+            self.rows_written += written
+            return written
+    
+    def _run(self) -> None:
+        """Flush loop of the background thread."""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            if not self._stop.is_set():
+                self.flush()
+    
+    def start(self) -> None:
+        """Start the flush thread (once per worker)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> int:
+        """
+        Stop the flush thread and write what is still buffered.
+        
+        Returns:
+            Number of rows written by the final flush
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_seconds + 5)
+            self._thread = None
+        return self.flush()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Buffer size and flush counters for this worker."""
+        return {
+            "pending": self.pending,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "rows_written": self.rows_written,
+            "flush_seconds": self.flush_seconds,
+        }
+
+
+# Global buffer for this worker
+write_behind = WriteBehindBuffer(
+    flush_seconds=settings.write_behind_flush_seconds,
+    max_pending=settings.write_behind_max_pending
+)
@@ -8,7 +8,12 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.database import init_db
-from app.api.v1 import api_router  # Import API router
+from app.core.passwords import password_hasher
+from app.core.realtime import realtime
+from app.core.responses import FastJSONResponse
+from app.core.warmup import warm_up
+from app.core.write_behind import write_behind
+from app.api.v1 import include_routers  # Import API routers
 
 # Create FastAPI application
 app = FastAPI(
@@ -44,6 +49,7 @@ app = FastAPI(
     * **ReDoc**: Alternative documentation at `/redoc`
     * **OpenAPI Schema**: Raw schema at `/openapi.json`
     """,
+    default_response_class=FastJSONResponse,
     docs_url="/docs",  # Always enabled for easy testing
     redoc_url="/redoc",
     openapi_tags=[
@@ -52,6 +58,9 @@ app = FastAPI(
         {"name": "Users", "description": "User profile management"},
         {"name": "Requests", "description": "Civil work request management"},
         {"name": "Bids", "description": "Bidding on requests"},
+        {"name": "Sync", "description": "Delta sync for the mobile client"},
+        {"name": "Notifications", "description": "Notification inbox and digests"},
+        {"name": "Realtime", "description": "WebSocket event push"},
         {"name": "Admin", "description": "Admin operations"},
     ],
     contact={
@@ -76,6 +85,18 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup."""
+    if "realtime" in settings.enabled_optional_routers:
+        await realtime.start()
+    
+    # Prime pools, providers and statements in the background; /ready waits for it
+    if settings.warmup_enabled:
+        warm_up.start(app)
+    else:
+        warm_up.mark_ready()
+    
+    # Batch last_login_at and view count writes
+    write_behind.start()
+    
     # In production, use Alembic migrations instead
     if settings.is_development:
         # init_db()  # Uncomment when models are ready
@@ -85,7 +106,9 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
-    pass
+    await realtime.stop()
+    password_hasher.shutdown()
+    write_behind.stop()
 
 
 @app.get("/", tags=["Root"])
@@ -105,12 +128,23 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": "2025-12-28T00:00:00Z"
+        "timestamp": "2025-12-28T00:00:00Z",
+        "password_hashing": password_hasher.stats(),
+        "write_behind": write_behind.stats()
     }
 
 
+@app.get("/ready", tags=["Health"])
+async def readiness_check():
+    """Readiness probe - 503 until the startup warm-up has finished."""
+    stats = warm_up.stats()
+    if not stats["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "warm_up": stats})
+    return {"status": "ready", "warm_up": stats}
+
+
 # Include API routers
-app.include_router(api_router, prefix="/api/v1")
+include_routers(app, prefix="/api/v1")
 
 
 if __name__ == "__main__":
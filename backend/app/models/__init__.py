@@ -8,5 +8,28 @@ from app.models.user import User
 from app.models.otp import OTP
 from app.models.request import Request
 from app.models.bid import Bid
+from app.models.matching import RequestMatchTerm, ContractorMatchTerm, ContractorRecommendation
+from app.models.sync import SyncTombstone
+from app.models.notification import OutboxEvent, Notification
+from app.models.revoked_token import RevokedToken
+from app.models.idempotency import IdempotencyKey
+from app.models.analytics import RequestDailyStat, BidDailyStat, UserStat, AnalyticsRefresh
 
-__all__ = ["User", "OTP", "Request", "Bid"]
+__all__ = [
+    "User",
+    "OTP",
+    "Request",
+    "Bid",
+    "RequestMatchTerm",
+    "ContractorMatchTerm",
+    "ContractorRecommendation",
+    "SyncTombstone",
+    "OutboxEvent",
+    "Notification",
+    "RevokedToken",
+    "IdempotencyKey",
+    "RequestDailyStat",
+    "BidDailyStat",
+    "UserStat",
+    "AnalyticsRefresh",
+]
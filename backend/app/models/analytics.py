@@ -0,0 +1,80 @@
+"""
+Analytics summary tables for the admin dashboards.
+
+Counts are kept per creation day (UTC) and dimension, so the admin endpoints
+sum a few thousand summary rows instead of scanning requests, bids and users.
+The tables are rebuilt by AnalyticsService.refresh (scripts/refresh_analytics.py).
+"""
+
+from sqlalchemy import Column, Date, DateTime, Enum, Float, Integer, String
+
+from app.core.database import Base
+from app.models.bid import BidStatus
+from app.models.request import RequestCategory, RequestStatus
+from app.models.user import UserRole
+
+
+class RequestDailyStat(Base):
+    """Requests created on a day, by current status, category and city."""
+    
+    __tablename__ = "analytics_request_daily"
+    
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(RequestStatus), primary_key=True)
+    category = Column(Enum(RequestCategory), primary_key=True)
+    city = Column(String(100), primary_key=True)
+    requests = Column(Integer, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<RequestDailyStat({self.day} {self.status} {self.category} {self.city}: {self.requests})>"
+
+
+class BidDailyStat(Base):
+    """Bids created on a day, by current status, with their summed amount."""
+    
+    __tablename__ = "analytics_bid_daily"
+    
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(BidStatus), primary_key=True)
+    bids = Column(Integer, nullable=False)
+    amount_total = Column(Float, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<BidDailyStat({self.day} {self.status}: {self.bids})>"
+
+
+class UserStat(Base):
+    """Users by role and city ('' when the profile has no city)."""
+    
+    __tablename__ = "analytics_users"
+    
+    role = Column(Enum(UserRole), primary_key=True)
+    city = Column(String(100), primary_key=True)
+    users = Column(Integer, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<UserStat({self.role} {self.city!r}: {self.users})>"
+
+
+class AnalyticsRefresh(Base):
+    """
+    Progress of one summary table's refreshes.
+    
+    Rows changed at or after the watermark are folded in by the next
+    incremental refresh; full_refreshed_at schedules the periodic rebuild
+    that also drops deleted rows.
+    """
+    
+    __tablename__ = "analytics_refreshes"
+    
+    name = Column(String(50), primary_key=True)
+    watermark = Column(DateTime, nullable=True)
+    refreshed_at = Column(DateTime, nullable=True)
+    full_refreshed_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<AnalyticsRefresh({self.name}, watermark={self.watermark})>"
@@ -4,7 +4,7 @@ Bid model for contractor bids on requests.
 
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -27,6 +27,10 @@ class Bid(Base):
     """
     
     __tablename__ = "bids"
+    __table_args__ = (
+        # Keyset scans for delta sync (updated_at, id) > (cursor)
+        Index("ix_bids_updated_at_id", "updated_at", "id"),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -0,0 +1,47 @@
+"""
+Idempotency key model for safely retried POST requests.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Outcome of a POST sent with an Idempotency-Key header.
+    
+    A row is claimed (status_code NULL) before the handler runs, linked to
+    the created resource in the transaction that creates it, and completed
+    with the response afterwards; a retry with the same key gets the stored
+    response (or, if the first request died before storing it, the linked
+    resource) back without running the handler again. Rows are pruned once
+    expired (scripts/prune_idempotency_keys.py).
+    """
+    
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    
+    # Hash of the endpoint and request body; a key reused for a different request is rejected
+    fingerprint = Column(String(64), nullable=False)
+    
+    # Stored response; NULL while the first request is still running
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    
+    # ID of the created request or bid, written in the same transaction as it
+    resource_id = Column(Integer, nullable=True)
+    
+    # When the current claim was taken; identifies the claim's owner
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<IdempotencyKey(user_id={self.user_id}, key={self.key}, status_code={self.status_code})>"
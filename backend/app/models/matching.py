@@ -0,0 +1,78 @@
+"""
+Matching models for contractor-to-request recommendations.
+"""
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index
+
+from app.core.database import Base
+
+
+class MatchTermType(str, PyEnum):
+    """Kinds of terms requests and contractors are matched on."""
+    CATEGORY = "category"
+    SKILL = "skill"
+    CITY = "city"
+
+
+class RequestMatchTerm(Base):
+    """
+    Inverted index of open requests by category, skill and city.
+    
+    One row per (term, request). Only OPEN requests are indexed; rows are
+    replaced whenever a request is created, updated or closed.
+    """
+    
+    __tablename__ = "request_match_terms"
+    
+    term_type = Column(Enum(MatchTermType), primary_key=True)
+    term = Column(String(100), primary_key=True)
+    request_id = Column(Integer, ForeignKey("requests.id", ondelete="CASCADE"), primary_key=True, index=True)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<RequestMatchTerm({self.term_type}:{self.term} -> request {self.request_id})>"
+
+
+class ContractorMatchTerm(Base):
+    """
+    Weighted profile terms of a contractor.
+    
+    Derived from the contractor's city, the skills in their profile
+    description and the categories of requests they have bid on.
+    """
+    
+    __tablename__ = "contractor_match_terms"
+    
+    term_type = Column(Enum(MatchTermType), primary_key=True)
+    term = Column(String(100), primary_key=True)
+    contractor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, index=True)
+    weight = Column(Integer, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ContractorMatchTerm({self.term_type}:{self.term} -> contractor {self.contractor_id}, weight={self.weight})>"
+
+
+class ContractorRecommendation(Base):
+    """
+    Precomputed "recommended for you" entry.
+    
+    The score is the summed weight of the contractor terms the request
+    matches. A city match alone never produces a recommendation.
+    """
+    
+    __tablename__ = "contractor_recommendations"
+    __table_args__ = (
+        Index("ix_contractor_recommendations_feed", "contractor_id", "score"),
+    )
+    
+    contractor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    request_id = Column(Integer, ForeignKey("requests.id", ondelete="CASCADE"), primary_key=True, index=True)
+    score = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ContractorRecommendation(contractor_id={self.contractor_id}, request_id={self.request_id}, score={self.score})>"
@@ -0,0 +1,90 @@
+"""
+Notification models: the transactional outbox and per-user notifications.
+"""
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+# Event payloads: JSONB on PostgreSQL, JSON elsewhere
+Payload = JSON().with_variant(JSONB(), "postgresql")
+
+
+class NotificationType(str, PyEnum):
+    """Events users are notified about."""
+    BID_SUBMITTED = "bid.submitted"
+    BID_ACCEPTED = "bid.accepted"
+    REQUEST_STATUS_CHANGED = "request.status_changed"
+
+
+class OutboxEvent(Base):
+    """
+    Domain event recorded in the same transaction as the change it describes.
+    
+    The notification dispatcher turns pending events into Notification rows
+    and marks them processed, so an event exists if and only if its change
+    was committed, and is handled once even if the dispatcher restarts.
+    """
+    
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The dispatcher only ever scans unprocessed events, oldest first
+        Index(
+            "ix_outbox_events_pending",
+            "id",
+            postgresql_where=text("processed_at IS NULL")
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    event_type = Column(Enum(NotificationType), nullable=False)
+    payload = Column(Payload, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<OutboxEvent(id={self.id}, type={self.event_type}, processed={self.processed_at is not None})>"
+
+
+class Notification(Base):
+    """
+    Notification shown in a user's inbox.
+    
+    delivered_at is set once the notification has gone out in a digest (or
+    was read in the app first, so no message is needed).
+    """
+    
+    __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        # Digest scan: undelivered notifications, oldest first
+        Index(
+            "ix_notifications_undelivered",
+            "created_at",
+            postgresql_where=text("delivered_at IS NULL")
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    type = Column(Enum(NotificationType), nullable=False)
+    title = Column(String(200), nullable=False)
+    body = Column(Text, nullable=False)
+    data = Column(Payload, nullable=True)  # IDs for deep links, e.g. request_id
+    is_read = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    delivered_at = Column(DateTime, nullable=True)
+    
+    # Relationships
+    user = relationship("User")
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type})>"
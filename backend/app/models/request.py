@@ -3,13 +3,18 @@ Request model for civil work requests posted by building societies.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 
 from app.core.database import Base
 
 
+# List of strings stored as JSONB on PostgreSQL (GIN-indexable), JSON elsewhere
+StringList = JSON().with_variant(JSONB(), "postgresql")
+
+
 class RequestCategory(str, enum.Enum):
     """Request category enumeration."""
     CONSTRUCTION = "CONSTRUCTION"
@@ -52,10 +57,16 @@ class Request(Base):
         city: City
         state: State
         pincode: Postal code
+        latitude: Latitude resolved from the pincode
+        longitude: Longitude resolved from the pincode
+        geohash: Geohash of the resolved location, for radius search
         estimated_duration_days: Estimated work duration
-        required_skills: Comma-separated skills needed
+        required_skills: List of lower-case skills needed
         preferred_start_date: When work should start
-        images: Comma-separated image URLs/paths
+        images: List of image URLs/paths
+        view_count: Detail views, flushed in batches (see app/core/write_behind.py)
+        bid_count: Bids on the request, any status (kept by CounterRepository)
+        pending_bid_count: Pending bids on the request
         created_at: Request creation timestamp
         updated_at: Last update timestamp
         started_at: Work start timestamp
@@ -63,6 +74,23 @@ class Request(Base):
     """
     
     __tablename__ = "requests"
+    __table_args__ = (
+        # Serves skill containment filters (required_skills @> '["plumbing"]')
+        Index(
+            "ix_requests_required_skills",
+            "required_skills",
+            postgresql_using="gin",
+            postgresql_ops={"required_skills": "jsonb_path_ops"},
+        ),
+        # Serves geohash prefix scans (geohash LIKE 'te7u%') for radius search
+        Index(
+            "ix_requests_geohash",
+            "geohash",
+            postgresql_ops={"geohash": "varchar_pattern_ops"},
+        ),
+        # Keyset scans for delta sync (updated_at, id) > (cursor)
+        Index("ix_requests_updated_at_id", "updated_at", "id"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -82,15 +110,25 @@ class Request(Base):
     city = Column(String(100), nullable=False, index=True)
     state = Column(String(100), nullable=False)
     pincode = Column(String(10), nullable=True)
+    latitude = Column(Float, nullable=True)  # Resolved from pincode on write
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)
     
 
     # Additional Details
     estimated_duration_days = Column(Integer, nullable=True)
-    required_skills = Column(Text, nullable=True)  # Comma-separated
+    required_skills = Column(StringList, nullable=True)  # ["plumbing", "tiling"]
     preferred_start_date = Column(DateTime, nullable=True)
     
     # Media
-    images = Column(Text, nullable=True)  # Comma-separated URLs
+    images = Column(StringList, nullable=True)  # ["https://...", ...]
+    
+    # Engagement (approximate: buffered per worker, not part of updated_at)
+    view_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    # Denormalised counters, updated with each bid write (see CounterRepository)
+    bid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_bid_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -124,13 +162,9 @@ class Request(Base):
     @property
     def image_list(self) -> list:
         """Get list of image URLs."""
-        if self.images:
-            return [img.strip() for img in self.images.split(",") if img.strip()]
-        return []
+        return list(self.images or [])
     
     @property
     def skill_list(self) -> list:
         """Get list of required skills."""
-        if self.required_skills:
-            return [skill.strip() for skill in self.required_skills.split(",") if skill.strip()]
-        return []
+        return list(self.required_skills or [])
@@ -0,0 +1,33 @@
+"""
+Revoked token model for logout and token revocation.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.core.database import Base
+
+
+class RevokedToken(Base):
+    """
+    JWT ID (jti claim) of an access or refresh token revoked before expiry.
+    
+    Rows are only needed until the token would have expired anyway, and are
+    pruned after that (scripts/prune_revoked_tokens.py).
+    """
+    
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (
+        # Incremental sync of the in-process Bloom filter
+        Index("ix_revoked_tokens_revoked_at", "revoked_at"),
+        Index("ix_revoked_tokens_expires_at", "expires_at"),
+    )
+    
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<RevokedToken(jti={self.jti}, user_id={self.user_id})>"
@@ -0,0 +1,41 @@
+"""
+Sync models for the mobile delta-sync endpoint.
+"""
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, Index
+
+from app.core.database import Base
+
+
+class SyncEntityType(str, PyEnum):
+    """Kinds of rows delta sync reports deletions for."""
+    REQUEST = "request"
+    BID = "bid"
+
+
+class SyncTombstone(Base):
+    """
+    Record of a deleted row, so delta sync can tell clients to drop it.
+    
+    user_id limits the tombstone to one user (e.g. a deleted bid is only
+    reported to its contractor and to the society that posted the request);
+    NULL means every user. Tombstones older than the sync retention window
+    are pruned, and clients with an older cursor do a full resync.
+    """
+    
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    entity_type = Column(Enum(SyncEntityType), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SyncTombstone({self.entity_type}:{self.entity_id}, user_id={self.user_id})>"
@@ -3,7 +3,7 @@ User model for authentication and profile management.
 """
 
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, Float, Integer, String, Text
 from sqlalchemy.orm import relationship
 import enum
 
@@ -41,11 +41,16 @@ class User(Base):
         city: City
         state: State/province
         pincode: Postal code
+        latitude: Latitude resolved from the pincode
+        longitude: Longitude resolved from the pincode
+        geohash: Geohash of the resolved location
         is_verified: Whether phone is verified
         is_active: Whether account is active
         created_at: Account creation timestamp
         updated_at: Last update timestamp
         last_login_at: Last login timestamp
+        open_request_count: Open requests posted (societies; kept by CounterRepository)
+        active_bid_count: Pending or accepted bids (contractors)
     """
     
     __tablename__ = "users"
@@ -72,6 +77,9 @@ class User(Base):
     city = Column(String(100), nullable=True)
     state = Column(String(100), nullable=True)
     pincode = Column(String(10), nullable=True)
+    latitude = Column(Float, nullable=True)  # Resolved from pincode on write
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)
     
     # Verification & Status Flags
     is_verified = Column(Boolean, default=False, nullable=False)
@@ -82,6 +90,10 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     last_login_at = Column(DateTime, nullable=True)
     
+    # Denormalised counters, updated with each request and bid write (see CounterRepository)
+    open_request_count = Column(Integer, nullable=False, default=0, server_default="0")
+    active_bid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     contractor_bids = relationship("Bid", foreign_keys="Bid.contractor_id", back_populates="contractor", cascade="all, delete-orphan")
     
@@ -6,5 +6,28 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.otp_repository import OTPRepository
 from app.repositories.request_repository import RequestRepository
 from app.repositories.bid_repository import BidRepository
+from app.repositories.matching_repository import MatchingRepository
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.notification_repository import NotificationRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.idempotency_repository import IdempotencyKeyRepository
+from app.repositories.counter_repository import CounterRepository
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.rows import RequestRow, RequestSummaryRow, UserRow
 
-__all__ = ["UserRepository", "OTPRepository", "RequestRepository", "BidRepository"]
+__all__ = [
+    "UserRepository",
+    "OTPRepository",
+    "RequestRepository",
+    "BidRepository",
+    "MatchingRepository",
+    "SyncRepository",
+    "NotificationRepository",
+    "RevokedTokenRepository",
+    "IdempotencyKeyRepository",
+    "CounterRepository",
+    "AnalyticsRepository",
+    "RequestRow",
+    "RequestSummaryRow",
+    "UserRow",
+]
@@ -0,0 +1,244 @@
+"""
+Analytics repository for the admin summary tables.
+"""
+
+from typing import Any, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, and_, delete, func, insert, or_, select
+
+from app.models.analytics import AnalyticsRefresh, BidDailyStat, RequestDailyStat, UserStat
+from app.models.bid import Bid
+from app.models.request import Request
+from app.models.user import User
+
+
+def _day_ranges(days: List[date]) -> List[Tuple[datetime, datetime]]:
+    """Merge days into [start, end) datetime ranges, one per run of consecutive days."""
+    ranges: List[List[datetime]] = []
+    for day in sorted(set(days)):
+        start = datetime.combine(day, time.min)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = start + timedelta(days=1)
+        else:
+            ranges.append([start, start + timedelta(days=1)])
+    return [(start, end) for start, end in ranges]
+
+
+class AnalyticsRepository:
+    """Repository for analytics summary operations."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    # ------------------------------------------------------------------
+    # Refresh (no commits: AnalyticsService commits each table's refresh)
+    
+    def lock_refresh(self, name: str) -> AnalyticsRefresh:
+        """
+        Get a summary table's refresh state, locked until commit.
+        
+        The row lock keeps two refreshers from rebuilding the same days.
+        
+        Args:
+            name: Summary table name
+        
+        Returns:
+            AnalyticsRefresh row (created on first use)
+        """
+        refresh = self.db.query(AnalyticsRefresh).filter(
+            AnalyticsRefresh.name == name
+        ).with_for_update().first()
+        if refresh is None:
+            refresh = AnalyticsRefresh(name=name)
+            self.db.add(refresh)
+            self.db.flush()
+        return refresh
+    
+    def get_refreshes(self) -> List[AnalyticsRefresh]:
+        """Refresh state of every summary table."""
+        return self.db.query(AnalyticsRefresh).order_by(AnalyticsRefresh.name).all()
+    
+    def _changed_days(self, model, since: datetime) -> List[date]:
+        """Creation days of rows updated at or after since (uses the updated_at index)."""
+        day = func.date(model.created_at, type_=Date)
+        return list(self.db.scalars(select(day).where(model.updated_at >= since).distinct()))
+    
+    def changed_request_days(self, since: datetime) -> List[date]:
+        """Creation days of requests changed since a watermark."""
+        return self._changed_days(Request, since)
+    
+    def changed_bid_days(self, since: datetime) -> List[date]:
+        """Creation days of bids changed since a watermark."""
+        return self._changed_days(Bid, since)
+    
+    def _rebuild_days(self, stat, model, group_columns: list, aggregates: list, days: Optional[List[date]]) -> int:
+        """
+        Replace a daily summary's rows for some days (all days if None).
+        
+        Deletes the days' rows and re-inserts them from one GROUP BY over the
+        source rows created on those days.
+        
+        Returns:
+            Summary rows written
+        """
+        table = stat.__table__
+        day = func.date(model.created_at, type_=Date)
+        query = select(day, *group_columns, *aggregates).group_by(day, *group_columns)
+        
+        if days is None:
+            self.db.execute(delete(table))
+        else:
+            if not days:
+                return 0
+            self.db.execute(delete(table).where(table.c.day.in_(sorted(set(days)))))
+            query = query.where(or_(*[
+                and_(model.created_at >= start, model.created_at < end)
+                for start, end in _day_ranges(days)
+            ]))
+        
+        return self.db.execute(insert(table).from_select(list(table.c.keys()), query)).rowcount
+    
+    def rebuild_request_days(self, days: Optional[List[date]] = None) -> int:
+        """
+        Recompute requests per day, status, category and city.
+        
+        Args:
+            days: Creation days to recompute, or None for all
+        
+        Returns:
+            Summary rows written
+        """
+        return self._rebuild_days(
+            RequestDailyStat,
+            Request,
+            [Request.status, Request.category, Request.city],
+            [func.count()],
+            days
+        )
+    
+    def rebuild_bid_days(self, days: Optional[List[date]] = None) -> int:
+        """
+        Recompute bids per day and status, with their summed amount.
+        
+        Args:
+            days: Creation days to recompute, or None for all
+        
+        Returns:
+            Summary rows written
+        """
+        return self._rebuild_days(
+            BidDailyStat,
+            Bid,
+            [Bid.status],
+            [func.count(), func.coalesce(func.sum(Bid.amount), 0.0)],
+            days
+        )
+    
+    def rebuild_users(self) -> int:
+        """
+        Recompute users per role and city.
+        
+        Always a full rebuild: users has no indexed change timestamp, and a
+        user moving city changes two groups.
+        
+        Returns:
+            Summary rows written
+        """
+        table = UserStat.__table__
+        city = func.coalesce(User.city, "")
+        self.db.execute(delete(table))
+        return self.db.execute(
+            insert(table).from_select(
+                ["role", "city", "users"],
+                select(User.role, city, func.count()).group_by(User.role, city)
+            )
+        ).rowcount
+    
+    # ------------------------------------------------------------------
+    # Reads
+    
+    def _totals(self, stat, group_by: str, measures: list, criteria: list) -> List[Tuple[Any, ...]]:
+        """Sum a summary table's measures per value of one column."""
+        key = getattr(stat, group_by)
+        return [
+            tuple(row)
+            for row in self.db.execute(
+                select(key, *[func.sum(measure) for measure in measures])
+                .where(*criteria)
+                .group_by(key)
+                .order_by(key)
+            )
+        ]
+    
+    def _day_criteria(self, stat, start: Optional[date], end: Optional[date]) -> list:
+        """Inclusive day range filter."""
+        criteria = []
+        if start is not None:
+            criteria.append(stat.day >= start)
+        if end is not None:
+            criteria.append(stat.day <= end)
+        return criteria
+    
+    def request_totals(
+        self,
+        group_by: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        **filters: Any
+    ) -> List[Tuple[Any, int]]:
+        """
+        Requests per value of one dimension.
+        
+        Args:
+            group_by: day, status, category or city
+            start: First creation day to include
+            end: Last creation day to include
+            **filters: status, category and/or city to match
+        
+        Returns:
+            List of (value, requests) sorted by value
+        """
+        criteria = self._day_criteria(RequestDailyStat, start, end) + [
+            getattr(RequestDailyStat, name) == value for name, value in filters.items() if value is not None
+        ]
+        return self._totals(RequestDailyStat, group_by, [RequestDailyStat.requests], criteria)
+    
+    def bid_totals(
+        self,
+        group_by: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        **filters: Any
+    ) -> List[Tuple[Any, int, float]]:
+        """
+        Bids and summed amount per value of one dimension.
+        
+        Args:
+            group_by: day or status
+            start: First creation day to include
+            end: Last creation day to include
+            **filters: status to match
+        
+        Returns:
+            List of (value, bids, amount_total) sorted by value
+        """
+        criteria = self._day_criteria(BidDailyStat, start, end) + [
+            getattr(BidDailyStat, name) == value for name, value in filters.items() if value is not None
+        ]
+        return self._totals(BidDailyStat, group_by, [BidDailyStat.bids, BidDailyStat.amount_total], criteria)
+    
+    def user_totals(self, group_by: str, **filters: Any) -> List[Tuple[Any, int]]:
+        """
+        Users per role or city.
+        
+        Args:
+            group_by: role or city
+            **filters: role and/or city to match
+        
+        Returns:
+            List of (value, users) sorted by value
+        """
+        criteria = [getattr(UserStat, name) == value for name, value in filters.items() if value is not None]
+        return self._totals(UserStat, group_by, [UserStat.users], criteria)
@@ -3,10 +3,22 @@ Bid repository for database operations.
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from datetime import datetime
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func, and_, update
 
+from app.core.cache import cache, request_namespace, REQUEST_FEED_NAMESPACE
 from app.models.bid import Bid, BidStatus
+from app.models.request import Request
+from app.models.sync import SyncEntityType, SyncTombstone
+from app.models.user import User
+from app.repositories.counter_repository import CounterRepository
+
+
+def _latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """Latest of some optional timestamps."""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
 
 
 class BidRepository:
@@ -15,6 +27,7 @@ class BidRepository:
     def __init__(self, db: Session):
         """Initialize repository with database session."""
         self.db = db
+        self.counters = CounterRepository(db)
     
     def create(self, bid_data: dict) -> Bid:
         """
@@ -28,8 +41,10 @@ class BidRepository:
         """
         bid = Bid(**bid_data)
         self.db.add(bid)
+        self.counters.bid_changed(bid.request_id, [bid.contractor_id], None, bid.status or BidStatus.PENDING)
         self.db.commit()
         self.db.refresh(bid)
+        cache.bump(request_namespace(bid.request_id), REQUEST_FEED_NAMESPACE)
         return bid
     
     def get_by_id(self, bid_id: int) -> Optional[Bid]:
@@ -44,6 +59,27 @@ class BidRepository:
         """
         return self.db.query(Bid).filter(Bid.id == bid_id).first()
     
+    def get_updated_at(self, bid_id: int) -> Optional[datetime]:
+        """
+        Get the last modification time of a bid without loading the row.
+        
+        The embedded contractor summary (name, phone, city) is part of the
+        response, so the contractor's updated_at counts too.
+        
+        Args:
+            bid_id: Bid ID
+            
+        Returns:
+            Latest updated_at of the bid and its contractor, or None if bid doesn't exist
+        """
+        row = (
+            self.db.query(Bid.updated_at, User.updated_at)
+            .join(User, User.id == Bid.contractor_id)
+            .filter(Bid.id == bid_id)
+            .first()
+        )
+        return _latest(*row) if row else None
+    
     def get_by_request(
         self,
         request_id: int,
@@ -69,7 +105,13 @@ class BidRepository:
             query = query.filter(Bid.status == status)
         
         total = query.count()
-        bids = query.order_by(Bid.created_at.desc()).offset(skip).limit(limit).all()
+        bids = (
+            query.options(joinedload(Bid.contractor))
+            .order_by(Bid.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         
         return bids, total
     
@@ -98,10 +140,75 @@ class BidRepository:
             query = query.filter(Bid.status == status)
         
         total = query.count()
-        bids = query.order_by(Bid.created_at.desc()).offset(skip).limit(limit).all()
+        bids = (
+            query.options(joinedload(Bid.contractor))
+            .order_by(Bid.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         
         return bids, total
     
+    def get_version_by_request(
+        self,
+        request_id: int,
+        status: Optional[BidStatus] = None,
+        contractor_id: Optional[int] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get a version fingerprint for the bids on a request.
+        
+        Args:
+            request_id: Request ID
+            status: Filter by bid status
+            contractor_id: Only this contractor's bids
+            
+        Returns:
+            Tuple of (bid count, latest updated_at of the bids and their contractors)
+        """
+        query = self.db.query(
+            func.count(Bid.id), func.max(Bid.updated_at), func.max(User.updated_at)
+        ).join(User, User.id == Bid.contractor_id).filter(
+            Bid.request_id == request_id
+        )
+        
+        if status:
+            query = query.filter(Bid.status == status)
+        
+        if contractor_id:
+            query = query.filter(Bid.contractor_id == contractor_id)
+        
+        count, bids_updated, contractors_updated = query.one()
+        return count, _latest(bids_updated, contractors_updated)
+    
+    def get_version_by_contractor(
+        self,
+        contractor_id: int,
+        status: Optional[BidStatus] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get a version fingerprint for the bids submitted by a contractor.
+        
+        Args:
+            contractor_id: Contractor user ID
+            status: Filter by bid status
+            
+        Returns:
+            Tuple of (bid count, latest updated_at of the bids and the contractor)
+        """
+        query = self.db.query(
+            func.count(Bid.id), func.max(Bid.updated_at), func.max(User.updated_at)
+        ).join(User, User.id == Bid.contractor_id).filter(
+            Bid.contractor_id == contractor_id
+        )
+        
+        if status:
+            query = query.filter(Bid.status == status)
+        
+        count, bids_updated, contractors_updated = query.one()
+        return count, _latest(bids_updated, contractors_updated)
+    
     def get_existing_bid(self, request_id: int, contractor_id: int) -> Optional[Bid]:
         """
         Check if contractor already bid on this request.
@@ -132,12 +239,16 @@ class BidRepository:
         Returns:
             Updated Bid object
         """
+        old_status = bid.status
         for key, value in update_data.items():
             if value is not None and hasattr(bid, key):
                 setattr(bid, key, value)
         
+        if bid.status != old_status:
+            self.counters.bid_changed(bid.request_id, [bid.contractor_id], old_status, bid.status)
         self.db.commit()
         self.db.refresh(bid)
+        cache.bump(request_namespace(bid.request_id), REQUEST_FEED_NAMESPACE)
         return bid
     
     def update_status(self, bid: Bid, status: BidStatus) -> Bid:
@@ -151,9 +262,12 @@ class BidRepository:
         Returns:
             Updated Bid object
         """
+        if bid.status != status:
+            self.counters.bid_changed(bid.request_id, [bid.contractor_id], bid.status, status)
         bid.status = status
         self.db.commit()
         self.db.refresh(bid)
+        cache.bump(request_namespace(bid.request_id), REQUEST_FEED_NAMESPACE)
         return bid
     
     def delete(self, bid: Bid) -> bool:
@@ -166,14 +280,23 @@ class BidRepository:
         Returns:
             True if successful
         """
+        request_id = bid.request_id
+        self.db.add_all([
+            SyncTombstone(entity_type=SyncEntityType.BID, entity_id=bid.id, user_id=user_id)
+            for user_id in {bid.contractor_id, bid.request.society_id}
+        ])
+        self.counters.bid_changed(request_id, [bid.contractor_id], bid.status, None)
         self.db.delete(bid)
         self.db.commit()
+        cache.bump(request_namespace(request_id), REQUEST_FEED_NAMESPACE)
         return True
     
     def count_by_request(self, request_id: int, status: Optional[BidStatus] = None) -> int:
         """
         Count bids for a request.
         
+        All and pending bids are read from the request's counters.
+        
         Args:
             request_id: Request ID
             status: Optional status filter
@@ -181,6 +304,10 @@ class BidRepository:
         Returns:
             Number of bids
         """
+        if status is None or status == BidStatus.PENDING:
+            counter = Request.bid_count if status is None else Request.pending_bid_count
+            return self.db.query(counter).filter(Request.id == request_id).scalar() or 0
+        
         query = self.db.query(Bid).filter(Bid.request_id == request_id)
         
         if status:
@@ -206,40 +333,73 @@ class BidRepository:
         
         return query.count()
     
+    def _statistics_columns(self) -> list:
+        """Aggregates behind BidStatistics: per-status counts and pending bid amounts."""
+        def count_of(status: BidStatus):
+            return func.count(case((Bid.status == status, 1)))
+        
+        pending_amount = case((Bid.status == BidStatus.PENDING, Bid.amount))
+        return [
+            func.count(Bid.id),
+            count_of(BidStatus.PENDING),
+            count_of(BidStatus.ACCEPTED),
+            count_of(BidStatus.REJECTED),
+            count_of(BidStatus.WITHDRAWN),
+            func.avg(pending_amount),
+            func.min(pending_amount),
+            func.max(pending_amount),
+        ]
+    
+    def _statistics_dict(self, row) -> Dict[str, Any]:
+        """BidStatistics data from one row of _statistics_columns."""
+        total, pending, accepted, rejected, withdrawn, avg_amount, min_amount, max_amount = row
+        return {
+            "total_bids": total,
+            "pending_bids": pending,
+            "accepted_bids": accepted,
+            "rejected_bids": rejected,
+            "withdrawn_bids": withdrawn,
+            "average_bid_amount": float(avg_amount) if avg_amount else None,
+            "lowest_bid": float(min_amount) if min_amount else None,
+            "highest_bid": float(max_amount) if max_amount else None,
+        }
+    
     def get_statistics(self, request_id: int) -> Dict[str, Any]:
         """
         Get bid statistics for a request.
         
+        One aggregate query: per-status counts and the amounts of pending
+        bids, instead of a COUNT(*) per status.
+        
         Args:
             request_id: Request ID
             
         Returns:
             Dictionary with statistics
         """
-        query = self.db.query(Bid).filter(Bid.request_id == request_id)
-        
-        total = query.count()
-        pending = query.filter(Bid.status == BidStatus.PENDING).count()
-        accepted = query.filter(Bid.status == BidStatus.ACCEPTED).count()
-        rejected = query.filter(Bid.status == BidStatus.REJECTED).count()
-        withdrawn = query.filter(Bid.status == BidStatus.WITHDRAWN).count()
+        row = self.db.query(*self._statistics_columns()).filter(Bid.request_id == request_id).one()
+        return self._statistics_dict(row)
+    
+    def get_statistics_for_requests(self, request_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get bid statistics for several requests with one grouped query.
         
-        # Calculate amount statistics
-        amounts_query = query.filter(Bid.status == BidStatus.PENDING)
-        avg_amount = amounts_query.with_entities(func.avg(Bid.amount)).scalar()
-        min_amount = amounts_query.with_entities(func.min(Bid.amount)).scalar()
-        max_amount = amounts_query.with_entities(func.max(Bid.amount)).scalar()
+        Args:
+            request_ids: Request IDs
+            
+        Returns:
+            Dictionary of request ID -> statistics (requests without bids are left out)
+        """
+        if not request_ids:
+            return {}
         
-        return {
-            "total_bids": total,
-            "pending_bids": pending,
-            "accepted_bids": accepted,
-            "rejected_bids": rejected,
-            "withdrawn_bids": withdrawn,
-            "average_bid_amount": float(avg_amount) if avg_amount else None,
-            "lowest_bid": float(min_amount) if min_amount else None,
-            "highest_bid": float(max_amount) if max_amount else None,
-        }
+        rows = (
+            self.db.query(Bid.request_id, *self._statistics_columns())
+            .filter(Bid.request_id.in_(request_ids))
+            .group_by(Bid.request_id)
+            .all()
+        )
+        return {row[0]: self._statistics_dict(row[1:]) for row in rows}
     
     def reject_other_bids(self, request_id: int, accepted_bid_id: int) -> int:
         """
@@ -252,13 +412,20 @@ class BidRepository:
         Returns:
             Number of bids rejected
         """
-        result = self.db.query(Bid).filter(
+        contractor_ids = self.db.execute(
+            update(Bid)
+            .where(
             and_(
                 Bid.request_id == request_id,
                 Bid.id != accepted_bid_id,
                 Bid.status == BidStatus.PENDING
             )
-        ).update({"status": BidStatus.REJECTED})
+            )
+            .values(status=BidStatus.REJECTED)
+            .returning(Bid.contractor_id)
+        ).scalars().all()
         
+        self.counters.bid_changed(request_id, contractor_ids, BidStatus.PENDING, BidStatus.REJECTED)
         self.db.commit()
-        return result
+        cache.bump(request_namespace(request_id), REQUEST_FEED_NAMESPACE)
+        return len(contractor_ids)
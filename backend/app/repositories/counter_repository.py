@@ -0,0 +1,201 @@
+"""
+Counter repository for the denormalised bid and request counts.
+
+requests.bid_count / pending_bid_count and users.open_request_count /
+active_bid_count are adjusted by the repositories that write bids and
+requests, in the same transaction, so the feed and dashboards read them
+instead of running COUNT(*) queries. reconcile() recomputes them from the
+source tables (scripts/reconcile_counters.py).
+"""
+
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import and_, bindparam, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache, request_namespace, REQUEST_FEED_NAMESPACE
+from app.models.bid import Bid, BidStatus
+from app.models.request import Request, RequestStatus
+from app.models.user import User
+
+
+# Bids counted in users.active_bid_count (the ones that block a second bid)
+ACTIVE_BID_STATUSES = (BidStatus.PENDING, BidStatus.ACCEPTED)
+
+
+def _flag(condition: bool) -> int:
+    """1 if a row counts towards a counter, else 0."""
+    return 1 if condition else 0
+
+
+class CounterRepository:
+    """Repository for denormalised counter operations."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    def adjust_request(self, request_id: int, bids: int = 0, pending_bids: int = 0) -> None:
+        """
+        Add deltas to a request's bid counters (no commit).
+        
+        The counts are part of the request's payload, so updated_at moves
+        with them and ETags and delta sync pick the change up.
+        
+        Args:
+            request_id: Request ID
+            bids: Change in bid_count
+            pending_bids: Change in pending_bid_count
+        """
+        if not bids and not pending_bids:
+            return
+        requests = Request.__table__
+        self.db.execute(
+            update(requests)
+            .where(requests.c.id == request_id)
+            .values(
+                bid_count=requests.c.bid_count + bids,
+                pending_bid_count=requests.c.pending_bid_count + pending_bids
+            )
+        )
+    
+    def adjust_users(self, deltas: Dict[int, Dict[str, int]]) -> None:
+        """
+        Add deltas to users' counters in one executemany UPDATE (no commit).
+        
+        updated_at is left alone: the counters are not part of the profile.
+        
+        Args:
+            deltas: Per user ID, changes to open_requests and active_bids
+        """
+        rows = [
+            {
+                "user_id": user_id,
+                "open_requests": delta.get("open_requests", 0),
+                "active_bids": delta.get("active_bids", 0),
+            }
+            for user_id, delta in deltas.items()
+            if delta.get("open_requests") or delta.get("active_bids")
+        ]
+        if not rows:
+            return
+        users = User.__table__
+        self.db.execute(
+            update(users)
+            .where(users.c.id == bindparam("user_id"))
+            .values(
+                open_request_count=users.c.open_request_count + bindparam("open_requests"),
+                active_bid_count=users.c.active_bid_count + bindparam("active_bids"),
+                updated_at=users.c.updated_at
+            ),
+            rows
+        )
+    
+    def bid_changed(
+        self,
+        request_id: int,
+        contractor_ids: Iterable[int],
+        old_status: Optional[BidStatus],
+        new_status: Optional[BidStatus]
+    ) -> None:
+        """
+        Apply a bid status change to the counters (no commit).
+        
+        Args:
+            request_id: Request the bids belong to
+            contractor_ids: Contractor of each bid that changed
+            old_status: Status before the change, None for new bids
+            new_status: Status after the change, None for deleted bids
+        """
+        contractor_ids = list(contractor_ids)
+        bids = _flag(new_status is not None) - _flag(old_status is not None)
+        pending = _flag(new_status == BidStatus.PENDING) - _flag(old_status == BidStatus.PENDING)
+        active = _flag(new_status in ACTIVE_BID_STATUSES) - _flag(old_status in ACTIVE_BID_STATUSES)
+        
+        self.adjust_request(request_id, bids * len(contractor_ids), pending * len(contractor_ids))
+        if active:
+            deltas: Dict[int, Dict[str, int]] = {}
+            for contractor_id in contractor_ids:
+                delta = deltas.setdefault(contractor_id, {"active_bids": 0})
+                delta["active_bids"] += active
+            self.adjust_users(deltas)
+    
+    def request_changed(
+        self,
+        society_id: int,
+        old_status: Optional[RequestStatus],
+        new_status: Optional[RequestStatus]
+    ) -> None:
+        """
+        Apply a request status change to the society's counter (no commit).
+        
+        Args:
+            society_id: Society that posted the request
+            old_status: Status before the change, None for new requests
+            new_status: Status after the change, None for deleted requests
+        """
+        delta = _flag(new_status == RequestStatus.OPEN) - _flag(old_status == RequestStatus.OPEN)
+        self.adjust_users({society_id: {"open_requests": delta}})
+    
+    def reconcile(self, touch_requests: bool = True) -> Dict[str, int]:
+        """
+        Recompute every counter from the source tables and fix the ones
+        that drifted, with one set-based UPDATE per table.
+        
+        Args:
+            touch_requests: Move updated_at on corrected requests so clients
+                refetch them (off for freshly loaded data)
+        
+        Returns:
+            Number of requests and users corrected
+        """
+        requests, users, bids = Request.__table__, User.__table__, Bid.__table__
+        
+        bid_count = (
+            select(func.count()).select_from(bids)
+            .where(bids.c.request_id == requests.c.id)
+            .scalar_subquery()
+        )
+        pending_bid_count = (
+            select(func.count()).select_from(bids)
+            .where(and_(bids.c.request_id == requests.c.id, bids.c.status == BidStatus.PENDING))
+            .scalar_subquery()
+        )
+        request_values = {"bid_count": bid_count, "pending_bid_count": pending_bid_count}
+        if not touch_requests:
+            request_values["updated_at"] = requests.c.updated_at
+        fixed_requests = self.db.execute(
+            update(requests)
+            .where(or_(requests.c.bid_count != bid_count, requests.c.pending_bid_count != pending_bid_count))
+            .values(**request_values)
+            .returning(requests.c.id)
+        ).scalars().all()
+        
+        open_request_count = (
+            select(func.count()).select_from(requests)
+            .where(and_(requests.c.society_id == users.c.id, requests.c.status == RequestStatus.OPEN))
+            .scalar_subquery()
+        )
+        active_bid_count = (
+            select(func.count()).select_from(bids)
+            .where(and_(bids.c.contractor_id == users.c.id, bids.c.status.in_(ACTIVE_BID_STATUSES)))
+            .scalar_subquery()
+        )
+        fixed_users = self.db.execute(
+            update(users)
+            .where(or_(
+                users.c.open_request_count != open_request_count,
+                users.c.active_bid_count != active_bid_count
+            ))
+            .values(
+                open_request_count=open_request_count,
+                active_bid_count=active_bid_count,
+                updated_at=users.c.updated_at
+            )
+        ).rowcount
+        
+        self.db.commit()
+        if fixed_requests:
+            # Cached details and versions of the corrected requests hold the old counts
+            cache.bump(*[request_namespace(request_id) for request_id in fixed_requests], REQUEST_FEED_NAMESPACE)
+        return {"requests": len(fixed_requests), "users": fixed_users}
@@ -0,0 +1,192 @@
+"""
+Idempotency key repository for retried POST requests.
+"""
+
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, update
+
+from app.models.idempotency import IdempotencyKey
+
+
+class IdempotencyKeyRepository:
+    """Repository for idempotency keys and their stored responses."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        """
+        Get a key by its primary key.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+        
+        Returns:
+            IdempotencyKey or None
+        """
+        return self.db.get(IdempotencyKey, (user_id, key))
+    
+    def expire(self, record: IdempotencyKey, now: datetime) -> None:
+        """
+        Delete a key whose retry window has passed, so it can be claimed again.
+        
+        Args:
+            record: Key returned by get()
+            now: Current time (the row is only deleted if it expired before this)
+        """
+        self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == record.user_id,
+                IdempotencyKey.key == record.key,
+                IdempotencyKey.expires_at < now
+            )
+        )
+        self.db.commit()
+    
+    def claim(
+        self,
+        user_id: int,
+        key: str,
+        fingerprint: str,
+        claimed_at: datetime,
+        expires_at: datetime
+    ) -> bool:
+        """
+        Insert a key as in progress, unless it already exists.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+            fingerprint: Hash of the endpoint and request body
+            claimed_at: Claim time, identifying this claim
+            expires_at: When the row may be pruned
+        
+        Returns:
+            True if this call inserted the row
+        """
+        self.db.add(IdempotencyKey(
+            user_id=user_id,
+            key=key,
+            fingerprint=fingerprint,
+            created_at=claimed_at,
+            expires_at=expires_at
+        ))
+        try:
+            self.db.commit()
+            return True
+        except IntegrityError:
+            self.db.rollback()
+            return False
+    
+    def take_over(self, user_id: int, key: str, claimed_before: datetime, claimed_at: datetime) -> bool:
+        """
+        Re-claim an in-progress key whose first request never created its resource.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+            claimed_before: Only take over claims older than this
+            claimed_at: New claim time, identifying this claim
+        
+        Returns:
+            True if this call took the claim
+        """
+        result = self.db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.resource_id.is_(None),
+                IdempotencyKey.created_at < claimed_before
+            )
+            .values(created_at=claimed_at)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+    
+    def record_resource(self, user_id: int, key: str, claimed_at: datetime, resource_id: int) -> bool:
+        """
+        Link a claimed key to the resource its request created (no commit).
+        
+        Runs on the session's connection so it can be called while the
+        resource is being flushed and commits with it.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+            claimed_at: Claim time returned by claim() or take_over()
+            resource_id: ID of the created resource
+        
+        Returns:
+            False if the claim was taken over in the meantime
+        """
+        result = self.db.connection().execute(
+            update(IdempotencyKey.__table__)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.created_at == claimed_at,
+                IdempotencyKey.resource_id.is_(None)
+            )
+            .values(resource_id=resource_id)
+        )
+        return result.rowcount == 1
+    
+    def complete(self, user_id: int, key: str, status_code: int, response_body: str) -> None:
+        """
+        Store the response for a claimed key.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+            status_code: HTTP status of the response
+            response_body: JSON response body
+        """
+        self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status_code=status_code, response_body=response_body)
+        )
+        self.db.commit()
+    
+    def release(self, user_id: int, key: str, claimed_at: datetime) -> None:
+        """
+        Delete an unfinished claim so the request can be retried.
+        
+        Keys already linked to a resource are kept, so a retry replays it.
+        
+        Args:
+            user_id: Owner of the key
+            key: Idempotency-Key header value
+            claimed_at: Claim time returned by claim() or take_over()
+        """
+        self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.created_at == claimed_at,
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.resource_id.is_(None)
+            )
+        )
+        self.db.commit()
+    
+    def prune(self, before: datetime) -> int:
+        """
+        Delete expired keys.
+        
+        Args:
+            before: Delete rows that expired before this time
+        
+        Returns:
+            Number of rows deleted
+        """
+        result = self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < before))
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,279 @@
+"""
+Matching repository for the request index and recommendation feed.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, exists, func, insert, literal, select
+
+from app.models.bid import Bid, BidStatus
+from app.models.matching import (
+    ContractorMatchTerm,
+    ContractorRecommendation,
+    MatchTermType,
+    RequestMatchTerm,
+)
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.repositories.rows import RequestSummaryRow, REQUEST_SUMMARY_COLUMNS
+
+
+# (term_type, term) pair
+Term = Tuple[MatchTermType, str]
+
+
+class MatchingRepository:
+    """Repository for matching index and recommendation operations."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    def _score_columns(self):
+        """Summed term weight, and count of non-city matches, per group."""
+        score = func.sum(ContractorMatchTerm.weight)
+        non_city_matches = func.sum(
+            case((ContractorMatchTerm.term_type != MatchTermType.CITY, 1), else_=0)
+        )
+        return score, non_city_matches
+    
+    def _term_join(self):
+        """Join condition between request and contractor terms."""
+        return and_(
+            RequestMatchTerm.term_type == ContractorMatchTerm.term_type,
+            RequestMatchTerm.term == ContractorMatchTerm.term
+        )
+    
+    def index_request(self, request_id: int, terms: List[Term]) -> int:
+        """
+        Replace a request's index terms and recompute who it is recommended to.
+        
+        Args:
+            request_id: Request ID
+            terms: Terms of the (open) request
+        
+        Returns:
+            Number of contractors the request is now recommended to
+        """
+        self.db.execute(delete(RequestMatchTerm).where(RequestMatchTerm.request_id == request_id))
+        self.db.execute(
+            delete(ContractorRecommendation).where(ContractorRecommendation.request_id == request_id)
+        )
+        
+        if terms:
+            self.db.execute(
+                insert(RequestMatchTerm),
+                [
+                    {"term_type": term_type, "term": term, "request_id": request_id}
+                    for term_type, term in terms
+                ]
+            )
+        
+        # Fan out to every contractor sharing a term, in one statement
+        score, non_city_matches = self._score_columns()
+        matches = (
+            select(
+                ContractorMatchTerm.contractor_id,
+                literal(request_id),
+                score,
+                literal(datetime.utcnow())
+            )
+            .join(RequestMatchTerm, self._term_join())
+            .where(RequestMatchTerm.request_id == request_id)
+            .group_by(ContractorMatchTerm.contractor_id)
+            .having(non_city_matches > 0)
+        )
+        result = self.db.execute(
+            insert(ContractorRecommendation).from_select(
+                ["contractor_id", "request_id", "score", "created_at"],
+                matches
+            )
+        )
+        
+        self.db.commit()
+        return result.rowcount
+    
+    def remove_request(self, request_id: int) -> None:
+        """
+        Remove a request from the index and from every feed.
+        
+        Args:
+            request_id: Request ID
+        """
+        self.db.execute(delete(RequestMatchTerm).where(RequestMatchTerm.request_id == request_id))
+        self.db.execute(
+            delete(ContractorRecommendation).where(ContractorRecommendation.request_id == request_id)
+        )
+        self.db.commit()
+    
+    def index_contractor(self, contractor_id: int, terms: Dict[Term, int]) -> int:
+        """
+        Replace a contractor's profile terms and rebuild their feed.
+        
+        Args:
+            contractor_id: Contractor user ID
+            terms: Mapping of term to weight
+        
+        Returns:
+            Number of requests now recommended to the contractor
+        """
+        self.db.execute(
+            delete(ContractorMatchTerm).where(ContractorMatchTerm.contractor_id == contractor_id)
+        )
+        self.db.execute(
+            delete(ContractorRecommendation).where(ContractorRecommendation.contractor_id == contractor_id)
+        )
+        
+        if terms:
+            self.db.execute(
+                insert(ContractorMatchTerm),
+                [
+                    {"term_type": term_type, "term": term, "contractor_id": contractor_id, "weight": weight}
+                    for (term_type, term), weight in terms.items()
+                ]
+            )
+        
+        score, non_city_matches = self._score_columns()
+        matches = (
+            select(
+                literal(contractor_id),
+                RequestMatchTerm.request_id,
+                score,
+                literal(datetime.utcnow())
+            )
+            .join(ContractorMatchTerm, self._term_join())
+            .where(ContractorMatchTerm.contractor_id == contractor_id)
+            .group_by(RequestMatchTerm.request_id)
+            .having(non_city_matches > 0)
+        )
+        result = self.db.execute(
+            insert(ContractorRecommendation).from_select(
+                ["contractor_id", "request_id", "score", "created_at"],
+                matches
+            )
+        )
+        
+        self.db.commit()
+        return result.rowcount
+    
+    def get_term_weight(self, contractor_id: int, term: Term) -> Optional[int]:
+        """
+        Get the weight of one of a contractor's terms.
+        
+        Args:
+            contractor_id: Contractor user ID
+            term: (term type, term) pair
+        
+        Returns:
+            Weight, or None if the contractor does not have the term
+        """
+        term_type, value = term
+        return self.db.execute(
+            select(ContractorMatchTerm.weight).where(
+                ContractorMatchTerm.contractor_id == contractor_id,
+                ContractorMatchTerm.term_type == term_type,
+                ContractorMatchTerm.term == value
+            )
+        ).scalar_one_or_none()
+    
+    def remove_recommendation(self, contractor_id: int, request_id: int) -> None:
+        """
+        Remove one request from a contractor's feed.
+        
+        Args:
+            contractor_id: Contractor user ID
+            request_id: Request ID
+        """
+        self.db.execute(
+            delete(ContractorRecommendation).where(
+                ContractorRecommendation.contractor_id == contractor_id,
+                ContractorRecommendation.request_id == request_id
+            )
+        )
+        self.db.commit()
+    
+    def remove_contractor(self, contractor_id: int) -> None:
+        """
+        Remove a contractor's terms and feed.
+        
+        Args:
+            contractor_id: Contractor user ID
+        """
+        self.db.execute(
+            delete(ContractorMatchTerm).where(ContractorMatchTerm.contractor_id == contractor_id)
+        )
+        self.db.execute(
+            delete(ContractorRecommendation).where(ContractorRecommendation.contractor_id == contractor_id)
+        )
+        self.db.commit()
+    
+    def get_bid_categories(self, contractor_id: int) -> List[RequestCategory]:
+        """
+        Get the categories of requests a contractor has bid on.
+        
+        Args:
+            contractor_id: Contractor user ID
+        
+        Returns:
+            Distinct request categories
+        """
+        stmt = (
+            select(Request.category)
+            .join(Bid, Bid.request_id == Request.id)
+            .where(Bid.contractor_id == contractor_id)
+            .distinct()
+        )
+        return list(self.db.execute(stmt).scalars())
+    
+    def get_recommendations(
+        self,
+        contractor_id: int,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Tuple[RequestSummaryRow, float]], int]:
+        """
+        Get a contractor's recommended open requests, best match first.
+        
+        Requests the contractor already has an active bid on are skipped.
+        
+        Args:
+            contractor_id: Contractor user ID
+            skip: Pagination offset
+            limit: Page size
+        
+        Returns:
+            Tuple of (list of (request row, score), total count)
+        """
+        already_bid = exists().where(
+            Bid.request_id == ContractorRecommendation.request_id,
+            Bid.contractor_id == contractor_id,
+            Bid.status.in_([BidStatus.PENDING, BidStatus.ACCEPTED])
+        )
+        criteria = [
+            ContractorRecommendation.contractor_id == contractor_id,
+            Request.status == RequestStatus.OPEN,
+            ~already_bid,
+        ]
+        
+        total = self.db.execute(
+            select(func.count())
+            .select_from(ContractorRecommendation)
+            .join(Request, Request.id == ContractorRecommendation.request_id)
+            .where(*criteria)
+        ).scalar_one()
+        
+        stmt = (
+            select(*REQUEST_SUMMARY_COLUMNS, ContractorRecommendation.score)
+            .select_from(ContractorRecommendation)
+            .join(Request, Request.id == ContractorRecommendation.request_id)
+            .where(*criteria)
+            .order_by(ContractorRecommendation.score.desc(), Request.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = [
+            (RequestSummaryRow._make(row[:-1]), row[-1])
+            for row in self.db.execute(stmt)
+        ]
+        
+        return rows, total
@@ -0,0 +1,227 @@
+"""
+Notification repository for the outbox and user notifications.
+"""
+
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, update
+
+from app.models.notification import Notification, NotificationType, OutboxEvent
+
+
+class NotificationRepository:
+    """Repository for outbox events and notifications."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    # ------------------------------------------------------------------
+    # Outbox
+    # ------------------------------------------------------------------
+    
+    def stage_event(self, event_type: NotificationType, payload: Dict[str, Any]) -> OutboxEvent:
+        """
+        Add an outbox event to the session without committing.
+        
+        The event is committed by the caller's next repository write on the
+        same session, in the same transaction as the change it describes.
+        
+        Args:
+            event_type: Event type
+            payload: JSON-serialisable event data
+        
+        Returns:
+            Pending OutboxEvent
+        """
+        event = OutboxEvent(event_type=event_type, payload=payload)
+        self.db.add(event)
+        return event
+    
+    def claim_pending_events(self, limit: int) -> List[OutboxEvent]:
+        """
+        Lock the oldest unprocessed events.
+        
+        Rows locked by another dispatcher are skipped, so several dispatchers
+        can run at once without handling an event twice.
+        
+        Args:
+            limit: Maximum events to claim
+        
+        Returns:
+            List of OutboxEvent, oldest first
+        """
+        return (
+            self.db.query(OutboxEvent)
+            .filter(OutboxEvent.processed_at.is_(None))
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+    
+    def complete_events(self, events: List[OutboxEvent], notifications: List[Notification]) -> None:
+        """
+        Save the notifications created from claimed events and mark them processed.
+        
+        Args:
+            events: Claimed events (last_error already set on failures)
+            notifications: Notifications to insert
+        """
+        now = datetime.utcnow()
+        for event in events:
+            event.processed_at = now
+        self.db.add_all(notifications)
+        self.db.commit()
+    
+    def prune_events(self, before: datetime) -> int:
+        """
+        Delete processed events older than a cutoff.
+        
+        Args:
+            before: Delete events processed before this time
+        
+        Returns:
+            Number of events deleted
+        """
+        count = (
+            self.db.query(OutboxEvent)
+            .filter(OutboxEvent.processed_at < before)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return count
+    
+    # ------------------------------------------------------------------
+    # Digests
+    # ------------------------------------------------------------------
+    
+    def get_users_due_for_digest(self, before: datetime, limit: int) -> List[int]:
+        """
+        Get users whose oldest undelivered notification is older than a cutoff.
+        
+        Args:
+            before: Digest window start (now - window)
+            limit: Maximum users to return
+        
+        Returns:
+            List of user IDs, longest-waiting first
+        """
+        oldest = func.min(Notification.created_at)
+        rows = (
+            self.db.query(Notification.user_id)
+            .filter(Notification.delivered_at.is_(None))
+            .group_by(Notification.user_id)
+            .having(oldest <= before)
+            .order_by(oldest)
+            .limit(limit)
+            .all()
+        )
+        return [row.user_id for row in rows]
+    
+    def claim_undelivered(self, user_id: int) -> List[Notification]:
+        """
+        Lock a user's undelivered notifications, oldest first.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of Notification with user loaded (empty if another
+            dispatcher holds them)
+        """
+        return (
+            self.db.query(Notification)
+            .options(joinedload(Notification.user))
+            .filter(Notification.user_id == user_id, Notification.delivered_at.is_(None))
+            .order_by(Notification.id)
+            .with_for_update(skip_locked=True, of=Notification)
+            .all()
+        )
+    
+    def mark_delivered(self, notifications: List[Notification]) -> None:
+        """
+        Mark notifications as delivered and release their locks.
+        
+        Args:
+            notifications: Claimed notifications
+        """
+        now = datetime.utcnow()
+        for notification in notifications:
+            notification.delivered_at = now
+        self.db.commit()
+    
+    def release(self) -> None:
+        """Release claimed rows without changes (e.g. after a failed send)."""
+        self.db.rollback()
+    
+    # ------------------------------------------------------------------
+    # Inbox
+    # ------------------------------------------------------------------
+    
+    def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        unread_only: bool = False
+    ) -> tuple[List[Notification], int]:
+        """
+        Get a user's notifications, newest first.
+        
+        Args:
+            user_id: User ID
+            skip: Pagination offset
+            limit: Page size
+            unread_only: Only unread notifications
+        
+        Returns:
+            Tuple of (list of notifications, total count)
+        """
+        query = self.db.query(Notification).filter(Notification.user_id == user_id)
+        if unread_only:
+            query = query.filter(Notification.is_read.is_(False))
+        
+        total = query.count()
+        notifications = query.order_by(Notification.id.desc()).offset(skip).limit(limit).all()
+        return notifications, total
+    
+    def count_unread(self, user_id: int) -> int:
+        """
+        Count a user's unread notifications.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Number of unread notifications
+        """
+        return (
+            self.db.query(func.count(Notification.id))
+            .filter(Notification.user_id == user_id, Notification.is_read.is_(False))
+            .scalar()
+        )
+    
+    def mark_read(self, user_id: int, notification_ids: Optional[List[int]] = None) -> int:
+        """
+        Mark a user's notifications as read.
+        
+        Args:
+            user_id: User ID
+            notification_ids: Notifications to mark, or None for all
+        
+        Returns:
+            Number of notifications changed
+        """
+        stmt = (
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read.is_(False))
+            .values(is_read=True)
+        )
+        if notification_ids is not None:
+            stmt = stmt.where(Notification.id.in_(notification_ids))
+        
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
@@ -2,12 +2,26 @@
 Request repository for database operations.
 """
 
-from typing import Optional, List
+import math
+from collections import Counter
+from typing import Dict, Optional, List
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import Text, bindparam, cast, or_, and_, func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 
+from app.core.cache import cache, request_namespace, REQUEST_FEED_NAMESPACE
+from app.core.geo import GeoRadius, KM_PER_DEGREE, geohash_cells
 from app.models.request import Request, RequestStatus, RequestCategory
+from app.models.bid import Bid
+from app.models.sync import SyncEntityType, SyncTombstone
+from app.repositories.counter_repository import ACTIVE_BID_STATUSES, CounterRepository
+from app.repositories.rows import (
+    RequestRow,
+    RequestSummaryRow,
+    REQUEST_COLUMNS,
+    REQUEST_SUMMARY_COLUMNS,
+)
 
 
 class RequestRepository:
@@ -16,6 +30,7 @@ class RequestRepository:
     def __init__(self, db: Session):
         """Initialize repository with database session."""
         self.db = db
+        self.counters = CounterRepository(db)
     
     def create(self, request_data: dict) -> Request:
         """
@@ -29,8 +44,10 @@ class RequestRepository:
         """
         request = Request(**request_data)
         self.db.add(request)
+        self.counters.request_changed(request.society_id, None, request.status or RequestStatus.OPEN)
         self.db.commit()
         self.db.refresh(request)
+        cache.bump(REQUEST_FEED_NAMESPACE)
         return request
     
     def get_by_id(self, request_id: int) -> Optional[Request]:
@@ -45,48 +62,194 @@ class RequestRepository:
         """
         return self.db.query(Request).filter(Request.id == request_id).first()
     
-    def get_all(
+    def get_updated_at(self, request_id: int) -> Optional[datetime]:
+        """
+        Get the last modification time of a request without loading the row.
+        
+        Args:
+            request_id: Request ID
+            
+        Returns:
+            updated_at timestamp or None if request doesn't exist
+        """
+        return self.db.query(Request.updated_at).filter(Request.id == request_id).scalar()
+    
+    def _filter_criteria(
         self,
-        skip: int = 0,
-        limit: int = 20,
+        search_query: Optional[str] = None,
         status: Optional[RequestStatus] = None,
         category: Optional[RequestCategory] = None,
         city: Optional[str] = None,
-        state: Optional[str] = None
-    ) -> tuple[List[Request], int]:
+        state: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        near: Optional[GeoRadius] = None
+    ) -> list:
         """
-        Get all requests with optional filters and pagination.
+        Build listing/search filter criteria.
         
         Args:
-            skip: Number of records to skip
-            limit: Maximum number of records to return
+            search_query: Search in title, description and skills
             status: Filter by status
             category: Filter by category
             city: Filter by city
             state: Filter by state
+            skills: Normalised skills the request must include (all of them)
+            near: Only requests located within this circle
             
         Returns:
-            Tuple of (list of requests, total count)
+            List of SQL expressions to AND together
         """
-        query = self.db.query(Request)
+        criteria = []
+        
+        # Text search
+        if search_query:
+            search_pattern = f"%{search_query}%"
+            criteria.append(
+                or_(
+                    Request.title.ilike(search_pattern),
+                    Request.description.ilike(search_pattern),
+                    cast(Request.required_skills, Text).ilike(search_pattern)
+                )
+            )
+        
+        # Skill containment (required_skills @> '[...]'), served by the GIN index
+        if skills:
+            criteria.append(type_coerce(Request.required_skills, JSONB).contains(skills))
         
-        # Apply filters
         if status:
-            query = query.filter(Request.status == status)
+            criteria.append(Request.status == status)
         if category:
-            query = query.filter(Request.category == category)
+            criteria.append(Request.category == category)
+        
+        # Location filters
         if city:
-            query = query.filter(Request.city.ilike(f"%{city}%"))
+            criteria.append(Request.city.ilike(f"%{city}%"))
         if state:
-            query = query.filter(Request.state.ilike(f"%{state}%"))
+            criteria.append(Request.state.ilike(f"%{state}%"))
+        
+        # Radius: geohash prefix scan narrows the candidates, then an exact
+        # distance check (equirectangular, accurate to well under 1% at this scale)
+        if near:
+            criteria.append(or_(*(Request.geohash.startswith(cell) for cell in geohash_cells(near))))
+            km_per_lng_degree = KM_PER_DEGREE * math.cos(math.radians(near.latitude))
+            d_lat = (Request.latitude - near.latitude) * KM_PER_DEGREE
+            d_lng = (Request.longitude - near.longitude) * km_per_lng_degree
+            criteria.append(d_lat * d_lat + d_lng * d_lng <= near.radius_km ** 2)
         
-        # Get total count
-        total = query.count()
+        return criteria
+    
+    def _fetch_rows(
+        self,
+        criteria: list,
+        skip: int,
+        limit: int,
+        summary: bool = False
+    ) -> tuple[list, int]:
+        """
+        Fetch a page of requests as row DTOs with a Core select.
+        
+        Rows bypass the ORM, so nothing is added to the session identity map.
         
-        # Apply pagination and ordering
-        requests = query.order_by(Request.created_at.desc()).offset(skip).limit(limit).all()
+        Args:
+            criteria: Filter expressions
+            skip: Pagination offset
+            limit: Page size
+            summary: Select only the summary columns
+            
+        Returns:
+            Tuple of (list of RequestRow or RequestSummaryRow, total count)
+        """
+        row_type, columns = (
+            (RequestSummaryRow, REQUEST_SUMMARY_COLUMNS) if summary
+            else (RequestRow, REQUEST_COLUMNS)
+        )
+        
+        total = self.db.execute(select(func.count(Request.id)).where(*criteria)).scalar_one()
+        
+        stmt = (
+            select(*columns)
+            .where(*criteria)
+            .order_by(Request.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = [row_type._make(row) for row in self.db.execute(stmt)]
+        
+        return rows, total
+    
+    def get_version(
+        self,
+        search_query: Optional[str] = None,
+        status: Optional[RequestStatus] = None,
+        category: Optional[RequestCategory] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        near: Optional[GeoRadius] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get a cheap version fingerprint for a filtered request collection.
+        
+        Any insert, update or delete within the collection changes either the
+        row count or the latest updated_at, so the pair can back a collection ETag.
+        
+        Args:
+            search_query: Search in title, description and skills
+            status: Filter by status
+            category: Filter by category
+            city: Filter by city
+            state: Filter by state
+            skills: Required skills filter
+            near: Radius filter
+            
+        Returns:
+            Tuple of (row count, latest updated_at)
+        """
+        criteria = self._filter_criteria(
+            search_query=search_query,
+            status=status,
+            category=category,
+            city=city,
+            state=state,
+            skills=skills,
+            near=near
+        )
+        query = self.db.query(func.count(Request.id), func.max(Request.updated_at)).filter(*criteria)
+        count, last_updated = query.one()
+        return count, last_updated
+    
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[RequestStatus] = None,
+        category: Optional[RequestCategory] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        summary: bool = False
+    ) -> tuple[List[RequestRow], int]:
+        """
+        Get all requests with optional filters and pagination.
         
-        return requests, total
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            status: Filter by status
+            category: Filter by category
+            city: Filter by city
+            state: Filter by state
+            summary: Return RequestSummaryRow instead of RequestRow
+            
+        Returns:
+            Tuple of (list of request rows, total count)
+        """
+        criteria = self._filter_criteria(
+            status=status,
+            category=category,
+            city=city,
+            state=state
+        )
+        return self._fetch_rows(criteria, skip, limit, summary=summary)
     
     def search(
         self,
@@ -95,9 +258,12 @@ class RequestRepository:
         status: Optional[RequestStatus] = None,
         city: Optional[str] = None,
         state: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        near: Optional[GeoRadius] = None,
         skip: int = 0,
-        limit: int = 20
-    ) -> tuple[List[Request], int]:
+        limit: int = 20,
+        summary: bool = False
+    ) -> tuple[List[RequestRow], int]:
         """
         Search requests with multiple filters.
         
@@ -107,55 +273,32 @@ class RequestRepository:
             status: Filter by status
             city: Filter by city
             state: Filter by state
+            skills: Skills the request must include (all of them)
+            near: Only requests within this circle
             skip: Pagination offset
             limit: Page size
+            summary: Return RequestSummaryRow instead of RequestRow
             
         Returns:
-            Tuple of (list of requests, total count)
+            Tuple of (list of request rows, total count)
         """
-        query = self.db.query(Request)
-        
-        # Text search
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            query = query.filter(
-                or_(
-                    Request.title.ilike(search_pattern),
-                    Request.description.ilike(search_pattern),
-                    Request.required_skills.ilike(search_pattern)
-                )
-            )
-        
-        # Category filter
-        if category:
-            query = query.filter(Request.category == category)
-        
-        # Status filter
-        if status:
-            query = query.filter(Request.status == status)
-        
-        # Location filters
-        if city:
-            query = query.filter(Request.city.ilike(f"%{city}%"))
-        if state:
-            query = query.filter(Request.state.ilike(f"%{state}%"))
-        
-        
-        
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination and ordering
-        requests = query.order_by(Request.created_at.desc()).offset(skip).limit(limit).all()
-        
-        return requests, total
+        criteria = self._filter_criteria(
+            search_query=search_query,
+            status=status,
+            category=category,
+            city=city,
+            state=state,
+            skills=skills,
+            near=near
+        )
+        return self._fetch_rows(criteria, skip, limit, summary=summary)
     
     def get_by_society(
         self,
         society_id: int,
         skip: int = 0,
         limit: int = 20
-    ) -> tuple[List[Request], int]:
+    ) -> tuple[List[RequestRow], int]:
         """
         Get requests posted by a specific society.
         
@@ -165,19 +308,16 @@ class RequestRepository:
             limit: Page size
             
         Returns:
-            Tuple of (list of requests, total count)
+            Tuple of (list of request rows, total count)
         """
-        query = self.db.query(Request).filter(Request.society_id == society_id)
-        total = query.count()
-        requests = query.order_by(Request.created_at.desc()).offset(skip).limit(limit).all()
-        return requests, total
+        return self._fetch_rows([Request.society_id == society_id], skip, limit)
     
     def get_by_contractor(
         self,
         contractor_id: int,
         skip: int = 0,
         limit: int = 20
-    ) -> tuple[List[Request], int]:
+    ) -> tuple[List[RequestRow], int]:
         """
         Get requests assigned to a specific contractor.
         
@@ -187,12 +327,9 @@ class RequestRepository:
             limit: Page size
             
         Returns:
-            Tuple of (list of requests, total count)
+            Tuple of (list of request rows, total count)
         """
-        query = self.db.query(Request).filter(Request.assigned_contractor_id == contractor_id)
-        total = query.count()
-        requests = query.order_by(Request.created_at.desc()).offset(skip).limit(limit).all()
-        return requests, total
+        return self._fetch_rows([Request.assigned_contractor_id == contractor_id], skip, limit)
     
     def update(self, request: Request, update_data: dict) -> Request:
         """
@@ -205,13 +342,17 @@ class RequestRepository:
         Returns:
             Updated Request object
         """
+        old_status = request.status
         for key, value in update_data.items():
             if value is not None and hasattr(request, key):
                 setattr(request, key, value)
         
+        if request.status != old_status:
+            self.counters.request_changed(request.society_id, old_status, request.status)
         request.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(request)
+        cache.bump(request_namespace(request.id), REQUEST_FEED_NAMESPACE)
         return request
     
     def update_status(
@@ -231,6 +372,8 @@ class RequestRepository:
         Returns:
             Updated Request object
         """
+        if request.status != status:
+            self.counters.request_changed(request.society_id, request.status, status)
         request.status = status
         
         if status == RequestStatus.IN_PROGRESS:
@@ -243,6 +386,7 @@ class RequestRepository:
         request.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(request)
+        cache.bump(request_namespace(request.id), REQUEST_FEED_NAMESPACE)
         return request
     
     def delete(self, request: Request) -> bool:
@@ -255,10 +399,55 @@ class RequestRepository:
         Returns:
             True if successful
         """
+        request_id = request.id
+        # Its bids go with it: release the contractors' active bid counts
+        contractor_ids = self.db.scalars(
+            select(Bid.contractor_id).where(
+                Bid.request_id == request_id,
+                Bid.status.in_(ACTIVE_BID_STATUSES)
+            )
+        ).all()
+        self.counters.adjust_users({
+            contractor_id: {"active_bids": -count}
+            for contractor_id, count in Counter(contractor_ids).items()
+        })
+        self.counters.request_changed(request.society_id, request.status, None)
         self.db.delete(request)
+        # Requests are public, so every client is told; their bids go with them
+        self.db.add(SyncTombstone(entity_type=SyncEntityType.REQUEST, entity_id=request_id))
         self.db.commit()
+        cache.bump(request_namespace(request_id), REQUEST_FEED_NAMESPACE)
         return True
     
+    def increment_view_counts(self, views: Dict[int, int]) -> int:
+        """
+        Add buffered view counts in one executemany UPDATE.
+        
+        updated_at is left alone and the cache is not bumped: a view does
+        not change what clients see, so ETags and delta sync stay valid.
+        
+        Args:
+            views: Views to add per request ID
+            
+        Returns:
+            Number of requests written
+        """
+        if not views:
+            return 0
+        
+        requests = Request.__table__
+        self.db.execute(
+            update(requests)
+            .where(requests.c.id == bindparam("request_id"))
+            .values(
+                view_count=requests.c.view_count + bindparam("views"),
+                updated_at=requests.c.updated_at
+            ),
+            [{"request_id": request_id, "views": count} for request_id, count in views.items()]
+        )
+        self.db.commit()
+        return len(views)
+    
     def count_by_status(self, status: RequestStatus) -> int:
         """
         Count requests by status.
@@ -0,0 +1,72 @@
+"""
+Revoked token repository for logout and the revocation filter.
+"""
+
+from typing import List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, select
+
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    """Repository for revoked token IDs."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    def revoke(self, jti: str, expires_at: datetime, user_id: Optional[int] = None) -> None:
+        """
+        Record a token ID as revoked (idempotent).
+        
+        Args:
+            jti: Token ID
+            expires_at: When the token expires anyway
+            user_id: Owner of the token
+        """
+        self.db.merge(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+        self.db.commit()
+    
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token ID is revoked.
+        
+        Args:
+            jti: Token ID
+        
+        Returns:
+            True if revoked
+        """
+        return self.db.execute(select(exists().where(RevokedToken.jti == jti))).scalar()
+    
+    def get_revoked_since(self, since: Optional[datetime], now: datetime) -> List[tuple]:
+        """
+        Get unexpired revocations recorded at or after a time.
+        
+        Args:
+            since: Only revocations at or after this time (None for all)
+            now: Current time; tokens already expired are skipped
+        
+        Returns:
+            List of (jti, revoked_at) rows
+        """
+        stmt = select(RevokedToken.jti, RevokedToken.revoked_at).where(RevokedToken.expires_at > now)
+        if since is not None:
+            stmt = stmt.where(RevokedToken.revoked_at >= since)
+        return self.db.execute(stmt).all()
+    
+    def prune(self, before: datetime) -> int:
+        """
+        Delete revocations of tokens that have expired.
+        
+        Args:
+            before: Delete rows whose token expired before this time
+        
+        Returns:
+            Number of rows deleted
+        """
+        result = self.db.execute(delete(RevokedToken).where(RevokedToken.expires_at < before))
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,84 @@
+"""
+Lightweight row DTOs for read-only listings.
+
+Listing queries select these columns with Core statements and map each row
+into a named tuple, so no ORM instances are built or tracked in the session
+identity map. Field names match the model attributes, so the serializers in
+app.schemas.serializers accept either form.
+"""
+
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole, UserStatus
+
+
+class RequestRow(NamedTuple):
+    """Read-only request row with every RequestResponse column."""
+    id: int
+    society_id: int
+    assigned_contractor_id: Optional[int]
+    title: str
+    description: str
+    category: RequestCategory
+    status: RequestStatus
+    location: Optional[str]
+    city: str
+    state: str
+    pincode: Optional[str]
+    estimated_duration_days: Optional[int]
+    required_skills: Optional[List[str]]
+    preferred_start_date: Optional[datetime]
+    images: Optional[List[str]]
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    bid_count: int
+    pending_bid_count: int
+
+
+class RequestSummaryRow(NamedTuple):
+    """Read-only request row with the feed card columns only."""
+    id: int
+    society_id: int
+    assigned_contractor_id: Optional[int]
+    title: str
+    category: RequestCategory
+    status: RequestStatus
+    city: str
+    state: str
+    pincode: Optional[str]
+    estimated_duration_days: Optional[int]
+    preferred_start_date: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    bid_count: int
+    pending_bid_count: int
+
+
+class UserRow(NamedTuple):
+    """Read-only user row with the public UserResponse columns."""
+    id: int
+    phone_number: str
+    email: Optional[str]
+    name: Optional[str]
+    role: UserRole
+    status: UserStatus
+    profile_image: Optional[str]
+    description: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    is_verified: bool
+    is_active: bool
+    created_at: datetime
+    last_login_at: Optional[datetime]
+
+
+# Column lists in DTO field order, for select(*COLUMNS)
+REQUEST_COLUMNS = tuple(getattr(Request, name) for name in RequestRow._fields)
+REQUEST_SUMMARY_COLUMNS = tuple(getattr(Request, name) for name in RequestSummaryRow._fields)
+USER_COLUMNS = tuple(getattr(User, name) for name in UserRow._fields)
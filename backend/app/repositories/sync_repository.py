@@ -0,0 +1,175 @@
+"""
+Sync repository for delta-sync change feeds.
+"""
+
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, exists, or_, select, tuple_
+
+from app.models.bid import Bid
+from app.models.request import Request, RequestStatus
+from app.models.sync import SyncTombstone
+from app.models.user import User, UserRole
+from app.repositories.rows import RequestRow, REQUEST_COLUMNS
+
+
+# Keyset position: (updated_at, id) of the last row a client has seen
+Position = Tuple[datetime, int]
+
+
+class SyncRepository:
+    """Repository for delta-sync queries."""
+    
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+    
+    def _request_scope(self, user: User, initial: bool) -> list:
+        """
+        Requests a user's client keeps locally.
+        
+        Societies keep their own requests. Contractors keep the public feed:
+        a first sync sends open requests plus those they are assigned to or
+        bid on, and later syncs send every changed request, so one that
+        leaves the feed still reaches the client with its new status.
+        
+        Args:
+            user: Syncing user
+            initial: Whether a first sync is in progress
+        
+        Returns:
+            List of SQL expressions to AND together
+        """
+        if user.role == UserRole.SOCIETY:
+            return [Request.society_id == user.id]
+        if user.role == UserRole.CONTRACTOR and initial:
+            has_bid = exists().where(Bid.request_id == Request.id, Bid.contractor_id == user.id)
+            return [or_(
+                Request.status == RequestStatus.OPEN,
+                Request.assigned_contractor_id == user.id,
+                has_bid
+            )]
+        return []
+    
+    def _bid_scope(self, user: User) -> list:
+        """Bids a user's client keeps: their own, or those on their requests."""
+        if user.role == UserRole.CONTRACTOR:
+            return [Bid.contractor_id == user.id]
+        if user.role == UserRole.SOCIETY:
+            return [Bid.request.has(Request.society_id == user.id)]
+        return []
+    
+    def get_changed_requests(
+        self,
+        user: User,
+        after: Optional[Position],
+        until: datetime,
+        limit: int,
+        initial: bool = False
+    ) -> List[RequestRow]:
+        """
+        Get requests changed after a keyset position, oldest change first.
+        
+        Args:
+            user: Syncing user
+            after: Last (updated_at, id) the client has, or None for a first sync
+            until: Only rows updated at or before this time
+            limit: Maximum rows to return
+            initial: Whether a first sync is in progress
+        
+        Returns:
+            List of RequestRow
+        """
+        criteria = self._request_scope(user, initial)
+        criteria.append(Request.updated_at <= until)
+        if after:
+            criteria.append(tuple_(Request.updated_at, Request.id) > tuple_(*after))
+        
+        stmt = (
+            select(*REQUEST_COLUMNS)
+            .where(*criteria)
+            .order_by(Request.updated_at, Request.id)
+            .limit(limit)
+        )
+        return [RequestRow._make(row) for row in self.db.execute(stmt)]
+    
+    def get_changed_bids(
+        self,
+        user: User,
+        after: Optional[Position],
+        until: datetime,
+        limit: int
+    ) -> List[Bid]:
+        """
+        Get bids changed after a keyset position, oldest change first.
+        
+        Args:
+            user: Syncing user
+            after: Last (updated_at, id) the client has, or None for a first sync
+            until: Only rows updated at or before this time
+            limit: Maximum rows to return
+        
+        Returns:
+            List of Bid objects with contractor loaded
+        """
+        criteria = self._bid_scope(user)
+        criteria.append(Bid.updated_at <= until)
+        if after:
+            criteria.append(tuple_(Bid.updated_at, Bid.id) > tuple_(*after))
+        
+        return (
+            self.db.query(Bid)
+            .options(joinedload(Bid.contractor))
+            .filter(*criteria)
+            .order_by(Bid.updated_at, Bid.id)
+            .limit(limit)
+            .all()
+        )
+    
+    def get_tombstones(
+        self,
+        user: User,
+        after: Optional[Position],
+        until: datetime,
+        limit: int
+    ) -> List[SyncTombstone]:
+        """
+        Get deletions recorded after a keyset position, oldest first.
+        
+        Args:
+            user: Syncing user
+            after: Last (deleted_at, id) the client has seen
+            until: Only deletions at or before this time
+            limit: Maximum rows to return
+        
+        Returns:
+            List of SyncTombstone
+        """
+        criteria = [SyncTombstone.deleted_at <= until]
+        if user.role != UserRole.ADMIN:
+            criteria.append(or_(SyncTombstone.user_id.is_(None), SyncTombstone.user_id == user.id))
+        if after:
+            criteria.append(tuple_(SyncTombstone.deleted_at, SyncTombstone.id) > tuple_(*after))
+        
+        return (
+            self.db.query(SyncTombstone)
+            .filter(*criteria)
+            .order_by(SyncTombstone.deleted_at, SyncTombstone.id)
+            .limit(limit)
+            .all()
+        )
+    
+    def prune_tombstones(self, before: datetime) -> int:
+        """
+        Delete tombstones older than the retention window.
+        
+        Args:
+            before: Delete tombstones recorded before this time
+        
+        Returns:
+            Number of tombstones deleted
+        """
+        result = self.db.execute(delete(SyncTombstone).where(SyncTombstone.deleted_at < before))
+        self.db.commit()
+        return result.rowcount
@@ -2,12 +2,13 @@
 User repository for database operations.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import bindparam, case, or_, select, update
 
 from app.models.user import User, UserRole, UserStatus
+from app.repositories.rows import UserRow, USER_COLUMNS
 
 
 class UserRepository:
@@ -120,6 +121,39 @@ class UserRepository:
         self.db.refresh(user)
         return user
     
+    def bulk_update_last_login(self, logins: Dict[int, datetime]) -> int:
+        """
+        Record buffered login times in one executemany UPDATE.
+        
+        A row keeps its later timestamp if it already has one, and
+        updated_at is left alone: a login is not a profile change for sync.
+        
+        Args:
+            logins: Latest login time per user ID
+            
+        Returns:
+            Number of users written
+        """
+        if not logins:
+            return 0
+        
+        users = User.__table__
+        login_at = bindparam("login_at")
+        self.db.execute(
+            update(users)
+            .where(users.c.id == bindparam("user_id"))
+            .values(
+                last_login_at=case(
+                    (or_(users.c.last_login_at.is_(None), users.c.last_login_at < login_at), login_at),
+                    else_=users.c.last_login_at
+                ),
+                updated_at=users.c.updated_at
+            ),
+            [{"user_id": user_id, "login_at": at} for user_id, at in logins.items()]
+        )
+        self.db.commit()
+        return len(logins)
+    
     def verify_user(self, user: User) -> User:
         """
         Mark user as verified.
@@ -181,18 +215,22 @@ class UserRepository:
         self.deactivate(user)
         return True
     
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[UserRow]:
         """
-        Get all users with pagination.
+        Get all users with pagination as read-only rows.
+        
+        Uses a Core select, so no User objects are built or tracked in the
+        session.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
             
         Returns:
-            List of User objects
+            List of UserRow tuples
         """
-        return self.db.query(User).offset(skip).limit(limit).all()
+        stmt = select(*USER_COLUMNS).order_by(User.id).offset(skip).limit(limit)
+        return [UserRow._make(row) for row in self.db.execute(stmt)]
     
     def get_by_role(self, role: UserRole, skip: int = 0, limit: int = 100) -> List[User]:
         """
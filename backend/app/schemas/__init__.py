@@ -26,6 +26,11 @@ from app.schemas.request import (
     RequestResponse,
     RequestListResponse,
     RequestSearchFilters,
+    RequestSummaryResponse,
+    RequestSummaryListResponse,
+    RequestView,
+    RecommendedRequestResponse,
+    RecommendedRequestListResponse,
 )
 from app.schemas.bid import (
     BidCreate,
@@ -35,6 +40,14 @@ from app.schemas.bid import (
     BidListResponse,
     BidStatistics,
 )
+from app.schemas.sync import (
+    SyncDeleted,
+    SyncResponse,
+)
+from app.schemas.dashboard import (
+    SocietyDashboardResponse,
+    ContractorDashboardResponse,
+)
 
 __all__ = [
     "UserCreate",
@@ -54,10 +67,19 @@ __all__ = [
     "RequestResponse",
     "RequestListResponse",
     "RequestSearchFilters",
+    "RequestSummaryResponse",
+    "RequestSummaryListResponse",
+    "RequestView",
+    "RecommendedRequestResponse",
+    "RecommendedRequestListResponse",
     "BidCreate",
     "BidUpdate",
     "BidStatusUpdate",
     "BidResponse",
     "BidListResponse",
     "BidStatistics",
+    "SyncDeleted",
+    "SyncResponse",
+    "SocietyDashboardResponse",
+    "ContractorDashboardResponse",
 ]
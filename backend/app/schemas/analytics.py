@@ -0,0 +1,77 @@
+"""
+Analytics schemas for the admin dashboard endpoints.
+"""
+
+import enum
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RequestAnalyticsGroup(str, enum.Enum):
+    """Dimensions requests can be counted by."""
+    DAY = "day"
+    STATUS = "status"
+    CATEGORY = "category"
+    CITY = "city"
+
+
+class BidAnalyticsGroup(str, enum.Enum):
+    """Dimensions bids can be counted by."""
+    DAY = "day"
+    STATUS = "status"
+
+
+class UserAnalyticsGroup(str, enum.Enum):
+    """Dimensions users can be counted by."""
+    ROLE = "role"
+    CITY = "city"
+
+
+class AnalyticsBucket(BaseModel):
+    """Count for one value of the grouped dimension."""
+    
+    key: str = Field(..., description="Dimension value (ISO date when grouped by day; '' for users without a city)")
+    count: int
+    amount_total: Optional[float] = Field(None, description="Summed bid amount (bids only)")
+    average_amount: Optional[float] = Field(None, description="Average bid amount (bids only)")
+
+
+class AnalyticsResponse(BaseModel):
+    """Schema for a grouped count."""
+    
+    group_by: str
+    buckets: List[AnalyticsBucket]
+    total: int = Field(..., description="Sum over all buckets")
+    refreshed_at: Optional[datetime] = Field(None, description="When the summary was last refreshed")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "group_by": "status",
+                "buckets": [
+                    {"key": "open", "count": 1200},
+                    {"key": "in_progress", "count": 310},
+                    {"key": "completed", "count": 2875}
+                ],
+                "total": 4385,
+                "refreshed_at": "2025-12-28T10:05:00"
+            }
+        }
+
+
+class AnalyticsRefreshResult(BaseModel):
+    """Outcome of refreshing one summary table."""
+    
+    name: str
+    full: bool = Field(..., description="Rebuilt from scratch rather than by changed days")
+    days: Optional[int] = Field(None, description="Creation days recomputed (incremental refreshes)")
+    rows: int = Field(..., description="Summary rows written")
+    refreshed_at: datetime
+
+
+class AnalyticsRefreshResponse(BaseModel):
+    """Schema for a refresh run."""
+    
+    tables: List[AnalyticsRefreshResult]
+    ms: float = Field(..., description="Duration of the whole refresh")
@@ -7,6 +7,8 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.bid import BidStatus
+from app.models.user import User
+from app.schemas.serializers import serialize_bid_contractor
 
 
 class BidCreate(BaseModel):
@@ -96,6 +98,14 @@ class BidResponse(BaseModel):
     # Nested contractor info
     contractor: Optional[dict] = None
     
+    @field_validator("contractor", mode="before")
+    @classmethod
+    def serialize_contractor(cls, v):
+        """Convert the contractor relationship into its public summary."""
+        if isinstance(v, User):
+            return serialize_bid_contractor(v)
+        return v
+    
     class Config:
         from_attributes = True
         json_schema_extra = {
@@ -0,0 +1,48 @@
+"""
+Dashboard schemas for the mobile home-screen endpoints.
+"""
+
+from typing import Dict
+from pydantic import BaseModel, Field
+
+from app.schemas.bid import BidListResponse, BidStatistics
+from app.schemas.request import RequestListResponse
+
+
+class SocietyDashboardResponse(BaseModel):
+    """Schema for a society's home screen."""
+    
+    open_requests: int = Field(..., description="Open requests posted by the society")
+    requests: RequestListResponse = Field(..., description="First page of the society's requests")
+    bid_statistics: Dict[str, BidStatistics] = Field(
+        ...,
+        description="Bid statistics for each request on the page, keyed by request ID"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "open_requests": 2,
+                "requests": {"total": 3, "page": 1, "page_size": 20, "requests": []},
+                "bid_statistics": {
+                    "12": {
+                        "total_bids": 5,
+                        "pending_bids": 3,
+                        "accepted_bids": 0,
+                        "rejected_bids": 1,
+                        "withdrawn_bids": 1,
+                        "average_bid_amount": 42000.00,
+                        "lowest_bid": 38000.00,
+                        "highest_bid": 48000.00
+                    }
+                }
+            }
+        }
+
+
+class ContractorDashboardResponse(BaseModel):
+    """Schema for a contractor's home screen."""
+    
+    active_bids: int = Field(..., description="Pending or accepted bids submitted by the contractor")
+    bids: BidListResponse = Field(..., description="First page of the contractor's bids")
+    assigned: RequestListResponse = Field(..., description="First page of requests assigned to the contractor")
@@ -0,0 +1,57 @@
+"""
+Notification schemas for API requests and responses.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.models.notification import NotificationType
+
+
+class NotificationResponse(BaseModel):
+    """Schema for a notification."""
+    
+    id: int
+    type: NotificationType
+    title: str
+    body: str
+    data: Optional[Dict[str, Any]] = Field(None, description="Related IDs, e.g. request_id")
+    is_read: bool
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "type": "bid.submitted",
+                "title": "New bid received",
+                "body": "John Contractor bid ₹45,000 on \"Fix leaking pipes\".",
+                "data": {"request_id": 1, "contractor_id": 2},
+                "is_read": False,
+                "created_at": "2025-12-28T10:00:00"
+            }
+        }
+
+
+class NotificationListResponse(BaseModel):
+    """Schema for paginated notification list response."""
+    
+    notifications: List[NotificationResponse]
+    total: int = Field(..., description="Total number of notifications")
+    unread: int = Field(..., description="Number of unread notifications")
+    page: int = Field(..., description="Current page number", ge=1)
+    page_size: int = Field(..., description="Number of items per page", ge=1, le=100)
+
+
+class NotificationReadRequest(BaseModel):
+    """Schema for marking notifications as read."""
+    
+    ids: Optional[List[int]] = Field(None, description="Notifications to mark; omit to mark all")
+
+
+class NotificationReadResponse(BaseModel):
+    """Schema for the mark-as-read result."""
+    
+    updated: int = Field(..., description="Number of notifications marked as read")
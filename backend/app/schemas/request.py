@@ -2,13 +2,42 @@
 Request-related Pydantic schemas for validation.
 """
 
+import enum
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 from pydantic import BaseModel, Field, validator
 
+from app.core.geo import normalize_pincode
 from app.models.request import RequestCategory, RequestStatus
 
 
+def normalize_skills(value: Union[str, List[str], None]) -> Optional[List[str]]:
+    """
+    Normalise skills to a de-duplicated list of trimmed, lower-case names.
+    
+    Accepts a list or a comma-separated string (list items may also contain
+    commas), so "Plumbing, tiling" and ["plumbing", "Tiling"] are equal.
+    """
+    if value is None:
+        return None
+    items = [value] if isinstance(value, str) else value
+    skills = []
+    for item in items:
+        for part in str(item).split(","):
+            skill = part.strip().lower()
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills
+
+
+def normalize_images(value: Union[str, List[str], None]) -> Optional[List[str]]:
+    """Normalise images to a list of trimmed URLs from a list or comma-separated string."""
+    if value is None:
+        return None
+    items = value.split(",") if isinstance(value, str) else value
+    return [item.strip() for item in items if item and item.strip()]
+
+
 class RequestBase(BaseModel):
     """Base request schema."""
     title: str = Field(..., min_length=5, max_length=255, description="Request title")
@@ -39,10 +68,19 @@ class RequestCreate(RequestBase):
     location: Optional[str] = Field(None, description="Detailed location/address")
     pincode: Optional[str] = Field(None, max_length=10, description="Postal code")
     estimated_duration_days: Optional[int] = Field(None, ge=1, description="Estimated work duration in days")
-    required_skills: Optional[str] = Field(None, description="Required skills (comma-separated)")
+    required_skills: Optional[List[str]] = Field(None, description="Required skills (list or comma-separated string)")
     preferred_start_date: Optional[datetime] = Field(None, description="Preferred start date")
-    images: Optional[str] = Field(None, description="Image URLs (comma-separated)")
+    images: Optional[List[str]] = Field(None, description="Image URLs (list or comma-separated string)")
     
+    @validator('required_skills', pre=True)
+    def validate_required_skills(cls, v):
+        """Normalise skills to lower-case list items."""
+        return normalize_skills(v)
+    
+    @validator('images', pre=True)
+    def validate_images(cls, v):
+        """Normalise image URLs to a list."""
+        return normalize_images(v)
     
     class Config:
         json_schema_extra = {
@@ -71,9 +109,19 @@ class RequestUpdate(BaseModel):
     state: Optional[str] = Field(None, min_length=2, max_length=100)
     pincode: Optional[str] = Field(None, max_length=10)
     estimated_duration_days: Optional[int] = Field(None, ge=1)
-    required_skills: Optional[str] = None
+    required_skills: Optional[List[str]] = None
     preferred_start_date: Optional[datetime] = None
-    images: Optional[str] = None
+    images: Optional[List[str]] = None
+    
+    @validator('required_skills', pre=True)
+    def validate_required_skills(cls, v):
+        """Normalise skills to lower-case list items."""
+        return normalize_skills(v)
+    
+    @validator('images', pre=True)
+    def validate_images(cls, v):
+        """Normalise image URLs to a list."""
+        return normalize_images(v)
     
     class Config:
         json_schema_extra = {
@@ -119,11 +167,23 @@ class RequestResponse(BaseModel):
     updated_at: datetime
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
+    bid_count: int = 0
+    pending_bid_count: int = 0
     
     # Computed fields
     image_list: Optional[List[str]] = None
     skill_list: Optional[List[str]] = None
     
+    @validator('required_skills', pre=True)
+    def join_required_skills(cls, v):
+        """Render stored skills as a comma-separated string."""
+        return ", ".join(v) if isinstance(v, list) else v
+    
+    @validator('images', pre=True)
+    def join_images(cls, v):
+        """Render stored image URLs as a comma-separated string."""
+        return ",".join(v) if isinstance(v, list) else v
+    
     class Config:
         from_attributes = True
         json_schema_extra = {
@@ -142,6 +202,95 @@ class RequestResponse(BaseModel):
         }
 
 
+class RequestView(str, enum.Enum):
+    """Projection of requests returned by list endpoints."""
+    SUMMARY = "summary"  # Feed card fields only
+    FULL = "full"        # Every column, as in RequestResponse
+
+
+class RequestSummaryResponse(BaseModel):
+    """
+    Schema for a request in feed listings.
+    
+    Omits the unbounded text fields (description, location, required_skills,
+    images); fetch GET /requests/{id} for the full request.
+    """
+    id: int
+    society_id: int
+    assigned_contractor_id: Optional[int]
+    title: str
+    category: RequestCategory
+    status: RequestStatus
+    city: str
+    state: str
+    pincode: Optional[str]
+    estimated_duration_days: Optional[int]
+    preferred_start_date: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    bid_count: int = 0  # Shown as "N bids" on feed cards
+    pending_bid_count: int = 0
+    
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "society_id": 2,
+                "assigned_contractor_id": None,
+                "title": "Bathroom Renovation Required",
+                "category": "renovation",
+                "status": "open",
+                "city": "Mumbai",
+                "state": "Maharashtra",
+                "created_at": "2025-12-28T10:00:00"
+            }
+        }
+
+
+class RequestSummaryListResponse(BaseModel):
+    """Schema for a page of request summaries."""
+    total: int
+    page: int
+    page_size: int
+    requests: List[RequestSummaryResponse]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 25,
+                "page": 1,
+                "page_size": 10,
+                "requests": []
+            }
+        }
+
+
+class RecommendedRequestResponse(RequestSummaryResponse):
+    """Schema for a request in a contractor's recommendation feed."""
+    match_score: float = Field(..., description="Summed weight of matched category, skill and city terms")
+
+
+class RecommendedRequestListResponse(BaseModel):
+    """Schema for a page of recommended requests."""
+    total: int
+    page: int
+    page_size: int
+    requests: List[RecommendedRequestResponse]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 4,
+                "page": 1,
+                "page_size": 20,
+                "requests": []
+            }
+        }
+
+
 class RequestListResponse(BaseModel):
     """Schema for list of requests with pagination."""
     total: int
@@ -167,6 +316,26 @@ class RequestSearchFilters(BaseModel):
     city: Optional[str] = None
     state: Optional[str] = None
     search_query: Optional[str] = Field(None, description="Search in title and description")
+    skills: Optional[List[str]] = Field(None, description="Required skills the request must include (all of them)")
+    near_pincode: Optional[str] = Field(None, description="Only requests within radius_km of this pincode")
+    radius_km: float = Field(10, gt=0, le=100, description="Search radius around near_pincode, in km")
+    skip: int = Field(0, ge=0, description="Records to skip")
+    limit: int = Field(20, ge=1, le=100, description="Records to return")
+    
+    @validator('skills', pre=True)
+    def validate_skills(cls, v):
+        """Normalise skills; an empty list means no skill filter."""
+        return normalize_skills(v) or None
+    
+    @validator('near_pincode')
+    def validate_near_pincode(cls, v):
+        """Pincode must be six digits."""
+        if v is None:
+            return None
+        pincode = normalize_pincode(v)
+        if not pincode:
+            raise ValueError('Pincode must be 6 digits')
+        return pincode
     
     class Config:
         json_schema_extra = {
@@ -174,5 +343,8 @@ class RequestSearchFilters(BaseModel):
                 "category": "renovation",
                 "status": "open",
                 "city": "Mumbai",
+                "skills": ["plumbing", "tiling"],
+                "near_pincode": "400053",
+                "radius_km": 10,
             }
         }
@@ -0,0 +1,256 @@
+"""
+Fast serializers for list payloads.
+
+These build JSON-compatible dicts straight from ORM objects or the row DTOs
+in app.repositories.rows, producing the same shape as the Pydantic response
+models (RequestResponse, BidResponse, ...) without running model validation
+for every row. Datetimes are emitted as ISO 8601 strings and enums as their
+values, so the payloads can be cached in Redis or rendered by
+FastJSONResponse as-is.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from app.models.bid import Bid
+from app.models.request import Request
+from app.models.user import User
+from app.repositories.rows import RequestRow, RequestSummaryRow, UserRow
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601."""
+    return value.isoformat() if value is not None else None
+
+
+def _join(values: Optional[list], separator: str) -> Optional[str]:
+    """Render a stored list as the comma-separated string the API exposes."""
+    return separator.join(values) if values is not None else None
+
+
+def serialize_request(request: Union[Request, RequestRow]) -> Dict[str, Any]:
+    """
+    Serialize a request like RequestResponse.
+    
+    Args:
+        request: Request ORM object or RequestRow
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "id": request.id,
+        "society_id": request.society_id,
+        "assigned_contractor_id": request.assigned_contractor_id,
+        "title": request.title,
+        "description": request.description,
+        "category": request.category.value,
+        "status": request.status.value,
+        "location": request.location,
+        "city": request.city,
+        "state": request.state,
+        "pincode": request.pincode,
+        "estimated_duration_days": request.estimated_duration_days,
+        "required_skills": _join(request.required_skills, ", "),
+        "preferred_start_date": _iso(request.preferred_start_date),
+        "images": _join(request.images, ","),
+        "created_at": _iso(request.created_at),
+        "updated_at": _iso(request.updated_at),
+        "started_at": _iso(request.started_at),
+        "completed_at": _iso(request.completed_at),
+        "bid_count": request.bid_count,
+        "pending_bid_count": request.pending_bid_count,
+        "image_list": list(request.images or []),
+        "skill_list": list(request.required_skills or []),
+    }
+
+
+def serialize_request_summary(request: Union[Request, RequestSummaryRow]) -> Dict[str, Any]:
+    """
+    Serialize a request like RequestSummaryResponse.
+    
+    Only touches the summary columns, so it accepts a RequestSummaryRow.
+    
+    Args:
+        request: Request ORM object or RequestSummaryRow
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "id": request.id,
+        "society_id": request.society_id,
+        "assigned_contractor_id": request.assigned_contractor_id,
+        "title": request.title,
+        "category": request.category.value,
+        "status": request.status.value,
+        "city": request.city,
+        "state": request.state,
+        "pincode": request.pincode,
+        "estimated_duration_days": request.estimated_duration_days,
+        "preferred_start_date": _iso(request.preferred_start_date),
+        "created_at": _iso(request.created_at),
+        "updated_at": _iso(request.updated_at),
+        "started_at": _iso(request.started_at),
+        "completed_at": _iso(request.completed_at),
+        "bid_count": request.bid_count,
+        "pending_bid_count": request.pending_bid_count,
+    }
+
+
+def serialize_request_list(
+    requests: Iterable[Union[Request, RequestRow, RequestSummaryRow]],
+    total: int,
+    skip: int,
+    limit: int,
+    summary: bool = False
+) -> Dict[str, Any]:
+    """
+    Serialize a page of requests like RequestListResponse.
+    
+    Args:
+        requests: Request objects or row DTOs on the page
+        total: Total matching requests
+        skip: Pagination offset
+        limit: Page size
+        summary: Emit RequestSummaryResponse items instead of full requests
+    
+    Returns:
+        JSON-compatible dict
+    """
+    serialize = serialize_request_summary if summary else serialize_request
+    return {
+        "total": total,
+        "page": skip // limit + 1,
+        "page_size": limit,
+        "requests": [serialize(request) for request in requests],
+    }
+
+
+def serialize_recommendation_list(
+    rows: Iterable[Tuple[RequestSummaryRow, float]],
+    total: int,
+    skip: int,
+    limit: int
+) -> Dict[str, Any]:
+    """
+    Serialize a page of recommendations like RecommendedRequestListResponse.
+    
+    Args:
+        rows: (request summary row, match score) pairs
+        total: Total recommended requests
+        skip: Pagination offset
+        limit: Page size
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "total": total,
+        "page": skip // limit + 1,
+        "page_size": limit,
+        "requests": [
+            {**serialize_request_summary(request), "match_score": score}
+            for request, score in rows
+        ],
+    }
+
+
+def serialize_user(user: Union[User, UserRow]) -> Dict[str, Any]:
+    """
+    Serialize a user like UserResponse.
+    
+    Args:
+        user: User ORM object or UserRow
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "id": user.id,
+        "phone_number": user.phone_number,
+        "email": user.email,
+        "name": user.name,
+        "role": user.role.value,
+        "status": user.status.value,
+        "profile_image": user.profile_image,
+        "description": user.description,
+        "city": user.city,
+        "state": user.state,
+        "is_verified": user.is_verified,
+        "is_active": user.is_active,
+        "created_at": _iso(user.created_at),
+        "last_login_at": _iso(user.last_login_at),
+    }
+
+
+def serialize_bid_contractor(contractor: Optional[User]) -> Optional[Dict[str, Any]]:
+    """
+    Serialize the contractor summary embedded in bid responses.
+    
+    Args:
+        contractor: Contractor User object
+    
+    Returns:
+        JSON-compatible dict or None
+    """
+    if contractor is None:
+        return None
+    return {
+        "id": contractor.id,
+        "full_name": contractor.name,
+        "phone_number": contractor.phone_number,
+        "city": contractor.city,
+    }
+
+
+def serialize_bid(bid: Bid) -> Dict[str, Any]:
+    """
+    Serialize a bid like BidResponse.
+    
+    Args:
+        bid: Bid ORM object (contractor should be eager-loaded)
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "id": bid.id,
+        "request_id": bid.request_id,
+        "contractor_id": bid.contractor_id,
+        "amount": bid.amount,
+        "proposal": bid.proposal,
+        "status": bid.status.value,
+        "created_at": _iso(bid.created_at),
+        "updated_at": _iso(bid.updated_at),
+        "contractor": serialize_bid_contractor(bid.contractor),
+    }
+
+
+def serialize_bid_list(
+    bids: Iterable[Bid],
+    total: int,
+    page: int,
+    page_size: int,
+    total_pages: int
+) -> Dict[str, Any]:
+    """
+    Serialize a page of bids like BidListResponse.
+    
+    Args:
+        bids: Bid ORM objects on the page
+        total: Total matching bids
+        page: Current page number
+        page_size: Page size
+        total_pages: Total number of pages
+    
+    Returns:
+        JSON-compatible dict
+    """
+    return {
+        "bids": [serialize_bid(bid) for bid in bids],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+    }
@@ -0,0 +1,30 @@
+"""
+Delta-sync schemas for API responses.
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.schemas.bid import BidResponse
+from app.schemas.request import RequestResponse
+from app.schemas.user import UserProfile
+
+
+class SyncDeleted(BaseModel):
+    """IDs deleted since the cursor."""
+    requests: List[int] = Field(default_factory=list, description="Deleted requests (drop their bids too)")
+    bids: List[int] = Field(default_factory=list, description="Deleted bids")
+
+
+class SyncResponse(BaseModel):
+    """Schema for a delta-sync page."""
+    cursor: str = Field(..., description="Pass as `since` on the next sync")
+    has_more: bool = Field(..., description="More changes are waiting; sync again straight away")
+    full_resync: bool = Field(
+        False,
+        description="The cursor was too old: discard local data and keep this response as the new base"
+    )
+    requests: List[RequestResponse]
+    bids: List[BidResponse]
+    profile: Optional[UserProfile] = Field(None, description="Current user's profile, if it changed")
+    deleted: SyncDeleted
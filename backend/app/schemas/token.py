@@ -71,3 +71,15 @@ class TokenRefreshResponse(BaseModel):
                 "expires_in": 1800
             }
         }
+
+
+class LogoutRequest(BaseModel):
+    """Schema for logout request."""
+    refresh_token: Optional[str] = Field(None, description="Refresh token to revoke along with the access token")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
+            }
+        }
@@ -0,0 +1,248 @@
+"""
+Analytics service: refreshes the summary tables and answers admin queries.
+
+Requests and bids are summarised per creation day. An incremental refresh
+recomputes only the days of rows updated since the last refresh (found
+through the updated_at indexes), so a refresh every few minutes touches a
+handful of days rather than the whole table. Deleted rows leave no
+updated_at behind, so each table is also rebuilt from scratch every
+ANALYTICS_FULL_REFRESH_HOURS. The users summary is small and always rebuilt.
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.bid import BidStatus
+from app.models.request import RequestCategory, RequestStatus
+from app.models.user import UserRole
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.schemas.analytics import (
+    AnalyticsBucket,
+    AnalyticsRefreshResponse,
+    AnalyticsRefreshResult,
+    AnalyticsResponse,
+    BidAnalyticsGroup,
+    RequestAnalyticsGroup,
+    UserAnalyticsGroup,
+)
+
+
+# Rows committed this long after their updated_at are still picked up
+REFRESH_OVERLAP_SECONDS = 60
+
+
+def _key(value: Any) -> str:
+    """Bucket key for a dimension value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class AnalyticsService:
+    """Service for admin analytics."""
+    
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.analytics_repo = AnalyticsRepository(db)
+    
+    # ------------------------------------------------------------------
+    # Refresh
+    
+    def _refresh_daily(
+        self,
+        name: str,
+        changed_days: Callable[[datetime], List[date]],
+        rebuild: Callable[[Optional[List[date]]], int],
+        full: bool
+    ) -> AnalyticsRefreshResult:
+        """Refresh one daily summary, incrementally unless a rebuild is due."""
+        started = datetime.utcnow()
+        state = self.analytics_repo.lock_refresh(name)
+        full = (
+            full
+            or state.watermark is None
+            or state.full_refreshed_at is None
+            or started - state.full_refreshed_at >= timedelta(hours=settings.analytics_full_refresh_hours)
+        )
+        
+        days = None
+        if full:
+            rows = rebuild(None)
+            state.full_refreshed_at = started
+        else:
+            changed = changed_days(state.watermark)
+            days = len(changed)
+            rows = rebuild(changed)
+        
+        state.watermark = started - timedelta(seconds=REFRESH_OVERLAP_SECONDS)
+        state.refreshed_at = started
+        self.db.commit()
+        return AnalyticsRefreshResult(name=name, full=full, days=days, rows=rows, refreshed_at=started)
+    
+    def _refresh_users(self) -> AnalyticsRefreshResult:
+        """Rebuild the users summary."""
+        started = datetime.utcnow()
+        state = self.analytics_repo.lock_refresh("users")
+        rows = self.analytics_repo.rebuild_users()
+        state.watermark = state.refreshed_at = state.full_refreshed_at = started
+        self.db.commit()
+        return AnalyticsRefreshResult(name="users", full=True, rows=rows, refreshed_at=started)
+    
+    def refresh(self, full: bool = False) -> AnalyticsRefreshResponse:
+        """
+        Bring every summary table up to date, one transaction per table.
+        
+        Args:
+            full: Rebuild the daily summaries from scratch
+        
+        Returns:
+            Per-table outcome and total duration
+        """
+        started = time.perf_counter()
+        tables = [
+            self._refresh_daily(
+                "requests",
+                self.analytics_repo.changed_request_days,
+                self.analytics_repo.rebuild_request_days,
+                full
+            ),
+            self._refresh_daily(
+                "bids",
+                self.analytics_repo.changed_bid_days,
+                self.analytics_repo.rebuild_bid_days,
+                full
+            ),
+            self._refresh_users(),
+        ]
+        return AnalyticsRefreshResponse(tables=tables, ms=round((time.perf_counter() - started) * 1000, 1))
+    
+    # ------------------------------------------------------------------
+    # Queries
+    
+    def _refreshed_at(self, name: str) -> Optional[datetime]:
+        """Last refresh time of a summary table."""
+        for state in self.analytics_repo.get_refreshes():
+            if state.name == name:
+                return state.refreshed_at
+        return None
+    
+    def _check_range(self, start: Optional[date], end: Optional[date]) -> None:
+        """Reject a day range that ends before it starts."""
+        if start is not None and end is not None and end < start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end must not be before start"
+            )
+    
+    def request_analytics(
+        self,
+        group_by: RequestAnalyticsGroup,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        request_status: Optional[RequestStatus] = None,
+        category: Optional[RequestCategory] = None,
+        city: Optional[str] = None
+    ) -> AnalyticsResponse:
+        """
+        Count requests by one dimension.
+        
+        Args:
+            group_by: Dimension to group by
+            start: First creation day to include
+            end: Last creation day to include
+            request_status: Only requests with this status
+            category: Only requests in this category
+            city: Only requests in this city
+        
+        Returns:
+            AnalyticsResponse
+        
+        Raises:
+            HTTPException: If the day range is invalid
+        """
+        self._check_range(start, end)
+        rows = self.analytics_repo.request_totals(
+            group_by.value, start, end, status=request_status, category=category, city=city
+        )
+        buckets = [AnalyticsBucket(key=_key(value), count=count) for value, count in rows]
+        return AnalyticsResponse(
+            group_by=group_by.value,
+            buckets=buckets,
+            total=sum(bucket.count for bucket in buckets),
+            refreshed_at=self._refreshed_at("requests")
+        )
+    
+    def bid_analytics(
+        self,
+        group_by: BidAnalyticsGroup,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        bid_status: Optional[BidStatus] = None
+    ) -> AnalyticsResponse:
+        """
+        Count bids, with amounts, by one dimension.
+        
+        Args:
+            group_by: Dimension to group by
+            start: First creation day to include
+            end: Last creation day to include
+            bid_status: Only bids with this status
+        
+        Returns:
+            AnalyticsResponse
+        
+        Raises:
+            HTTPException: If the day range is invalid
+        """
+        self._check_range(start, end)
+        rows = self.analytics_repo.bid_totals(group_by.value, start, end, status=bid_status)
+        buckets = [
+            AnalyticsBucket(
+                key=_key(value),
+                count=count,
+                amount_total=round(amount, 2),
+                average_amount=round(amount / count, 2) if count else None
+            )
+            for value, count, amount in rows
+        ]
+        return AnalyticsResponse(
+            group_by=group_by.value,
+            buckets=buckets,
+            total=sum(bucket.count for bucket in buckets),
+            refreshed_at=self._refreshed_at("bids")
+        )
+    
+    def user_analytics(
+        self,
+        group_by: UserAnalyticsGroup,
+        role: Optional[UserRole] = None,
+        city: Optional[str] = None
+    ) -> AnalyticsResponse:
+        """
+        Count users by role or city.
+        
+        Args:
+            group_by: Dimension to group by
+            role: Only users with this role
+            city: Only users in this city ('' for no city)
+        
+        Returns:
+            AnalyticsResponse
+        """
+        rows = self.analytics_repo.user_totals(group_by.value, role=role, city=city)
+        buckets = [AnalyticsBucket(key=_key(value), count=count) for value, count in rows]
+        return AnalyticsResponse(
+            group_by=group_by.value,
+            buckets=buckets,
+            total=sum(bucket.count for bucket in buckets),
+            refreshed_at=self._refreshed_at("users")
+        )
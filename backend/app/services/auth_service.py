@@ -9,7 +9,10 @@ from sqlalchemy.orm import Session
 from app.repositories.user_repository import UserRepository
 from app.services.otp_service import OTPService
 from app.services.user_service import UserService
-from app.core.security import create_access_token, create_refresh_token, verify_password
+from app.core.passwords import password_hasher
+from app.core.revocation import revocations
+from app.core.write_behind import write_behind
+from app.core.security import create_access_token, create_refresh_token, decode_token
 from app.core.config import settings
 from app.schemas.user import UserCreate, UserResponse
 from app.models.user import User, UserStatus
@@ -173,8 +176,9 @@ class AuthService:
         if not user.is_active:
             raise ValueError("Account is deactivated")
         
-        # Update last login
-        self.user_service.update_last_login(user.id)
+        # Record the login; last_login_at is written in the next batch
+        login_at = datetime.utcnow()
+        write_behind.record_login(user.id, login_at)
         
         # Generate tokens
         access_token = create_access_token(
@@ -198,7 +202,7 @@ class AuthService:
             "refresh_token": refresh_token,
             "token_type": "bearer",
             "expires_in": settings.access_token_expire_minutes * 60,  # in seconds
-            "user": UserResponse.model_validate(user).model_dump()  # Properly serialize user
+            "user": UserResponse.model_validate(user).model_copy(update={"last_login_at": login_at}).model_dump()
         }
     
     def login_with_password(self, phone_number: str, password: str) -> Dict[str, Any]:
@@ -224,8 +228,9 @@ class AuthService:
         if not user.password_hash:
             raise ValueError("Password login not available. Please use OTP login.")
         
-        # Verify password
-        if not verify_password(password, user.password_hash):
+        # Verify password (in the hashing pool; raises PasswordHasherBusy when saturated)
+        matches, new_hash = password_hasher.verify(password, user.password_hash)
+        if not matches:
             raise ValueError("Invalid phone number or password")
         
         # Check if user is verified
@@ -236,9 +241,14 @@ class AuthService:
         if not user.is_active:
             raise ValueError("Account is deactivated. Please contact support.")
         
-        # Update last login
-        user.last_login_at = datetime.utcnow()
-        self.db.commit()
+        # Re-hash if the bcrypt cost changed since the password was set
+        if new_hash:
+            user.password_hash = new_hash
+            self.db.commit()
+        
+        # Record the login; last_login_at is written in the next batch
+        login_at = datetime.utcnow()
+        write_behind.record_login(user.id, login_at)
         
         # Generate tokens
         access_token = create_access_token(
@@ -262,7 +272,7 @@ class AuthService:
             "refresh_token": refresh_token,
             "token_type": "bearer",
             "expires_in": settings.access_token_expire_minutes * 60,
-            "user": UserResponse.model_validate(user).model_dump()  # Properly serialize user
+            "user": UserResponse.model_validate(user).model_copy(update={"last_login_at": login_at}).model_dump()
         }
     
     def refresh_access_token(self, user_id: int) -> Dict[str, Any]:
@@ -296,3 +306,35 @@ class AuthService:
             "token_type": "bearer",
             "expires_in": settings.access_token_expire_minutes * 60
         }
+    
+    def logout(self, access_payload: Dict[str, Any], refresh_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Revoke the caller's access token and, if given, their refresh token.
+        
+        Args:
+            access_payload: Verified claims of the access token used to call logout
+            refresh_token: Refresh token to revoke as well
+            
+        Returns:
+            Dictionary with message
+            
+        Raises:
+            ValueError: If the refresh token is invalid or belongs to another user
+        """
+        refresh_payload = None
+        if refresh_token:
+            refresh_payload = decode_token(refresh_token)
+            if (
+                refresh_payload is None
+                or refresh_payload.get("type") != "refresh"
+                or refresh_payload.get("user_id") != access_payload.get("user_id")
+            ):
+                raise ValueError("Invalid refresh token")
+        
+        revocations.revoke(access_payload, self.db)
+        if refresh_payload is not None:
+            revocations.revoke(refresh_payload, self.db)
+        
+        return {
+            "message": "Logged out successfully. Please delete tokens from client storage."
+        }
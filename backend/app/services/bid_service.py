@@ -2,15 +2,19 @@
 Bid service for business logic.
 """
 
-from typing import Optional
+from typing import Optional, Dict, Any
+from datetime import datetime
 from fastapi import HTTPException, status
 
+from app.core.realtime import realtime, EventType
 from app.models.bid import Bid, BidStatus
 from app.models.request import Request, RequestStatus
 from app.models.user import User, UserRole
 from app.repositories.bid_repository import BidRepository
 from app.repositories.request_repository import RequestRepository
 from app.repositories.user_repository import UserRepository
+from app.services.matching_service import MatchingService
+from app.services.notification_service import NotificationService
 from app.schemas.bid import (
     BidCreate,
     BidUpdate,
@@ -19,6 +23,7 @@ from app.schemas.bid import (
     BidListResponse,
     BidStatistics
 )
+from app.schemas.serializers import serialize_bid_list
 
 
 class BidService:
@@ -28,12 +33,16 @@ class BidService:
         self,
         bid_repo: BidRepository,
         request_repo: RequestRepository,
-        user_repo: UserRepository
+        user_repo: UserRepository,
+        matching_service: MatchingService,
+        notification_service: NotificationService
     ):
         """Initialize service with repositories."""
         self.bid_repo = bid_repo
         self.request_repo = request_repo
         self.user_repo = user_repo
+        self.matching_service = matching_service
+        self.notification_service = notification_service
     
     def submit_bid(self, bid_data: BidCreate, contractor_id: int) -> Bid:
         """
@@ -92,7 +101,19 @@ class BidService:
         data["contractor_id"] = contractor_id
         data["status"] = BidStatus.PENDING
         
+        # Outbox event commits with the bid
+        self.notification_service.on_bid_submitted(request, contractor, bid_data.amount)
         bid = self.bid_repo.create(data)
+        
+        # Bid history feeds the contractor's category preferences
+        self.matching_service.on_bid_submitted(contractor, request)
+        
+        realtime.publish([request.society_id], EventType.BID_SUBMITTED, {
+            "bid_id": bid.id,
+            "request_id": request.id,
+            "contractor_id": contractor_id,
+            "amount": bid.amount,
+        })
         return bid
     
     def get_bid(self, bid_id: int) -> Bid:
@@ -116,29 +137,40 @@ class BidService:
             )
         return bid
     
-    def list_bids_for_request(
-        self,
-        request_id: int,
-        skip: int = 0,
-        limit: int = 20,
-        status: Optional[BidStatus] = None,
-        user_id: Optional[int] = None
-    ) -> BidListResponse:
+    def get_bid_version(self, bid_id: int) -> datetime:
         """
-        List all bids for a request.
+        Get the last modification time of a bid for conditional GETs.
+        
+        Args:
+            bid_id: Bid ID
+            
+        Returns:
+            Latest updated_at of the bid and its contractor
+            
+        Raises:
+            HTTPException: If bid not found
+        """
+        updated_at = self.bid_repo.get_updated_at(bid_id)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Bid with ID {bid_id} not found"
+            )
+        return updated_at
+    
+    def get_request_bids_visibility(self, request_id: int, user_id: Optional[int]) -> bool:
+        """
+        Check which bids on a request a user may list.
         
         Args:
             request_id: Request ID
-            skip: Pagination offset
-            limit: Page size
-            status: Filter by status
             user_id: Optional user ID for authorization check
             
         Returns:
-            BidListResponse with paginated bids
+            True if only the user's own bid is visible
             
         Raises:
-            HTTPException: If request not found or unauthorized
+            HTTPException: If request not found
         """
         # Verify request exists
         request = self.request_repo.get_by_id(request_id)
@@ -150,33 +182,109 @@ class BidService:
         
         # Authorization: Only society owner or admin can see all bids
         # Contractors can only see their own bid
+        own_bid_only = False
         if user_id:
             user = self.user_repo.get_by_id(user_id)
-            if user and user.role == UserRole.CONTRACTOR and request.society_id != user_id:
-                # Contractor can only see their own bid
-                bids, total = self.bid_repo.get_by_contractor(
-                    contractor_id=user_id,
-                    skip=0,
-                    limit=1
-                )
-                # Filter for this specific request
-                bids = [b for b in bids if b.request_id == request_id]
-                total = len(bids)
-                
-                return BidListResponse(
-                    bids=bids,
-                    total=total,
-                    page=1,
-                    page_size=limit,
-                    total_pages=1
-                )
+            own_bid_only = bool(user and user.role == UserRole.CONTRACTOR and request.society_id != user_id)
+        return own_bid_only
+    
+    def get_request_bids_version(
+        self,
+        request_id: int,
+        status: Optional[BidStatus] = None,
+        user_id: Optional[int] = None,
+        own_bid_only: Optional[bool] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get the version fingerprint of the bids on a request visible to a user.
+        
+        Runs the same checks as list_bids_for_request, so a conditional GET
+        cannot get 304 for a request that does not exist.
+        
+        Args:
+            request_id: Request ID
+            status: Filter by status
+            user_id: Optional user ID for authorization check
+            own_bid_only: Result of get_request_bids_visibility, if already known
+            
+        Returns:
+            Tuple of (bid count, latest updated_at)
+            
+        Raises:
+            HTTPException: If request not found
+        """
+        if own_bid_only is None:
+            own_bid_only = self.get_request_bids_visibility(request_id, user_id)
+        return self.bid_repo.get_version_by_request(
+            request_id,
+            status,
+            contractor_id=user_id if own_bid_only else None
+        )
+    
+    def get_my_bids_version(
+        self,
+        contractor_id: int,
+        status: Optional[BidStatus] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get the version fingerprint of the bids submitted by a contractor.
+        
+        Args:
+            contractor_id: Contractor user ID
+            status: Filter by status
+            
+        Returns:
+            Tuple of (bid count, latest updated_at)
+        """
+        return self.bid_repo.get_version_by_contractor(contractor_id, status)
+    
+    def list_bids_for_request(
+        self,
+        request_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[BidStatus] = None,
+        user_id: Optional[int] = None,
+        own_bid_only: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        List all bids for a request.
+        
+        Args:
+            request_id: Request ID
+            skip: Pagination offset
+            limit: Page size
+            status: Filter by status
+            user_id: Optional user ID for authorization check
+            own_bid_only: Result of get_request_bids_visibility, if already known
+            
+        Returns:
+            BidListResponse data with paginated bids
+            
+        Raises:
+            HTTPException: If request not found or unauthorized
+        """
+        if own_bid_only is None:
+            own_bid_only = self.get_request_bids_visibility(request_id, user_id)
+        if own_bid_only:
+            # Contractor can only see their own bid
+            bids, total = self.bid_repo.get_by_contractor(
+                contractor_id=user_id,
+                skip=0,
+                limit=1
+            )
+            # Filter for this specific request
+            bids = [b for b in bids if b.request_id == request_id]
+            total = len(bids)
+            
+            return serialize_bid_list(bids, total, page=1, page_size=limit, total_pages=1)
         
         # Get bids
         bids, total = self.bid_repo.get_by_request(request_id, skip, limit, status)
         
-        return BidListResponse(
-            bids=bids,
-            total=total,
+        return serialize_bid_list(
+            bids,
+            total,
             page=skip // limit + 1,
             page_size=limit,
             total_pages=(total + limit - 1) // limit
@@ -188,7 +296,7 @@ class BidService:
         skip: int = 0,
         limit: int = 20,
         status: Optional[BidStatus] = None
-    ) -> BidListResponse:
+    ) -> Dict[str, Any]:
         """
         Get bids submitted by contractor.
         
@@ -199,13 +307,13 @@ class BidService:
             status: Filter by status
             
         Returns:
-            BidListResponse with contractor's bids
+            BidListResponse data with contractor's bids
         """
         bids, total = self.bid_repo.get_by_contractor(contractor_id, skip, limit, status)
         
-        return BidListResponse(
-            bids=bids,
-            total=total,
+        return serialize_bid_list(
+            bids,
+            total,
             page=skip // limit + 1,
             page_size=limit,
             total_pages=(total + limit - 1) // limit
@@ -306,7 +414,8 @@ class BidService:
                 detail=f"Cannot accept bid on request with status {request.status}"
             )
         
-        # Accept the bid
+        # Accept the bid (the outbox event commits with it)
+        self.notification_service.on_bid_accepted(bid, request)
         accepted_bid = self.bid_repo.update_status(bid, BidStatus.ACCEPTED)
         
         # Reject all other pending bids
@@ -318,6 +427,17 @@ class BidService:
             RequestStatus.IN_PROGRESS,
             contractor_id=bid.contractor_id
         )
+        self.matching_service.on_request_saved(request)
+        
+        realtime.publish([bid.contractor_id], EventType.BID_ACCEPTED, {
+            "bid_id": bid.id,
+            "request_id": request.id,
+        })
+        realtime.publish([request.society_id, bid.contractor_id], EventType.REQUEST_STATUS_CHANGED, {
+            "request_id": request.id,
+            "status": request.status.value,
+            "assigned_contractor_id": request.assigned_contractor_id,
+        })
         
         return accepted_bid
     
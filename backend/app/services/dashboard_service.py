@@ -0,0 +1,93 @@
+"""
+Dashboard service for the mobile home screens.
+
+Each dashboard replaces the calls the app used to make on launch (a list,
+then one bid-statistics call per request on it) with one payload built from
+a fixed number of queries, however many requests are on the page.
+"""
+
+from typing import Any, Dict
+
+from app.models.user import User
+from app.repositories.bid_repository import BidRepository
+from app.repositories.request_repository import RequestRepository
+from app.schemas.serializers import serialize_bid_list, serialize_request_list
+
+
+# Statistics for a request with no bids (no row comes back for it)
+EMPTY_BID_STATISTICS = {
+    "total_bids": 0,
+    "pending_bids": 0,
+    "accepted_bids": 0,
+    "rejected_bids": 0,
+    "withdrawn_bids": 0,
+    "average_bid_amount": None,
+    "lowest_bid": None,
+    "highest_bid": None,
+}
+
+
+class DashboardService:
+    """Service for the per-role dashboards."""
+    
+    def __init__(self, request_repo: RequestRepository, bid_repo: BidRepository):
+        """Initialize service with repositories."""
+        self.request_repo = request_repo
+        self.bid_repo = bid_repo
+    
+    def get_society_dashboard(self, user: User, limit: int = 20) -> Dict[str, Any]:
+        """
+        Get a society's home screen: its latest requests with their bid statistics.
+        
+        Three queries: the request count, the request page, and one grouped
+        bid aggregate over the page's requests that have bids (from their
+        denormalised bid_count).
+        
+        Args:
+            user: Society user
+            limit: Requests to include
+        
+        Returns:
+            SocietyDashboardResponse data
+        """
+        requests, total = self.request_repo.get_by_society(user.id, 0, limit)
+        statistics = self.bid_repo.get_statistics_for_requests(
+            [request.id for request in requests if request.bid_count]
+        )
+        
+        return {
+            "open_requests": user.open_request_count,
+            "requests": serialize_request_list(requests, total, 0, limit),
+            "bid_statistics": {
+                str(request.id): statistics.get(request.id, EMPTY_BID_STATISTICS)
+                for request in requests
+            },
+        }
+    
+    def get_contractor_dashboard(self, user: User, limit: int = 20) -> Dict[str, Any]:
+        """
+        Get a contractor's home screen: its latest bids and assigned requests.
+        
+        Four queries: a count and a page for each list.
+        
+        Args:
+            user: Contractor user
+            limit: Bids and assigned requests to include (each)
+        
+        Returns:
+            ContractorDashboardResponse data
+        """
+        bids, bids_total = self.bid_repo.get_by_contractor(user.id, 0, limit)
+        assigned, assigned_total = self.request_repo.get_by_contractor(user.id, 0, limit)
+        
+        return {
+            "active_bids": user.active_bid_count,
+            "bids": serialize_bid_list(
+                bids,
+                bids_total,
+                page=1,
+                page_size=limit,
+                total_pages=(bids_total + limit - 1) // limit
+            ),
+            "assigned": serialize_request_list(assigned, assigned_total, 0, limit),
+        }
@@ -0,0 +1,193 @@
+"""
+Matching service for contractor recommendations.
+
+Open requests are indexed by category, skill and city, and contractors by
+the same kinds of terms taken from their profile and bid history. Each
+request or profile event recomputes only the affected side of the match,
+so GET /requests/recommended is a plain read of precomputed rows.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from app.models.matching import MatchTermType
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole
+from app.repositories.matching_repository import MatchingRepository, Term
+from app.schemas.request import normalize_skills
+from app.schemas.serializers import serialize_recommendation_list
+
+
+# Term weights; the recommendation score is the sum over matched terms
+BID_CATEGORY_WEIGHT = 3      # Category of a request the contractor bid on
+PROFILE_CATEGORY_WEIGHT = 2  # Category named in the profile description
+SKILL_WEIGHT = 2             # Skill listed in the profile description
+CITY_WEIGHT = 1              # Same city (never enough on its own)
+
+# Longest description fragment treated as a skill, in words
+MAX_SKILL_WORDS = 3
+
+# Separators between skills in a free-text profile description
+SKILL_SEPARATORS = re.compile(r"[,;/|\n]+")
+
+
+def _category_term(category: RequestCategory) -> str:
+    """Index term for a category, e.g. "interior design"."""
+    return category.value.lower().replace("_", " ")
+
+
+def _city_term(city: Optional[str]) -> Optional[str]:
+    """Index term for a city."""
+    city = (city or "").strip().lower()
+    return city[:100] or None
+
+
+class MatchingService:
+    """Service maintaining the matching index and recommendation feed."""
+    
+    def __init__(self, matching_repo: MatchingRepository):
+        """Initialize service with repository."""
+        self.matching_repo = matching_repo
+    
+    def request_terms(self, request: Request) -> List[Term]:
+        """
+        Get the index terms of a request.
+        
+        Args:
+            request: Request object
+        
+        Returns:
+            List of (term type, term) pairs
+        """
+        terms = [(MatchTermType.CATEGORY, _category_term(request.category))]
+        terms.extend(
+            (MatchTermType.SKILL, skill[:100])
+            for skill in dict.fromkeys(request.required_skills or [])
+        )
+        city = _city_term(request.city)
+        if city:
+            terms.append((MatchTermType.CITY, city))
+        return terms
+    
+    def contractor_terms(
+        self,
+        contractor: User,
+        bid_categories: List[RequestCategory]
+    ) -> Dict[Term, int]:
+        """
+        Get the weighted profile terms of a contractor.
+        
+        Args:
+            contractor: Contractor user
+            bid_categories: Categories of requests the contractor bid on
+        
+        Returns:
+            Mapping of (term type, term) to weight
+        """
+        terms: Dict[Term, int] = {}
+        
+        def add(term: Term, weight: int) -> None:
+            terms[term] = max(terms.get(term, 0), weight)
+        
+        description = (contractor.description or "").lower()
+        
+        # Short description fragments are skills ("plumbing, tiling")
+        fragments = normalize_skills(SKILL_SEPARATORS.split(description)) or []
+        for skill in fragments:
+            if len(skill.split()) <= MAX_SKILL_WORDS:
+                add((MatchTermType.SKILL, skill[:100]), SKILL_WEIGHT)
+        
+        # Categories named anywhere in the description
+        for category in RequestCategory:
+            name = _category_term(category)
+            if category != RequestCategory.OTHER and re.search(rf"\b{re.escape(name)}\b", description):
+                add((MatchTermType.CATEGORY, name), PROFILE_CATEGORY_WEIGHT)
+        
+        for category in bid_categories:
+            add((MatchTermType.CATEGORY, _category_term(category)), BID_CATEGORY_WEIGHT)
+        
+        city = _city_term(contractor.city)
+        if city:
+            add((MatchTermType.CITY, city), CITY_WEIGHT)
+        
+        return terms
+    
+    def on_request_saved(self, request: Request) -> None:
+        """
+        Update the index after a request is created, edited or changes status.
+        
+        Open requests are (re)indexed and fanned out to matching contractors;
+        any other status removes the request from every feed.
+        
+        Args:
+            request: Saved Request object
+        """
+        if request.status == RequestStatus.OPEN:
+            self.matching_repo.index_request(request.id, self.request_terms(request))
+        else:
+            self.matching_repo.remove_request(request.id)
+    
+    def on_request_deleted(self, request_id: int) -> None:
+        """
+        Remove a request that is about to be deleted.
+        
+        Args:
+            request_id: Request ID
+        """
+        self.matching_repo.remove_request(request_id)
+    
+    def on_contractor_changed(self, contractor: User) -> None:
+        """
+        Rebuild a contractor's terms and feed after a profile change or new bid.
+        
+        Args:
+            contractor: User object
+        """
+        if contractor.role != UserRole.CONTRACTOR or not contractor.is_active:
+            self.matching_repo.remove_contractor(contractor.id)
+            return
+        
+        bid_categories = self.matching_repo.get_bid_categories(contractor.id)
+        self.matching_repo.index_contractor(
+            contractor.id,
+            self.contractor_terms(contractor, bid_categories)
+        )
+    
+    def on_bid_submitted(self, contractor: User, request: Request) -> None:
+        """
+        Update a contractor's feed after they bid on a request.
+        
+        A bid only changes the contractor's terms the first time it gives a
+        category the bid-history weight; only then is the feed rebuilt.
+        Otherwise the request just leaves the feed.
+        
+        Args:
+            contractor: Contractor who bid
+            request: Request bid on
+        """
+        term = (MatchTermType.CATEGORY, _category_term(request.category))
+        weight = self.matching_repo.get_term_weight(contractor.id, term)
+        if weight is None or weight < BID_CATEGORY_WEIGHT:
+            self.on_contractor_changed(contractor)
+        else:
+            self.matching_repo.remove_recommendation(contractor.id, request.id)
+    
+    def get_recommended(
+        self,
+        contractor_id: int,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Get the contractor's "recommended for you" feed.
+        
+        Args:
+            contractor_id: Contractor user ID
+            skip: Pagination offset
+            limit: Page size
+        
+        Returns:
+            RecommendedRequestListResponse data as a JSON-compatible dict
+        """
+        rows, total = self.matching_repo.get_recommendations(contractor_id, skip, limit)
+        return serialize_recommendation_list(rows, total, skip, limit)
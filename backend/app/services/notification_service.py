@@ -0,0 +1,333 @@
+"""
+Notification service: outbox events, inbox and digest delivery.
+
+Bid and request changes stage an outbox event in the same transaction as
+the change. The dispatcher (scripts/run_notification_dispatcher.py) turns
+events into inbox notifications, then sends each user at most one digest
+per window through the configured delivery provider, covering everything
+that happened since their oldest undelivered notification.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.bid import Bid
+from app.models.notification import Notification, NotificationType
+from app.models.request import Request, RequestStatus
+from app.models.user import User
+from app.repositories.notification_repository import NotificationRepository
+from app.services.providers.base import OTPDeliveryProvider
+
+
+# Outbox events claimed per dispatcher transaction
+OUTBOX_BATCH_SIZE = 500
+
+# Users sent a digest per dispatcher pass
+DIGEST_BATCH_SIZE = 200
+
+# Notification lines listed in one digest before "and N more"
+DIGEST_MAX_LINES = 5
+
+# Processed outbox events are kept this long for debugging
+OUTBOX_RETENTION_DAYS = 7
+
+
+def _format_amount(amount: float) -> str:
+    """Bid amount as rupees, e.g. ₹45,000."""
+    return f"₹{amount:,.0f}"
+
+
+class NotificationService:
+    """Service for notifications."""
+    
+    def __init__(
+        self,
+        notification_repo: NotificationRepository,
+        provider: Optional[OTPDeliveryProvider] = None
+    ):
+        """
+        Initialize service with repository.
+        
+        Args:
+            notification_repo: Notification repository
+            provider: Digest delivery provider (None disables digests)
+        """
+        self.notification_repo = notification_repo
+        self.provider = provider
+    
+    # ------------------------------------------------------------------
+    # Outbox events (call before the repository write that commits the change)
+    # ------------------------------------------------------------------
+    
+    def on_bid_submitted(self, request: Request, contractor: User, amount: float) -> None:
+        """Stage a bid.submitted event for the society that posted the request."""
+        self.notification_repo.stage_event(NotificationType.BID_SUBMITTED, {
+            "user_ids": [request.society_id],
+            "request_id": request.id,
+            "request_title": request.title,
+            "contractor_id": contractor.id,
+            "contractor_name": contractor.name,
+            "amount": amount,
+        })
+    
+    def on_bid_accepted(self, bid: Bid, request: Request) -> None:
+        """Stage a bid.accepted event for the contractor."""
+        self.notification_repo.stage_event(NotificationType.BID_ACCEPTED, {
+            "user_ids": [bid.contractor_id],
+            "bid_id": bid.id,
+            "request_id": request.id,
+            "request_title": request.title,
+            "amount": bid.amount,
+        })
+    
+    def on_request_status_changed(
+        self,
+        request: Request,
+        new_status: RequestStatus,
+        changed_by: int,
+        assigned_contractor_id: Optional[int] = None
+    ) -> None:
+        """
+        Stage a request.status_changed event.
+        
+        Goes to the society and the assigned contractor, except whoever made
+        the change.
+        
+        Args:
+            request: Request being updated (not yet committed)
+            new_status: Status being set
+            changed_by: User making the change
+            assigned_contractor_id: Contractor being assigned, if any
+        """
+        contractor_id = request.assigned_contractor_id
+        if new_status == RequestStatus.IN_PROGRESS and assigned_contractor_id:
+            contractor_id = assigned_contractor_id
+        user_ids = sorted(
+            user_id for user_id in {request.society_id, contractor_id}
+            if user_id is not None and user_id != changed_by
+        )
+        if not user_ids:
+            return
+        
+        self.notification_repo.stage_event(NotificationType.REQUEST_STATUS_CHANGED, {
+            "user_ids": user_ids,
+            "request_id": request.id,
+            "request_title": request.title,
+            "status": new_status.value,
+        })
+    
+    # ------------------------------------------------------------------
+    # Dispatcher
+    # ------------------------------------------------------------------
+    
+    def render(self, event_type: NotificationType, payload: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Get the title and body of a notification.
+        
+        Args:
+            event_type: Event type
+            payload: Event payload
+        
+        Returns:
+            Tuple of (title, body)
+        """
+        request_title = payload.get("request_title") or f"request #{payload['request_id']}"
+        
+        if event_type == NotificationType.BID_SUBMITTED:
+            contractor = payload.get("contractor_name") or "A contractor"
+            return (
+                "New bid received",
+                f"{contractor} bid {_format_amount(payload['amount'])} on \"{request_title}\"."
+            )
+        if event_type == NotificationType.BID_ACCEPTED:
+            return (
+                "Your bid was accepted",
+                f"Your bid of {_format_amount(payload['amount'])} on \"{request_title}\" was accepted."
+            )
+        
+        status_text = payload["status"].replace("_", " ").lower()
+        return (
+            "Request status updated",
+            f"\"{request_title}\" is now {status_text}."
+        )
+    
+    def process_outbox(self, limit: int = OUTBOX_BATCH_SIZE) -> int:
+        """
+        Turn a batch of pending outbox events into inbox notifications.
+        
+        A malformed event is marked processed with last_error set rather than
+        blocking the events behind it.
+        
+        Args:
+            limit: Maximum events to process
+        
+        Returns:
+            Number of events processed
+        """
+        events = self.notification_repo.claim_pending_events(limit)
+        if not events:
+            self.notification_repo.release()
+            return 0
+        
+        notifications: List[Notification] = []
+        for event in events:
+            try:
+                title, body = self.render(event.event_type, event.payload)
+                data = {
+                    key: value for key, value in event.payload.items()
+                    if key.endswith("_id") and key != "user_ids"
+                }
+                notifications.extend(
+                    Notification(
+                        user_id=user_id,
+                        type=event.event_type,
+                        title=title,
+                        body=body,
+                        data=data,
+                        created_at=event.created_at,
+                    )
+                    for user_id in event.payload["user_ids"]
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                event.last_error = f"{type(e).__name__}: {e}"
+                print(f"⚠️ Outbox event {event.id} skipped: {event.last_error}")
+        
+        self.notification_repo.complete_events(events, notifications)
+        return len(events)
+    
+    def recipient_for(self, user: User) -> Optional[str]:
+        """Address to send a user's digest to for the configured method."""
+        if settings.notification_delivery_method == "email":
+            return user.email
+        return user.phone_number
+    
+    def format_digest(self, notifications: List[Notification]) -> Tuple[str, str]:
+        """
+        Combine notifications into one message.
+        
+        Args:
+            notifications: Unread notifications, oldest first
+        
+        Returns:
+            Tuple of (subject, body)
+        """
+        if len(notifications) == 1:
+            return notifications[0].title, notifications[0].body
+        
+        subject = f"{len(notifications)} updates on ContractorConnect"
+        lines = [f"• {notification.body}" for notification in notifications[-DIGEST_MAX_LINES:]]
+        hidden = len(notifications) - len(lines)
+        if hidden:
+            lines.append(f"…and {hidden} more in the app.")
+        return subject, f"{subject}:\n" + "\n".join(lines)
+    
+    def send_digest(self, user_id: int) -> bool:
+        """
+        Send one user their pending notifications as a single message.
+        
+        Notifications the user already read in the app are marked delivered
+        without being sent.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            True if a message was sent
+        """
+        notifications = self.notification_repo.claim_undelivered(user_id)
+        if not notifications:
+            self.notification_repo.release()
+            return False
+        
+        unread = [notification for notification in notifications if not notification.is_read]
+        recipient = self.recipient_for(notifications[0].user)
+        if not unread or not recipient or self.provider is None:
+            self.notification_repo.mark_delivered(notifications)
+            return False
+        
+        subject, body = self.format_digest(unread)
+        try:
+            self.provider.send_message(recipient, subject, body)
+        except Exception as e:
+            # Left undelivered; retried on the next pass
+            self.notification_repo.release()
+            print(f"❌ Digest to user {user_id} failed: {str(e)}")
+            return False
+        
+        self.notification_repo.mark_delivered(notifications)
+        return True
+    
+    def send_digests(self, window: Optional[timedelta] = None) -> int:
+        """
+        Send digests to every user whose digest window has elapsed.
+        
+        A user's window opens with their oldest undelivered notification, so
+        a burst of events becomes one message and a user gets at most one
+        message per window.
+        
+        Args:
+            window: Digest window (defaults to the configured one)
+        
+        Returns:
+            Number of digests sent
+        """
+        if window is None:
+            window = timedelta(minutes=settings.notification_digest_window_minutes)
+        
+        user_ids = self.notification_repo.get_users_due_for_digest(
+            datetime.utcnow() - window,
+            DIGEST_BATCH_SIZE
+        )
+        return sum(1 for user_id in user_ids if self.send_digest(user_id))
+    
+    def prune_outbox(self) -> int:
+        """Delete processed outbox events past the retention window."""
+        return self.notification_repo.prune_events(
+            datetime.utcnow() - timedelta(days=OUTBOX_RETENTION_DAYS)
+        )
+    
+    # ------------------------------------------------------------------
+    # Inbox
+    # ------------------------------------------------------------------
+    
+    def list_notifications(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        unread_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get a user's notifications.
+        
+        Args:
+            user_id: User ID
+            skip: Pagination offset
+            limit: Page size
+            unread_only: Only unread notifications
+        
+        Returns:
+            NotificationListResponse data
+        """
+        notifications, total = self.notification_repo.get_by_user(user_id, skip, limit, unread_only)
+        return {
+            "notifications": notifications,
+            "total": total,
+            "unread": self.notification_repo.count_unread(user_id),
+            "page": skip // limit + 1,
+            "page_size": limit,
+        }
+    
+    def mark_read(self, user_id: int, notification_ids: Optional[List[int]] = None) -> int:
+        """
+        Mark notifications as read.
+        
+        Args:
+            user_id: User ID
+            notification_ids: Notifications to mark, or None for all
+        
+        Returns:
+            Number of notifications changed
+        """
+        return self.notification_repo.mark_read(user_id, notification_ids)
@@ -1,16 +1,36 @@
 """
 OTP Delivery Providers package.
+
+Only the base class, the console provider and the factory are imported
+up front. The other providers pull in SDKs (smtplib, twilio, requests) that
+most processes never touch, so they are imported on first attribute
+access or when the factory builds one.
 """
 
+from importlib import import_module
+
 from app.services.providers.base import OTPDeliveryProvider
 from app.services.providers.console import ConsoleProvider
-from app.services.providers.email import EmailProvider
-from app.services.providers.factory import get_otp_provider, get_fallback_provider
+from app.services.providers.factory import get_otp_provider, get_shared_provider, get_fallback_provider
+
+_LAZY_PROVIDERS = {
+    "EmailProvider": "app.services.providers.email",
+    "FakeProvider": "app.services.providers.fake",
+}
 
 __all__ = [
     "OTPDeliveryProvider",
     "ConsoleProvider",
     "EmailProvider",
+    "FakeProvider",
     "get_otp_provider",
+    "get_shared_provider",
     "get_fallback_provider",
 ]
+
+
+def __getattr__(name: str):
+    """Import a provider class the first time it is used."""
+    if name in _LAZY_PROVIDERS:
+        return getattr(import_module(_LAZY_PROVIDERS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
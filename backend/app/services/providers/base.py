@@ -32,6 +32,23 @@ class OTPDeliveryProvider(ABC):
         """
         pass
     
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Send a free-text message (used for notification digests).
+        
+        Args:
+            recipient: Phone number, email, or WhatsApp number
+            subject: Subject line (used by channels that have one)
+            body: Plain-text message body
+            
+        Returns:
+            Dict with status and message_id/error
+            
+        Raises:
+            NotImplementedError: If the provider can only send OTPs
+        """
+        raise NotImplementedError(f"{self.get_provider_name()} cannot send free-text messages")
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Return provider name for logging."""
@@ -39,6 +39,34 @@ class ConsoleProvider(OTPDeliveryProvider):
             "recipient": recipient,
         }
     
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Print a message to console instead of sending.
+        
+        Args:
+            recipient: Phone number or email
+            subject: Subject line
+            body: Message body
+            
+        Returns:
+            Dict with status and mock message_id
+        """
+        print("\n" + "="*60)
+        print(f"🔔 NOTIFICATION (Console Provider)")
+        print("="*60)
+        print(f"To: {recipient}")
+        print(f"Subject: {subject}")
+        print("-"*60)
+        print(body)
+        print("="*60 + "\n")
+        
+        return {
+            "success": True,
+            "provider": "console",
+            "message_id": f"console_{recipient}",
+            "recipient": recipient,
+        }
+    
     def get_provider_name(self) -> str:
         """Return provider name."""
         return "Console (Development)"
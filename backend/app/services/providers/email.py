@@ -79,6 +79,46 @@ class EmailProvider(OTPDeliveryProvider):
         message.attach(part1)
         message.attach(part2)
         
+        self._send(message, recipient)
+        
+        return {
+            "success": True,
+            "provider": "email",
+            "message_id": f"email_{otp_code}",
+            "recipient": recipient,
+        }
+    
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Send a plain-text email.
+        
+        Args:
+            recipient: Email address
+            subject: Subject line
+            body: Message body
+            
+        Returns:
+            Dict with status
+            
+        Raises:
+            Exception if sending fails
+        """
+        message = MIMEText(body, "plain", "utf-8")
+        message["Subject"] = subject
+        message["From"] = f"{self.from_name} <{self.from_email}>"
+        message["To"] = recipient
+        
+        self._send(message, recipient)
+        
+        return {
+            "success": True,
+            "provider": "email",
+            "message_id": f"email_{recipient}",
+            "recipient": recipient,
+        }
+    
+    def _send(self, message, recipient: str) -> None:
+        """Deliver a prepared message over SMTP."""
         try:
             # Connect to SMTP server with better error handling and SSL support
             print(f"📧 Attempting to send email to {recipient}")
@@ -99,13 +139,6 @@ class EmailProvider(OTPDeliveryProvider):
                     server.send_message(message)
                     print(f"✅ Email sent successfully via STARTTLS to {recipient}")
             
-            return {
-                "success": True,
-                "provider": "email",
-                "message_id": f"email_{otp_code}",
-                "recipient": recipient,
-            }
-            
         except Exception as e:
             print(f"❌ Email Error: {str(e)}")
             print(f"❌ Failed with SMTP {self.smtp_host}:{self.smtp_port}")
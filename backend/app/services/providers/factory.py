@@ -2,17 +2,25 @@
 Provider factory for OTP delivery.
 """
 
-from typing import Optional
+import threading
+from typing import Dict, Optional
 from app.services.providers.base import OTPDeliveryProvider
 from app.services.providers.console import ConsoleProvider
-from app.services.providers.email import EmailProvider
 from app.core.config import settings
 
+# Process-wide provider instances (see get_shared_provider)
+_shared_providers: Dict[str, OTPDeliveryProvider] = {}
+_shared_lock = threading.Lock()
+
 
 def get_otp_provider(provider_type: Optional[str] = None) -> OTPDeliveryProvider:
     """
     Get OTP delivery provider based on configuration.
     
+    Provider modules other than console are imported here, on first use,
+    so their SDKs stay out of the import path of processes that never
+    send through them.
+    
     Args:
         provider_type: Override provider type (for testing)
         
@@ -28,8 +36,13 @@ def get_otp_provider(provider_type: Optional[str] = None) -> OTPDeliveryProvider
         return ConsoleProvider()
     
     elif provider == 'email':
+        from app.services.providers.email import EmailProvider
         return EmailProvider()
     
+    elif provider == 'fake':
+        from app.services.providers.fake import FakeProvider
+        return FakeProvider()
+    
     elif provider == 'sms_twilio':
         try:
             from app.services.providers.twilio_sms import TwilioSMSProvider
@@ -57,10 +70,34 @@ def get_otp_provider(provider_type: Optional[str] = None) -> OTPDeliveryProvider
     else:
         raise ValueError(
             f"Unknown OTP provider: {provider}. "
-            f"Valid options: console, email, sms_twilio, whatsapp_twilio, sms_msg91"
+            f"Valid options: console, email, sms_twilio, whatsapp_twilio, sms_msg91, fake"
         )
 
 
+def get_shared_provider(provider_type: Optional[str] = None) -> OTPDeliveryProvider:
+    """
+    Get the process-wide instance of a provider, building it on first use.
+    
+    OTP services are created per request, so without this every OTP paid
+    for constructing its provider (and its SDK client). The startup warm-up
+    calls this so the first OTP after a deploy does not pay for it either.
+    
+    Args:
+        provider_type: Override provider type (default: OTP_DELIVERY_METHOD)
+        
+    Returns:
+        OTPDeliveryProvider instance
+        
+    Raises:
+        ValueError if provider type is invalid or not configured
+    """
+    provider = provider_type or getattr(settings, 'otp_delivery_method', 'console')
+    with _shared_lock:
+        if provider not in _shared_providers:
+            _shared_providers[provider] = get_otp_provider(provider)
+        return _shared_providers[provider]
+
+
 def get_fallback_provider(fallback_type: Optional[str] = None) -> Optional[OTPDeliveryProvider]:
     """
     Get fallback OTP delivery provider.
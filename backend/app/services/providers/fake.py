@@ -0,0 +1,86 @@
+"""
+Fake provider for OTP delivery (load tests).
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+from app.services.providers.base import OTPDeliveryProvider
+from app.core.config import settings
+
+
+class FakeProvider(OTPDeliveryProvider):
+    """Fake provider - sends nothing, but takes as long as a real gateway call."""
+    
+    def __init__(
+        self,
+        latency_ms: Optional[int] = None,
+        failure_rate: Optional[float] = None,
+    ):
+        """
+        Initialize fake provider.
+        
+        Args:
+            latency_ms: Simulated gateway round trip (default: FAKE_PROVIDER_LATENCY_MS)
+            failure_rate: Fraction of sends that fail (default: FAKE_PROVIDER_FAILURE_RATE)
+        """
+        self.latency_ms = latency_ms if latency_ms is not None else settings.fake_provider_latency_ms
+        self.failure_rate = failure_rate if failure_rate is not None else settings.fake_provider_failure_rate
+        self.sent = 0
+        self._lock = threading.Lock()
+    
+    def _deliver(self, recipient: str, message_id: str) -> dict:
+        """Wait like a gateway call, then succeed or fail."""
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise Exception(f"Simulated delivery failure to {recipient}")
+        
+        with self._lock:
+            self.sent += 1
+        return {
+            "success": True,
+            "provider": "fake",
+            "message_id": message_id,
+            "recipient": recipient,
+        }
+    
+    def send_otp(self, recipient: str, otp_code: str, purpose: str = "login") -> dict:
+        """
+        Pretend to send an OTP.
+        
+        Args:
+            recipient: Phone number or email
+            otp_code: OTP code
+            purpose: Purpose of OTP
+        
+        Returns:
+            Dict with status and fake message_id
+        
+        Raises:
+            Exception: For the configured fraction of sends
+        """
+        return self._deliver(recipient, f"fake_{otp_code}")
+    
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Pretend to send a message.
+        
+        Args:
+            recipient: Phone number or email
+            subject: Subject line
+            body: Message body
+        
+        Returns:
+            Dict with status and fake message_id
+        
+        Raises:
+            Exception: For the configured fraction of sends
+        """
+        return self._deliver(recipient, f"fake_{recipient}")
+    
+    def get_provider_name(self) -> str:
+        """Return provider name."""
+        return f"Fake ({self.latency_ms}ms)"
@@ -86,6 +86,42 @@ class TwilioSMSProvider(OTPDeliveryProvider):
             print(f"❌ Twilio SMS Error: {str(e)}")
             raise Exception(f"Failed to send SMS via Twilio: {str(e)}")
     
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Send a free-text SMS via Twilio.
+        
+        Args:
+            recipient: Phone number (10 digits, sent as +91)
+            subject: Ignored (SMS has no subject)
+            body: Message body
+            
+        Returns:
+            Dict with status and message SID
+            
+        Raises:
+            Exception if sending fails
+        """
+        try:
+            message = self.client.messages.create(
+                from_=self.from_number,
+                body=body,
+                to=f'+91{recipient}'
+            )
+            
+            print(f"✅ SMS sent successfully! SID: {message.sid}, Status: {message.status}")
+            
+            return {
+                "success": True,
+                "provider": "twilio_sms",
+                "message_id": message.sid,
+                "recipient": recipient,
+                "status": message.status,
+            }
+            
+        except Exception as e:
+            print(f"❌ Twilio SMS Error: {str(e)}")
+            raise Exception(f"Failed to send SMS via Twilio: {str(e)}")
+    
     def get_provider_name(self) -> str:
         """Return provider name."""
         return "Twilio SMS"
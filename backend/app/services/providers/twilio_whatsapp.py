@@ -88,6 +88,43 @@ class TwilioWhatsAppProvider(OTPDeliveryProvider):
             print(f"❌ Twilio WhatsApp Error: {str(e)}")
             raise Exception(f"Failed to send WhatsApp message via Twilio: {str(e)}")
     
+    def send_message(self, recipient: str, subject: str, body: str) -> dict:
+        """
+        Send a free-text WhatsApp message via Twilio.
+        
+        Args:
+            recipient: Phone number (will be prefixed with whatsapp:)
+            subject: Ignored (WhatsApp has no subject)
+            body: Message body
+            
+        Returns:
+            Dict with status and message SID
+            
+        Raises:
+            Exception if sending fails
+        """
+        if not recipient.startswith('whatsapp:'):
+            recipient = f'whatsapp:{recipient}'
+        
+        try:
+            message = self.client.messages.create(
+                body=body,
+                from_=self.from_number,
+                to=recipient
+            )
+            
+            return {
+                "success": True,
+                "provider": "twilio_whatsapp",
+                "message_id": message.sid,
+                "recipient": recipient,
+                "status": message.status,
+            }
+            
+        except Exception as e:
+            print(f"❌ Twilio WhatsApp Error: {str(e)}")
+            raise Exception(f"Failed to send WhatsApp message via Twilio: {str(e)}")
+    
     def get_provider_name(self) -> str:
         """Return provider name."""
         return "Twilio WhatsApp"
@@ -2,30 +2,46 @@
 Request service for business logic.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
+from datetime import datetime
 from fastapi import HTTPException, status
 
+from app.core.cache import cache, request_namespace, REQUEST_FEED_NAMESPACE
+from app.core.realtime import realtime, EventType
+from app.core.geo import GeoRadius, locate_pincode, lookup_pincode
 from app.models.request import Request, RequestStatus, RequestCategory
 from app.models.user import User, UserRole
 from app.repositories.request_repository import RequestRepository
 from app.repositories.user_repository import UserRepository
+from app.services.matching_service import MatchingService
+from app.services.notification_service import NotificationService
 from app.schemas.request import (
     RequestCreate,
     RequestUpdate,
     RequestStatusUpdate,
     RequestResponse,
     RequestListResponse,
-    RequestSearchFilters
+    RequestSearchFilters,
+    RequestView
 )
+from app.schemas.serializers import serialize_request, serialize_request_list
 
 
 class RequestService:
     """Service for request business logic."""
     
-    def __init__(self, request_repo: RequestRepository, user_repo: UserRepository):
+    def __init__(
+        self,
+        request_repo: RequestRepository,
+        user_repo: UserRepository,
+        matching_service: MatchingService,
+        notification_service: NotificationService
+    ):
         """Initialize service with repositories."""
         self.request_repo = request_repo
         self.user_repo = user_repo
+        self.matching_service = matching_service
+        self.notification_service = notification_service
     
     def create_request(self, request_data: RequestCreate, society_id: int) -> Request:
         """
@@ -57,9 +73,11 @@ class RequestService:
         data = request_data.model_dump(exclude_unset=True)
         data["society_id"] = society_id
         data["status"] = RequestStatus.OPEN
+        data.update(locate_pincode(data.get("pincode")))
         
         # Create request
         request = self.request_repo.create(data)
+        self.matching_service.on_request_saved(request)
         return request
     
     def get_request(self, request_id: int) -> Request:
@@ -83,6 +101,103 @@ class RequestService:
             )
         return request
     
+    def get_request_detail(self, request_id: int) -> Dict[str, Any]:
+        """
+        Get serialised request details, served from the cache.
+        
+        Args:
+            request_id: Request ID
+            
+        Returns:
+            RequestResponse data as a JSON-compatible dict
+            
+        Raises:
+            HTTPException: If request not found
+        """
+        return cache.get_or_load(
+            request_namespace(request_id),
+            {"view": "detail", "id": request_id},
+            lambda: serialize_request(self.get_request(request_id))
+        )
+    
+    def get_request_version(self, request_id: int) -> datetime:
+        """
+        Get the last modification time of a request for conditional GETs.
+        
+        Args:
+            request_id: Request ID
+            
+        Returns:
+            updated_at timestamp of the request
+            
+        Raises:
+            HTTPException: If request not found
+        """
+        def load() -> str:
+            updated_at = self.request_repo.get_updated_at(request_id)
+            if updated_at is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Request with ID {request_id} not found"
+                )
+            return updated_at.isoformat()
+        
+        value = cache.get_or_load(
+            request_namespace(request_id),
+            {"view": "version", "id": request_id},
+            load
+        )
+        return datetime.fromisoformat(value)
+    
+    def get_list_version(
+        self,
+        status: Optional[RequestStatus] = None,
+        category: Optional[RequestCategory] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        search_query: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        near: Optional[GeoRadius] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get the version fingerprint of a filtered request collection.
+        
+        Args:
+            status: Filter by status
+            category: Filter by category
+            city: Filter by city
+            state: Filter by state
+            search_query: Optional text search
+            skills: Optional required skills filter
+            near: Optional radius filter
+            
+        Returns:
+            Tuple of (row count, latest updated_at)
+        """
+        filters = {
+            "search_query": search_query,
+            "status": status,
+            "category": category,
+            "city": city,
+            "state": state,
+            "skills": skills,
+        }
+        
+        def load() -> Dict[str, Any]:
+            count, last_updated = self.request_repo.get_version(**filters, near=near)
+            return {
+                "count": count,
+                "last_updated": last_updated.isoformat() if last_updated else None
+            }
+        
+        value = cache.get_or_load(
+            REQUEST_FEED_NAMESPACE,
+            {"view": "version", **filters, "near": near._asdict() if near else None},
+            load
+        )
+        last_updated = value["last_updated"]
+        return value["count"], datetime.fromisoformat(last_updated) if last_updated else None
+    
     def list_requests(
         self,
         skip: int = 0,
@@ -90,11 +205,15 @@ class RequestService:
         status: Optional[RequestStatus] = None,
         category: Optional[RequestCategory] = None,
         city: Optional[str] = None,
-        state: Optional[str] = None
-    ) -> RequestListResponse:
+        state: Optional[str] = None,
+        view: RequestView = RequestView.SUMMARY
+    ) -> Dict[str, Any]:
         """
         List requests with pagination and filters.
         
+        Anonymous feed pages are served from the cache, keyed on the
+        normalised filters.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum records to return
@@ -102,56 +221,161 @@ class RequestService:
             category: Filter by category
             city: Filter by city
             state: Filter by state
+            view: Summary (feed cards) or full projection
             
         Returns:
-            RequestListResponse with paginated data
+            RequestSummaryListResponse or RequestListResponse data as a
+            JSON-compatible dict
         """
-        requests, total = self.request_repo.get_all(
-            skip=skip,
-            limit=limit,
-            status=status,
-            category=category,
-            city=city,
-            state=state
-        )
+        summary = view == RequestView.SUMMARY
         
-        return RequestListResponse(
-            requests=requests,
-            total=total,
-            page=skip // limit + 1,
-            page_size=limit,
-            total_pages=(total + limit - 1) // limit
+        def load() -> Dict[str, Any]:
+            requests, total = self.request_repo.get_all(
+                skip=skip,
+                limit=limit,
+                status=status,
+                category=category,
+                city=city,
+                state=state,
+                summary=summary
+            )
+            return serialize_request_list(requests, total, skip, limit, summary=summary)
+        
+        return cache.get_or_load(
+            REQUEST_FEED_NAMESPACE,
+            {
+                "view": "list",
+                "projection": view,
+                "skip": skip,
+                "limit": limit,
+                "status": status,
+                "category": category,
+                "city": city,
+                "state": state,
+            },
+            load
         )
     
-    def search_requests(self, filters: RequestSearchFilters) -> RequestListResponse:
+    def resolve_near(self, pincode: Optional[str], radius_km: float) -> Optional[GeoRadius]:
+        """
+        Resolve a radius filter centred on a pincode.
+        
+        Args:
+            pincode: Centre pincode, or None for no radius filter
+            radius_km: Radius in km
+            
+        Returns:
+            GeoRadius, or None when no pincode is given
+            
+        Raises:
+            HTTPException: If the pincode cannot be located
+        """
+        if not pincode:
+            return None
+        
+        point = lookup_pincode(pincode)
+        if point is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown pincode: {pincode}"
+            )
+        return GeoRadius(point.latitude, point.longitude, radius_km)
+    
+    def search_requests(
+        self,
+        filters: RequestSearchFilters,
+        view: RequestView = RequestView.SUMMARY,
+        near: Optional[GeoRadius] = None
+    ) -> Dict[str, Any]:
         """
         Search requests with advanced filters.
         
+        Results are served from the cache, keyed on the normalised filters.
+        
         Args:
             filters: Search filters
+            view: Summary (feed cards) or full projection
+            near: Radius filter resolved from filters.near_pincode (or a
+                user's stored location)
             
         Returns:
-            RequestListResponse with search results
+            RequestSummaryListResponse or RequestListResponse data as a
+            JSON-compatible dict
         """
-        requests, total = self.request_repo.search(
-            search_query=filters.search_query,
-            category=filters.category,
-            status=filters.status,
-            city=filters.city,
-            state=filters.state,
-            skip=filters.skip,
-            limit=filters.limit
+        summary = view == RequestView.SUMMARY
+        
+        def load() -> Dict[str, Any]:
+            requests, total = self.request_repo.search(
+                search_query=filters.search_query,
+                category=filters.category,
+                status=filters.status,
+                city=filters.city,
+                state=filters.state,
+                skills=filters.skills,
+                near=near,
+                skip=filters.skip,
+                limit=filters.limit,
+                summary=summary
+            )
+            return serialize_request_list(
+                requests, total, filters.skip, filters.limit, summary=summary
+            )
+        
+        return cache.get_or_load(
+            REQUEST_FEED_NAMESPACE,
+            {
+                "view": "search",
+                "projection": view,
+                **filters.model_dump(),
+                "near": near._asdict() if near else None,
+            },
+            load
         )
+    
+    def get_nearby_requests(
+        self,
+        user: User,
+        radius_km: float,
+        category: Optional[RequestCategory] = None,
+        skip: int = 0,
+        limit: int = 20,
+        view: RequestView = RequestView.SUMMARY
+    ) -> Dict[str, Any]:
+        """
+        Get open requests near a user's profile location.
+        
+        Args:
+            user: Current user
+            radius_km: Search radius in km
+            category: Optional category filter
+            skip: Pagination offset
+            limit: Page size
+            view: Summary (feed cards) or full projection
+            
+        Returns:
+            RequestSummaryListResponse or RequestListResponse data as a
+            JSON-compatible dict
+            
+        Raises:
+            HTTPException: If the user's pincode has not been located
+        """
+        if user.latitude is None or user.longitude is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Add a valid pincode to your profile to see nearby requests"
+            )
         
-        return RequestListResponse(
-            requests=requests,
-            total=total,
-            page=filters.skip // filters.limit + 1,
-            page_size=filters.limit,
-            total_pages=(total + filters.limit - 1) // filters.limit
+        filters = RequestSearchFilters(
+            category=category,
+            status=RequestStatus.OPEN,
+            radius_km=radius_km,
+            skip=skip,
+            limit=limit
         )
+        near = GeoRadius(user.latitude, user.longitude, radius_km)
+        return self.search_requests(filters, view=view, near=near)
     
-    def get_my_requests(self, user_id: int, skip: int = 0, limit: int = 20) -> RequestListResponse:
+    def get_my_requests(self, user_id: int, skip: int = 0, limit: int = 20) -> Dict[str, Any]:
         """
         Get requests posted by current society.
         
@@ -161,7 +385,7 @@ class RequestService:
             limit: Page size
             
         Returns:
-            RequestListResponse with user's requests
+            RequestListResponse data with user's requests
         """
         user = self.user_repo.get_by_id(user_id)
         print(f"🔐 DEBUG get_my_requests - User ID: {user_id}")
@@ -171,20 +395,14 @@ class RequestService:
         
         requests, total = self.request_repo.get_by_society(user_id, skip, limit)
         
-        return RequestListResponse(
-            requests=requests,
-            total=total,
-            page=skip // limit + 1,
-            page_size=limit,
-            total_pages=(total + limit - 1) // limit
-        )
+        return serialize_request_list(requests, total, skip, limit)
     
     def get_assigned_requests(
         self,
         contractor_id: int,
         skip: int = 0,
         limit: int = 20
-    ) -> RequestListResponse:
+    ) -> Dict[str, Any]:
         """
         Get requests assigned to contractor.
         
@@ -194,17 +412,11 @@ class RequestService:
             limit: Page size
             
         Returns:
-            RequestListResponse with assigned requests
+            RequestListResponse data with assigned requests
         """
         requests, total = self.request_repo.get_by_contractor(contractor_id, skip, limit)
         
-        return RequestListResponse(
-            requests=requests,
-            total=total,
-            page=skip // limit + 1,
-            page_size=limit,
-            total_pages=(total + limit - 1) // limit
-        )
+        return serialize_request_list(requests, total, skip, limit)
     
     def update_request(
         self,
@@ -246,7 +458,12 @@ class RequestService:
         
         # Update request
         data = update_data.model_dump(exclude_unset=True)
+        if data.get("pincode") is not None:
+            # Set directly: an unresolvable pincode must clear the old location
+            for key, value in locate_pincode(data["pincode"]).items():
+                setattr(request, key, value)
         updated_request = self.request_repo.update(request, data)
+        self.matching_service.on_request_saved(updated_request)
         return updated_request
     
     def update_request_status(
@@ -313,11 +530,28 @@ class RequestService:
                 detail=f"Cannot transition from {current_status} to {new_status}"
             )
         
-        # Update status
+        # Update status (the outbox event commits with it)
+        self.notification_service.on_request_status_changed(
+            request,
+            new_status,
+            changed_by=user_id,
+            assigned_contractor_id=status_data.assigned_contractor_id
+        )
         updated_request = self.request_repo.update_status(
             request,
             new_status,
-            status_data.contractor_id
+            status_data.assigned_contractor_id
+        )
+        self.matching_service.on_request_saved(updated_request)
+        
+        realtime.publish(
+            [updated_request.society_id, updated_request.assigned_contractor_id],
+            EventType.REQUEST_STATUS_CHANGED,
+            {
+                "request_id": updated_request.id,
+                "status": updated_request.status.value,
+                "assigned_contractor_id": updated_request.assigned_contractor_id,
+            }
         )
         return updated_request
     
@@ -361,4 +595,5 @@ class RequestService:
             )
         
         # Delete request
+        self.matching_service.on_request_deleted(request.id)
         return self.request_repo.delete(request)
@@ -0,0 +1,193 @@
+"""
+Sync service for the mobile delta-sync endpoint.
+
+A client calls GET /sync without a cursor once, then with the cursor from
+its last response. Each call returns requests, bids and the user's profile
+changed since the cursor, plus IDs deleted since then, ordered by
+(updated_at, id) so pages never skip or repeat a row.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from fastapi import HTTPException, status
+
+from app.models.sync import SyncEntityType
+from app.models.user import User
+from app.repositories.sync_repository import SyncRepository, Position
+from app.schemas.serializers import serialize_request, serialize_bid
+from app.schemas.user import UserProfile
+
+
+# Rows updated in the last few seconds are left for the next sync, so a
+# transaction that committed late with an earlier updated_at is not skipped
+SYNC_SETTLE_SECONDS = 2
+
+# Tombstones are kept this long; older cursors get a full resync
+SYNC_TOMBSTONE_RETENTION_DAYS = 30
+
+CURSOR_VERSION = 1
+
+
+def _encode_position(position: Optional[Position]) -> Optional[list]:
+    """Keyset position as JSON."""
+    if position is None:
+        return None
+    return [position[0].isoformat(), position[1]]
+
+
+def _decode_position(value: Optional[list]) -> Optional[Position]:
+    """Keyset position from JSON."""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value[0]), int(value[1])
+
+
+class SyncService:
+    """Service for delta sync."""
+    
+    def __init__(self, sync_repo: SyncRepository):
+        """Initialize service with repository."""
+        self.sync_repo = sync_repo
+    
+    def encode_cursor(self, state: Dict[str, Any]) -> str:
+        """
+        Encode sync state as an opaque cursor.
+        
+        Args:
+            state: Cursor state
+        
+        Returns:
+            URL-safe cursor string
+        """
+        raw = json.dumps({"v": CURSOR_VERSION, **state}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+    
+    def decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        """
+        Decode a cursor from a previous sync.
+        
+        Args:
+            cursor: Cursor string
+        
+        Returns:
+            Cursor state
+        
+        Raises:
+            HTTPException: If the cursor is malformed or from another version
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            state = json.loads(raw)
+            if state.get("v") != CURSOR_VERSION:
+                raise ValueError("unsupported cursor version")
+            state["at"] = datetime.fromisoformat(state["at"])
+            for key in ("requests", "bids", "deleted"):
+                state[key] = _decode_position(state.get(key))
+            state["profile"] = datetime.fromisoformat(state["profile"]) if state.get("profile") else None
+            return state
+        except (binascii.Error, ValueError, KeyError, TypeError, IndexError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid sync cursor; sync again without a cursor"
+            )
+    
+    def sync(self, user: User, cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Get everything changed for a user since a cursor.
+        
+        A first sync (or one whose cursor predates the tombstone retention
+        window) returns the user's full working set, paged like any other
+        sync. While has_more is true the cursor pins the same snapshot time,
+        so paging through a large backlog is consistent.
+        
+        Args:
+            user: Syncing user
+            cursor: Cursor from the previous response, or None
+            limit: Maximum rows per entity type in this page
+        
+        Returns:
+            SyncResponse data as a JSON-compatible dict
+        """
+        now = datetime.utcnow()
+        state = self.decode_cursor(cursor) if cursor else None
+        
+        full_resync = False
+        if state and state["at"] < now - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS):
+            state = None
+            full_resync = True
+        
+        if state and state.get("pinned"):
+            until = state["at"]
+        else:
+            until = now - timedelta(seconds=SYNC_SETTLE_SECONDS)
+        
+        if state is None:
+            # Nothing local to delete yet, so start the tombstone feed at now
+            state = {
+                "initial": True,
+                "requests": None,
+                "bids": None,
+                "deleted": (until, 0),
+                "profile": None,
+            }
+        
+        requests = self.sync_repo.get_changed_requests(
+            user, state["requests"], until, limit, initial=state["initial"]
+        )
+        bids = self.sync_repo.get_changed_bids(user, state["bids"], until, limit)
+        tombstones = (
+            []
+            if state["initial"]
+            else self.sync_repo.get_tombstones(user, state["deleted"], until, limit)
+        )
+        
+        profile = None
+        if user.updated_at <= until and (state["profile"] is None or user.updated_at > state["profile"]):
+            profile = UserProfile.model_validate(user).model_dump(mode="json")
+            state["profile"] = user.updated_at
+        
+        if requests:
+            state["requests"] = (requests[-1].updated_at, requests[-1].id)
+        if bids:
+            state["bids"] = (bids[-1].updated_at, bids[-1].id)
+        if tombstones:
+            state["deleted"] = (tombstones[-1].deleted_at, tombstones[-1].id)
+        
+        has_more = any(len(rows) == limit for rows in (requests, bids, tombstones))
+        
+        if state["initial"] and not has_more:
+            # The working set is complete up to `until`; later syncs only need
+            # what changes after it (rows outside the first-sync scope included)
+            state["requests"] = state["bids"] = (until, 0)
+        
+        next_cursor = self.encode_cursor({
+            "at": until.isoformat(),
+            "pinned": has_more,
+            "initial": state["initial"] and has_more,
+            "requests": _encode_position(state["requests"]),
+            "bids": _encode_position(state["bids"]),
+            "deleted": _encode_position(state["deleted"]),
+            "profile": state["profile"].isoformat() if state["profile"] else None,
+        })
+        
+        return {
+            "cursor": next_cursor,
+            "has_more": has_more,
+            "full_resync": full_resync,
+            "requests": [serialize_request(request) for request in requests],
+            "bids": [serialize_bid(bid) for bid in bids],
+            "profile": profile,
+            "deleted": {
+                "requests": [
+                    tombstone.entity_id for tombstone in tombstones
+                    if tombstone.entity_type == SyncEntityType.REQUEST
+                ],
+                "bids": [
+                    tombstone.entity_id for tombstone in tombstones
+                    if tombstone.entity_type == SyncEntityType.BID
+                ],
+            },
+        }
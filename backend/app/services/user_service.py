@@ -6,9 +6,13 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.repositories.user_repository import UserRepository
+from app.repositories.matching_repository import MatchingRepository
+from app.services.matching_service import MatchingService
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import hash_password
+from app.schemas.serializers import serialize_user
+from app.core.passwords import password_hasher
+from app.core.geo import locate_pincode
 
 
 class UserService:
@@ -18,6 +22,7 @@ class UserService:
         """Initialize service with database session."""
         self.db = db
         self.user_repo = UserRepository(db)
+        self.matching_service = MatchingService(MatchingRepository(db))
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """
@@ -65,11 +70,16 @@ class UserService:
         
         # Hash password if provided
         if user_data.password:
-            user_dict['password_hash'] = hash_password(user_data.password)
+            user_dict['password_hash'] = password_hasher.hash(user_data.password)
+        
+        user_dict.update(locate_pincode(user_dict.get('pincode')))
         
         # Create user
         user = self.user_repo.create(user_dict)
         
+        if user.role == UserRole.CONTRACTOR:
+            self.matching_service.on_contractor_changed(user)
+        
         return user
     
     def update_user(self, user_id: int, update_data: UserUpdate) -> User:
@@ -94,8 +104,16 @@ class UserService:
         
         # Update user
         update_dict = update_data.model_dump(exclude_unset=True)
+        if update_dict.get('pincode') is not None:
+            # Set directly: an unresolvable pincode must clear the old location
+            for key, value in locate_pincode(update_dict['pincode']).items():
+                setattr(user, key, value)
         updated_user = self.user_repo.update(user, update_dict)
         
+        # City and description drive contractor recommendations
+        if updated_user.role == UserRole.CONTRACTOR and {"city", "description"} & update_dict.keys():
+            self.matching_service.on_contractor_changed(updated_user)
+        
         return updated_user
     
     def verify_user(self, user_id: int) -> User:
@@ -144,7 +162,10 @@ class UserService:
         if not user:
             raise ValueError("User not found")
         
-        return self.user_repo.deactivate(user)
+        user = self.user_repo.deactivate(user)
+        if user.role == UserRole.CONTRACTOR:
+            self.matching_service.on_contractor_changed(user)
+        return user
     
     def activate_user(self, user_id: int) -> User:
         """
@@ -160,7 +181,10 @@ class UserService:
         if not user:
             raise ValueError("User not found")
         
-        return self.user_repo.activate(user)
+        user = self.user_repo.activate(user)
+        if user.role == UserRole.CONTRACTOR:
+            self.matching_service.on_contractor_changed(user)
+        return user
     
     def get_contractors(self, skip: int = 0, limit: int = 100):
         """
@@ -197,6 +221,6 @@ class UserService:
             limit: Maximum number of records
             
         Returns:
-            List of user objects
+            List of UserResponse dicts
         """
-        return self.user_repo.list(skip=skip, limit=limit)
\ No newline at end of file
+        return [serialize_user(row) for row in self.user_repo.get_all(skip=skip, limit=limit)]
\ No newline at end of file
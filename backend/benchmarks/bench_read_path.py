@@ -0,0 +1,170 @@
+"""
+Benchmark ORM vs Core row-DTO read paths for listing pages.
+
+Seeds a throwaway database (in-memory SQLite by default) and compares, per
+page of rows, the latency and allocated memory of loading ORM objects with
+session.query() against the Core select + NamedTuple DTOs used by the
+repositories.
+
+Usage:
+    python benchmarks/bench_read_path.py [--rows 100] [--repeat 50]
+    python benchmarks/bench_read_path.py --database-url postgresql://...
+
+The database is dropped and recreated, so only point --database-url at a
+scratch database.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole, UserStatus
+from app.repositories.request_repository import RequestRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.serializers import serialize_request_list, serialize_user
+import app.models  # noqa: F401  (register all tables)
+
+
+def seed(session, rows: int) -> None:
+    """Insert one society plus `rows` users and requests."""
+    now = datetime.utcnow()
+    society = User(
+        phone_number="+910000000000",
+        role=UserRole.SOCIETY,
+        status=UserStatus.ACTIVE,
+        name="Benchmark Society",
+        city="Mumbai",
+    )
+    session.add(society)
+    session.flush()
+    
+    session.add_all(
+        User(
+            phone_number=f"+91{i:010d}",
+            role=UserRole.CONTRACTOR,
+            status=UserStatus.ACTIVE,
+            name=f"Contractor {i}",
+            description="Waterproofing, plastering and painting. " * 4,
+            city="Mumbai",
+            state="Maharashtra",
+        )
+        for i in range(1, rows + 1)
+    )
+    session.add_all(
+        Request(
+            society_id=society.id,
+            title=f"Repair work item {i}",
+            description="Waterproofing and plaster repair for the terrace and stairwell. " * 8,
+            category=RequestCategory.PAINTING,
+            status=RequestStatus.OPEN,
+            location="Sector 12, near the main gate",
+            city="Mumbai",
+            state="Maharashtra",
+            pincode="400001",
+            required_skills=["waterproofing", "plastering", "painting"],
+            images=["https://cdn.example.com/a.jpg", "https://cdn.example.com/b.jpg"],
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(rows)
+    )
+    session.commit()
+
+
+def orm_requests(session, rows: int) -> dict:
+    """Previous read path: ORM objects tracked in the identity map."""
+    query = session.query(Request)
+    total = query.count()
+    requests = query.order_by(Request.created_at.desc()).limit(rows).all()
+    payload = serialize_request_list(requests, total, 0, rows)
+    session.expunge_all()
+    return payload
+
+
+def core_requests(session, rows: int) -> dict:
+    """Current read path: Core select mapped into RequestRow tuples."""
+    requests, total = RequestRepository(session).get_all(limit=rows)
+    return serialize_request_list(requests, total, 0, rows)
+
+
+def orm_users(session, rows: int) -> list:
+    """Previous admin listing: User ORM objects."""
+    users = session.query(User).order_by(User.id).limit(rows).all()
+    payload = [serialize_user(user) for user in users]
+    session.expunge_all()
+    return payload
+
+
+def core_users(session, rows: int) -> list:
+    """Current admin listing: UserRow tuples."""
+    return [serialize_user(user) for user in UserRepository(session).get_all(limit=rows)]
+
+
+def measure(label: str, func, repeat: int) -> tuple[float, int]:
+    """Print latency and peak traced memory of one call."""
+    seconds = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+    
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"  {label:<24} {seconds * 1000:8.3f} ms/page {peak / 1024:10.1f} KiB peak")
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing read paths")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=50, help="Iterations per run")
+    parser.add_argument("--database-url", default="sqlite://", help="Scratch database URL")
+    args = parser.parse_args()
+    
+    if args.database_url.startswith("sqlite"):
+        engine = create_engine(
+            args.database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(args.database_url)
+    
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        seed(session, args.rows)
+        session.expunge_all()
+        
+        print(f"\n📊 Loading {args.rows} rows per page ({args.repeat} iterations, best of 3)\n")
+        
+        for name, orm_func, core_func in (
+            ("Requests", orm_requests, core_requests),
+            ("Users", orm_users, core_users),
+        ):
+            print(f"{name}:")
+            slow, slow_peak = measure("ORM objects", lambda: orm_func(session, args.rows), args.repeat)
+            fast, fast_peak = measure("Core rows + DTOs", lambda: core_func(session, args.rows), args.repeat)
+            print(f"  {'speed-up':<24} {slow / fast:8.1f}x {slow_peak / fast_peak:14.1f}x less memory\n")
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark list-endpoint serialisation.
+
+Compares the Pydantic path (from_attributes validation, response_model
+re-validation, jsonable_encoder + stdlib json) against the fast path
+(plain-dict serializers + FastJSONResponse) for a page of requests and bids.
+
+Usage:
+    python benchmarks/bench_serialization.py [--rows 100] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import FastJSONResponse
+from app.models.bid import Bid, BidStatus
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole
+from app.schemas.bid import BidListResponse
+from app.schemas.request import RequestListResponse
+from app.schemas.serializers import serialize_bid_list, serialize_request_list
+
+
+def make_requests(rows: int) -> list:
+    """Build transient Request objects shaped like real rows."""
+    now = datetime.utcnow()
+    return [
+        Request(
+            id=i,
+            society_id=1,
+            title=f"Repair work item {i}",
+            description="Waterproofing and plaster repair for the terrace and stairwell. " * 3,
+            category=RequestCategory.PAINTING,
+            status=RequestStatus.OPEN,
+            location="Sector 12",
+            city="Mumbai",
+            state="Maharashtra",
+            pincode="400001",
+            estimated_duration_days=14,
+            required_skills=["waterproofing", "plastering", "painting"],
+            images=["https://cdn.example.com/a.jpg", "https://cdn.example.com/b.jpg"],
+            created_at=now - timedelta(hours=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def make_bids(rows: int) -> list:
+    """Build transient Bid objects with an attached contractor."""
+    now = datetime.utcnow()
+    contractor = User(id=2, name="Contractor", phone_number="+919000000002", city="Mumbai", role=UserRole.CONTRACTOR)
+    return [
+        Bid(
+            id=i,
+            request_id=1,
+            contractor_id=2,
+            contractor=contractor,
+            amount=25000.0 + i,
+            proposal="I have over ten years of experience and can start next week. " * 2,
+            status=BidStatus.PENDING,
+            created_at=now - timedelta(hours=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+# Reused so the Pydantic path is not charged for event loop setup
+_loop = asyncio.new_event_loop()
+
+
+def render_via_pydantic(model_class, payload: dict) -> bytes:
+    """Render the way the endpoints did before the fast path."""
+    field = create_response_field(name="Response", type_=model_class)
+    model = model_class(**payload)
+    content = _loop.run_until_complete(serialize_response(field=field, response_content=model))
+    return JSONResponse(content).body
+
+
+def bench(label: str, func, repeat: int) -> float:
+    """Run func repeatedly and print the mean time per call."""
+    seconds = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+    print(f"  {label:<28} {seconds * 1000:8.3f} ms/page")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list serialisation")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=200, help="Iterations per run")
+    args = parser.parse_args()
+    
+    requests = make_requests(args.rows)
+    bids = make_bids(args.rows)
+    
+    print(f"\n📊 Serialising {args.rows} rows per page ({args.repeat} iterations, best of 3)\n")
+    
+    print("Requests:")
+    slow = bench("pydantic + stdlib json", lambda: render_via_pydantic(
+        RequestListResponse,
+        dict(requests=requests, total=args.rows, page=1, page_size=args.rows, total_pages=1)
+    ), args.repeat)
+    fast = bench("serializers + orjson", lambda: FastJSONResponse(
+        serialize_request_list(requests, args.rows, 0, args.rows)
+    ).body, args.repeat)
+    print(f"  {'speed-up':<28} {slow / fast:8.1f}x\n")
+    
+    print("Bids:")
+    slow = bench("pydantic + stdlib json", lambda: render_via_pydantic(
+        BidListResponse,
+        dict(bids=bids, total=args.rows, page=1, page_size=args.rows, total_pages=1)
+    ), args.repeat)
+    fast = bench("serializers + orjson", lambda: FastJSONResponse(
+        serialize_bid_list(bids, args.rows, 1, args.rows, 1)
+    ).body, args.repeat)
+    print(f"  {'speed-up':<28} {slow / fast:8.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
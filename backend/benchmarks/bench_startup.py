@@ -0,0 +1,213 @@
+"""
+Cold-start benchmark and import-time profile.
+
+Two parts:
+
+1. Import profile: runs ``python -X importtime -c "import app.main"`` in a
+   fresh interpreter and reports the slowest modules (self time) and the
+   total per package, so a new eager import shows up by name.
+2. Cold start: starts uvicorn in a fresh process several times against a
+   small scratch database and measures the time until /ready answers
+   (startup warm-up finished) and the latency of the first OTP login after
+   that (the request that pays for anything still set up lazily). The
+   second login is timed too, as the warm baseline.
+
+The run fails (exit status 1) when the median time to the first OTP
+response (ready + first OTP) is over --target-ms, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--target-ms 3000]
+    python benchmarks/bench_startup.py --optional-routers "" --output after.json
+    python benchmarks/bench_startup.py --profile-only --top 30
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+import httpx
+
+from loadtest.environment import BACKEND_DIR, APIServer, create_scratch_engine, reset_schema, seed
+
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _package(module: str) -> str:
+    """Group key for a module: two levels inside app, the top level elsewhere."""
+    parts = module.split(".")
+    return ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+
+
+def profile_imports(env: Dict[str, str], top: int) -> dict:
+    """
+    Import app.main in a fresh interpreter with -X importtime.
+    
+    Args:
+        env: Environment for the child interpreter
+        top: Number of modules to keep in the ranking
+    
+    Returns:
+        Dict with total_ms, the slowest modules and per-package totals
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing app.main failed:\n{result.stderr[-2000:]}")
+    
+    modules = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        modules.append({"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000})
+        if name == "app.main" and len(indent) == 1:
+            total_us = cumulative_us
+    
+    packages: Dict[str, float] = defaultdict(float)
+    for row in modules:
+        packages[_package(row["module"])] += row["self_ms"]
+    
+    return {
+        "total_ms": total_us / 1000,
+        "module_count": len(modules),
+        "slowest": sorted(modules, key=lambda row: row["self_ms"], reverse=True)[:top],
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]),
+    }
+
+
+def print_profile(profile: dict) -> None:
+    """Print the import profile tables."""
+    print(f"\n📦 import app.main: {profile['total_ms']:.0f} ms over {profile['module_count']} modules (-X importtime)")
+    print(f"  {'slowest modules':<48} {'self ms':>9} {'cumul ms':>9}")
+    for row in profile["slowest"]:
+        print(f"  {row['module']:<48} {row['self_ms']:>9.1f} {row['cumulative_ms']:>9.1f}")
+    print(f"\n  {'by package':<48} {'self ms':>9}")
+    for package, ms in profile["packages"].items():
+        print(f"  {package:<48} {ms:>9.1f}")
+
+
+def cold_start(database_url: str, port: int, env: Dict[str, str], phones: List[str], log_path: Path) -> dict:
+    """
+    Start a fresh server, wait for /ready, then log in twice.
+    
+    Args:
+        database_url: Seeded scratch database
+        port: Port for the server
+        env: Extra environment for the app
+        phones: Two unused contractor phone numbers
+        log_path: File receiving the server's output
+    
+    Returns:
+        Timings in ms: ready, first_otp, second_otp
+    """
+    server = APIServer(database_url, port=port, workers=1, env=env, log_path=log_path)
+    start = time.perf_counter()
+    server.start(poll_interval=0.01)
+    timings = {"ready_ms": (time.perf_counter() - start) * 1000}
+    try:
+        with httpx.Client(base_url=server.base_url, timeout=60.0) as client:
+            for label, phone_number in zip(("first_otp_ms", "second_otp_ms"), phones):
+                start = time.perf_counter()
+                response = client.post("/api/v1/auth/login", json={"phone_number": phone_number})
+                timings[label] = (time.perf_counter() - start) * 1000
+                if response.status_code != 200:
+                    raise RuntimeError(f"Login returned {response.status_code}: {response.text[:200]}")
+    finally:
+        server.stop()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and cold start of the API")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure")
+    parser.add_argument("--target-ms", type=float, default=3000.0, help="Budget for the median ready + first OTP time")
+    parser.add_argument("--top", type=int, default=20, help="Modules and packages to list in the import profile")
+    parser.add_argument(
+        "--database-url",
+        help="Scratch database, dropped and recreated (default: a temporary SQLite file)"
+    )
+    parser.add_argument("--port", type=int, default=8766, help="Port for the API server")
+    parser.add_argument(
+        "--optional-routers",
+        help="OPTIONAL_ROUTERS for the app under test (default: inherit the environment)"
+    )
+    parser.add_argument("--profile-only", action="store_true", help="Only print the import profile")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    args = parser.parse_args()
+    
+    app_env = {
+        "OTP_DELIVERY_METHOD": "fake",
+        "OTP_FALLBACK_METHOD": "none",
+        "SMTP_ENABLED": "true",
+        "FAKE_PROVIDER_LATENCY_MS": "0",
+        "NOTIFICATION_DELIVERY_METHOD": "fake",
+    }
+    if args.optional_routers is not None:
+        app_env["OPTIONAL_ROUTERS"] = args.optional_routers
+    
+    profile = profile_imports({**os.environ, **app_env}, args.top)
+    print_profile(profile)
+    results = {"config": {"runs": args.runs, "target_ms": args.target_ms, **app_env}, "imports": profile}
+    
+    over_target = False
+    if not args.profile_only:
+        workdir = Path(tempfile.mkdtemp(prefix="bench-startup-"))
+        database_url = args.database_url or f"sqlite:///{workdir / 'startup.db'}"
+        engine = create_scratch_engine(database_url)
+        reset_schema(engine)
+        data = seed(engine, societies=1, contractors=2 * args.runs, requests=1)
+        engine.dispose()
+        
+        print(f"\n🚀 {args.runs} cold start(s); log: {workdir / 'server.log'}")
+        runs: List[Dict[str, float]] = []
+        for i in range(args.runs):
+            timings = cold_start(
+                database_url, args.port, app_env, data.contractor_phones[2 * i:2 * i + 2], workdir / "server.log"
+            )
+            timings["first_response_ms"] = timings["ready_ms"] + timings["first_otp_ms"]
+            runs.append(timings)
+            print(
+                f"  run {i + 1}: ready {timings['ready_ms']:.0f} ms, first OTP {timings['first_otp_ms']:.0f} ms, "
+                f"second OTP {timings['second_otp_ms']:.0f} ms"
+            )
+        
+        medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        print(f"\n  {'median':<20} {'ms':>9}")
+        for key, value in medians.items():
+            print(f"  {key[:-3]:<20} {value:>9.0f}")
+        results.update({"runs": runs, "median": medians})
+        
+        over_target = medians["first_response_ms"] > args.target_ms
+        if over_target:
+            print(f"\n❌ Cold start to first OTP {medians['first_response_ms']:.0f} ms is over the {args.target_ms:.0f} ms target")
+        else:
+            print(f"\n✅ Cold start to first OTP {medians['first_response_ms']:.0f} ms is within the {args.target_ms:.0f} ms target")
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+    if over_target:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Repository and schema micro-benchmark suite.
+
+Seeds a scratch database at several sizes with the scale-data generator
+(scripts/generate_scale_data.py), then times each method of
+RequestRepository, BidRepository, UserRepository and OTPRepository and the
+main Pydantic schemas and serializers. Every case reports wall time
+(mean, median, p95, min) and the number of SQL statements one call issues,
+so an added query shows up even when the timing noise hides it.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000,10000] [--min-time 0.2]
+    python benchmarks/bench_suite.py --database-url postgresql://... --output after.json
+    python benchmarks/bench_suite.py --filter BidRepository --output after.json
+    python benchmarks/compare.py before.json after.json
+
+Sizes are request counts; users, bids and OTPs scale with them. The database
+is dropped and recreated for every size, so only point --database-url at a
+scratch database. Postgres-only cases (JSONB skill filters) are skipped on
+SQLite.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.geo import GeoRadius
+from app.models.bid import Bid, BidStatus
+from app.models.otp import OTP
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole
+from app.repositories.bid_repository import BidRepository
+from app.repositories.otp_repository import OTPRepository
+from app.repositories.request_repository import RequestRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.bid import BidCreate, BidResponse
+from app.schemas.otp import OTPVerify
+from app.schemas.request import RequestCreate, RequestResponse, RequestSummaryResponse
+from app.schemas.serializers import serialize_bid_list, serialize_request_list
+from app.schemas.user import UserResponse
+from scripts.generate_scale_data import build_parser, populate
+import app.models  # noqa: F401  (register all tables)
+
+
+class QueryCounter:
+    """Counts SQL statements sent through an engine."""
+    
+    def __init__(self, engine):
+        """Start listening on the engine."""
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+    
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@dataclass
+class Context:
+    """Seeded IDs the cases query for (the busiest rows, so results are non-trivial)."""
+    
+    request_id: int
+    society_id: int
+    contractor_id: int
+    phone_number: str
+    email: str
+    otp_code: str
+    city: str
+
+
+@dataclass
+class Case:
+    """One benchmarked call."""
+    
+    name: str
+    run: Callable[[Session, Context, Any], Any]
+    setup: Optional[Callable[[Session, Context], Any]] = None
+    postgres_only: bool = False
+
+
+def page_of_requests(db: Session, ctx: Context) -> list:
+    return db.query(Request).order_by(Request.created_at.desc()).limit(20).all()
+
+
+def request_rows(db: Session, ctx: Context) -> list:
+    return RequestRepository(db).get_all(limit=20)[0]
+
+
+def summary_rows(db: Session, ctx: Context) -> list:
+    return RequestRepository(db).get_all(limit=20, summary=True)[0]
+
+
+def bids_of_hot_request(db: Session, ctx: Context) -> list:
+    return db.query(Bid).filter(Bid.request_id == ctx.request_id).limit(20).all()
+
+
+def page_of_users(db: Session, ctx: Context) -> list:
+    return db.query(User).order_by(User.id).limit(20).all()
+
+
+REQUEST_PAYLOAD = {
+    "title": "Terrace waterproofing before monsoon",
+    "description": "Terrace slab is seeping into the top-floor flats; needs full waterproofing.",
+    "category": "PAINTING",
+    "city": "Mumbai",
+    "state": "Maharashtra",
+    "pincode": "400001",
+    "required_skills": "Waterproofing, plastering",
+}
+
+BID_PAYLOAD = {
+    "request_id": 1,
+    "amount": 45000,
+    "proposal": "Experienced team, all materials included, can start this week with a five year warranty.",
+    "estimated_duration_days": 5,
+}
+
+
+CASES: List[Case] = [
+    # RequestRepository
+    Case("RequestRepository.get_by_id", lambda db, ctx, _: RequestRepository(db).get_by_id(ctx.request_id)),
+    Case("RequestRepository.get_updated_at", lambda db, ctx, _: RequestRepository(db).get_updated_at(ctx.request_id)),
+    Case("RequestRepository.get_version", lambda db, ctx, _: RequestRepository(db).get_version(status=RequestStatus.OPEN, city=ctx.city)),
+    Case("RequestRepository.get_all", lambda db, ctx, _: RequestRepository(db).get_all(limit=20)),
+    Case("RequestRepository.get_all[summary,filtered]", lambda db, ctx, _: RequestRepository(db).get_all(
+        limit=20, status=RequestStatus.OPEN, category=RequestCategory.PLUMBING, summary=True
+    )),
+    Case("RequestRepository.search[text]", lambda db, ctx, _: RequestRepository(db).search(search_query="terrace")),
+    Case("RequestRepository.search[text,city]", lambda db, ctx, _: RequestRepository(db).search(
+        search_query="leaking", city=ctx.city, status=RequestStatus.OPEN, summary=True
+    )),
+    Case("RequestRepository.search[skills]", lambda db, ctx, _: RequestRepository(db).search(
+        skills=["waterproofing"], status=RequestStatus.OPEN
+    ), postgres_only=True),
+    Case("RequestRepository.search[near]", lambda db, ctx, _: RequestRepository(db).search(
+        near=GeoRadius(19.076, 72.8777, 10), summary=True
+    )),
+    Case("RequestRepository.get_by_society", lambda db, ctx, _: RequestRepository(db).get_by_society(ctx.society_id)),
+    Case("RequestRepository.get_by_contractor", lambda db, ctx, _: RequestRepository(db).get_by_contractor(ctx.contractor_id)),
+    Case("RequestRepository.count_by_status", lambda db, ctx, _: RequestRepository(db).count_by_status(RequestStatus.OPEN)),
+    Case("RequestRepository.count_by_society", lambda db, ctx, _: RequestRepository(db).count_by_society(ctx.society_id)),
+    Case("RequestRepository.count_by_contractor", lambda db, ctx, _: RequestRepository(db).count_by_contractor(ctx.contractor_id)),
+    Case("RequestRepository.create", lambda db, ctx, _: RequestRepository(db).create({
+        **RequestCreate(**REQUEST_PAYLOAD).model_dump(), "society_id": ctx.society_id
+    })),
+    # BidRepository
+    Case("BidRepository.get_by_id", lambda db, ctx, _: BidRepository(db).get_by_id(1)),
+    Case("BidRepository.get_updated_at", lambda db, ctx, _: BidRepository(db).get_updated_at(1)),
+    Case("BidRepository.get_by_request", lambda db, ctx, _: BidRepository(db).get_by_request(ctx.request_id)),
+    Case("BidRepository.get_by_contractor", lambda db, ctx, _: BidRepository(db).get_by_contractor(ctx.contractor_id)),
+    Case("BidRepository.get_version_by_request", lambda db, ctx, _: BidRepository(db).get_version_by_request(ctx.request_id)),
+    Case("BidRepository.get_version_by_contractor", lambda db, ctx, _: BidRepository(db).get_version_by_contractor(ctx.contractor_id)),
+    Case("BidRepository.get_existing_bid", lambda db, ctx, _: BidRepository(db).get_existing_bid(ctx.request_id, ctx.contractor_id)),
+    Case("BidRepository.count_by_request", lambda db, ctx, _: BidRepository(db).count_by_request(ctx.request_id)),
+    Case("BidRepository.count_by_contractor", lambda db, ctx, _: BidRepository(db).count_by_contractor(ctx.contractor_id, BidStatus.ACCEPTED)),
+    Case("BidRepository.get_statistics", lambda db, ctx, _: BidRepository(db).get_statistics(ctx.request_id)),
+    # UserRepository
+    Case("UserRepository.get_by_id", lambda db, ctx, _: UserRepository(db).get_by_id(ctx.contractor_id)),
+    Case("UserRepository.get_by_phone", lambda db, ctx, _: UserRepository(db).get_by_phone(ctx.phone_number)),
+    Case("UserRepository.get_by_email", lambda db, ctx, _: UserRepository(db).get_by_email(ctx.email)),
+    Case("UserRepository.get_by_phone_or_email", lambda db, ctx, _: UserRepository(db).get_by_phone_or_email("+910000000000", ctx.email)),
+    Case("UserRepository.get_all", lambda db, ctx, _: UserRepository(db).get_all(limit=100)),
+    Case("UserRepository.get_by_role", lambda db, ctx, _: UserRepository(db).get_by_role(UserRole.CONTRACTOR, limit=100)),
+    Case("UserRepository.count_by_role", lambda db, ctx, _: UserRepository(db).count_by_role(UserRole.CONTRACTOR)),
+    Case("UserRepository.exists_by_phone", lambda db, ctx, _: UserRepository(db).exists_by_phone(ctx.phone_number)),
+    Case("UserRepository.exists_by_email", lambda db, ctx, _: UserRepository(db).exists_by_email(ctx.email)),
+    Case(
+        "UserRepository.update_last_login",
+        lambda db, ctx, user: UserRepository(db).update_last_login(user),
+        setup=lambda db, ctx: db.get(User, ctx.contractor_id),
+    ),
+    # OTPRepository
+    Case("OTPRepository.get_latest_by_phone", lambda db, ctx, _: OTPRepository(db).get_latest_by_phone(ctx.phone_number)),
+    Case("OTPRepository.get_valid_otp", lambda db, ctx, _: OTPRepository(db).get_valid_otp(ctx.phone_number, ctx.otp_code)),
+    Case("OTPRepository.get_recent_otps", lambda db, ctx, _: OTPRepository(db).get_recent_otps(ctx.phone_number)),
+    Case("OTPRepository.count_recent_attempts", lambda db, ctx, _: OTPRepository(db).count_recent_attempts(ctx.phone_number)),
+    Case("OTPRepository.get_by_user", lambda db, ctx, _: OTPRepository(db).get_by_user(1)),
+    Case("OTPRepository.invalidate_previous_otps", lambda db, ctx, _: OTPRepository(db).invalidate_previous_otps(ctx.phone_number)),
+    Case("OTPRepository.create", lambda db, ctx, _: OTPRepository(db).create({
+        "phone_number": "+910000000001",
+        "otp_code": "123456",
+        "purpose": "login",
+        "expires_at": datetime.utcnow(),
+    })),
+    # Schemas and serializers (setup loads the rows; lazy loads during validation are counted)
+    Case("RequestCreate.validate", lambda db, ctx, _: RequestCreate(**REQUEST_PAYLOAD)),
+    Case("BidCreate.validate", lambda db, ctx, _: BidCreate(**BID_PAYLOAD)),
+    Case("OTPVerify.validate", lambda db, ctx, _: OTPVerify(phone_number="+919876543210", otp_code="123456")),
+    Case(
+        "RequestResponse.from_orm[20]",
+        lambda db, ctx, rows: [RequestResponse.model_validate(row).model_dump(mode="json") for row in rows],
+        setup=page_of_requests,
+    ),
+    Case(
+        "RequestResponse.from_rows[20]",
+        lambda db, ctx, rows: [RequestResponse.model_validate(row._asdict()).model_dump(mode="json") for row in rows],
+        setup=request_rows,
+    ),
+    Case(
+        "RequestSummaryResponse.from_rows[20]",
+        lambda db, ctx, rows: [RequestSummaryResponse.model_validate(row._asdict()).model_dump(mode="json") for row in rows],
+        setup=summary_rows,
+    ),
+    Case(
+        "BidResponse.from_orm[20]",
+        lambda db, ctx, bids: [BidResponse.model_validate(bid).model_dump(mode="json") for bid in bids],
+        setup=bids_of_hot_request,
+    ),
+    Case(
+        "UserResponse.from_orm[20]",
+        lambda db, ctx, users: [UserResponse.model_validate(user).model_dump(mode="json") for user in users],
+        setup=page_of_users,
+    ),
+    Case("serialize_request_list[20]", lambda db, ctx, rows: serialize_request_list(rows, 20, 0, 20), setup=request_rows),
+    Case("serialize_bid_list[20]", lambda db, ctx, bids: serialize_bid_list(bids, len(bids), 1, 20, 1), setup=bids_of_hot_request),
+]
+
+
+def build_context(db: Session) -> Context:
+    """Pick the busiest request, society and contractor in the seeded data."""
+    request_id, society_id = db.execute(
+        select(Bid.request_id, Request.society_id)
+        .join(Request, Request.id == Bid.request_id)
+        .group_by(Bid.request_id, Request.society_id)
+        .order_by(func.count().desc(), Bid.request_id)
+        .limit(1)
+    ).one()
+    contractor_id = db.execute(
+        select(Bid.contractor_id).group_by(Bid.contractor_id).order_by(func.count().desc(), Bid.contractor_id).limit(1)
+    ).scalar()
+    contractor = db.get(User, contractor_id)
+    otp = db.execute(select(OTP).where(OTP.phone_number == contractor.phone_number).limit(1)).scalar()
+    city = db.execute(
+        select(Request.city).group_by(Request.city).order_by(func.count().desc()).limit(1)
+    ).scalar()
+    return Context(
+        request_id=request_id,
+        society_id=society_id,
+        contractor_id=contractor_id,
+        phone_number=contractor.phone_number,
+        email=contractor.email,
+        otp_code=otp.otp_code if otp else "000000",
+        city=city,
+    )
+
+
+def measure(db: Session, ctx: Context, case: Case, counter: QueryCounter, min_time: float, min_iterations: int) -> Dict[str, Any]:
+    """Time a case until min_time has passed (and at least min_iterations calls)."""
+    timings = []
+    queries = None
+    deadline = time.perf_counter() + min_time
+    while len(timings) < min_iterations or time.perf_counter() < deadline:
+        argument = case.setup(db, ctx) if case.setup else None
+        before = counter.count
+        start = time.perf_counter()
+        case.run(db, ctx, argument)
+        timings.append((time.perf_counter() - start) * 1000)
+        if queries is None:
+            queries = counter.count - before
+        # Start every call with an empty identity map
+        db.expunge_all()
+    
+    timings.sort()
+    return {
+        "iterations": len(timings),
+        "queries": queries,
+        "mean_ms": round(statistics.fmean(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4),
+        "min_ms": round(timings[0], 4),
+    }
+
+
+def seed_size(engine, size: int, seed: int) -> None:
+    """Recreate the schema and load a dataset with `size` requests."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    args = build_parser().parse_args([
+        "--requests", str(size),
+        "--societies", str(max(10, size // 50)),
+        "--contractors", str(max(40, size // 5)),
+        "--seed", str(seed),
+    ])
+    with engine.begin() as conn:
+        populate(conn, args, log=lambda message: print(f"   {message}"))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark repositories and schemas")
+    parser.add_argument("--sizes", default="1000,10000", help="Comma-separated request counts to seed")
+    parser.add_argument("--database-url", default="sqlite://", help="Scratch database URL")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to spend per case")
+    parser.add_argument("--min-iterations", type=int, default=5, help="Calls per case at least")
+    parser.add_argument("--filter", help="Only cases whose name contains this")
+    parser.add_argument("--seed", type=int, default=42, help="Data generator seed")
+    parser.add_argument("--output", help="Write results as JSON (see benchmarks/compare.py)")
+    args = parser.parse_args()
+    
+    if args.database_url.startswith("sqlite"):
+        engine = create_engine(
+            args.database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(args.database_url)
+    counter = QueryCounter(engine)
+    postgres = engine.dialect.name == "postgresql"
+    cases = [
+        case for case in CASES
+        if (not args.filter or args.filter in case.name) and (postgres or not case.postgres_only)
+    ]
+    
+    results = []
+    try:
+        for size in [int(size) for size in args.sizes.split(",")]:
+            print(f"\n🗄️  Seeding {size:,} requests")
+            seed_size(engine, size, args.seed)
+            
+            db = sessionmaker(bind=engine)()
+            try:
+                ctx = build_context(db)
+                print(f"\n📊 {len(cases)} cases at {size:,} requests\n")
+                print(f"  {'case':<48} {'mean ms':>9} {'p95 ms':>9} {'queries':>8}")
+                for case in cases:
+                    result = {"case": case.name, "size": size, **measure(
+                        db, ctx, case, counter, args.min_time, args.min_iterations
+                    )}
+                    results.append(result)
+                    print(f"  {case.name:<48} {result['mean_ms']:>9.3f} {result['p95_ms']:>9.3f} {result['queries']:>8}")
+            finally:
+                db.close()
+    finally:
+        Base.metadata.drop_all(bind=engine)
+    
+    if args.output:
+        meta = {
+            "commit": git_commit(),
+            "created_at": datetime.utcnow().isoformat(),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "sizes": args.sizes,
+            "seed": args.seed,
+        }
+        Path(args.output).write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare two benchmark result files.
+
+Reads JSON written by benchmarks/bench_suite.py --output (compares mean time
+and query count per case and size) or by python -m loadtest --output
+(compares p95 latency and errors per scenario operation), prints the change
+for everything present in both, and exits with status 1 if anything got
+slower than the threshold or issued more queries, so it can gate CI.
+
+Usage:
+    python benchmarks/compare.py before.json after.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+def load_results(path: str) -> Tuple[Dict[str, dict], str]:
+    """
+    Flatten a result file to {key: {"ms": ..., "count": ...}}.
+    
+    Returns:
+        Tuple of (results, label of the time metric)
+    """
+    data = json.loads(Path(path).read_text())
+    if "results" in data:
+        return {
+            f"{row['case']} @ {row['size']:,}": {"ms": row["mean_ms"], "count": row["queries"]}
+            for row in data["results"]
+        }, "mean"
+    return {
+        f"{scenario} / {row['operation']}": {"ms": row["p95_ms"], "count": row["errors"]}
+        for scenario, rows in data["scenarios"].items()
+        for row in rows
+    }, "p95"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("before", help="Baseline results JSON")
+    parser.add_argument("after", help="New results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Slowdown (%%) that counts as a regression")
+    args = parser.parse_args()
+    
+    before, metric = load_results(args.before)
+    after, after_metric = load_results(args.after)
+    if metric != after_metric:
+        sys.exit("❌ The files come from different tools (bench_suite vs loadtest)")
+    count_label = "queries" if metric == "mean" else "errors"
+    
+    regressions = 0
+    print(f"  {'':<56} {metric + ' ms':>20} {'change':>8} {count_label:>10}")
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        change = (new["ms"] - old["ms"]) / old["ms"] * 100 if old["ms"] else 0.0
+        regressed = change > args.threshold or new["count"] > old["count"]
+        regressions += regressed
+        counts = f"{old['count']}→{new['count']}" if new["count"] != old["count"] else str(new["count"])
+        marker = "❌" if regressed else ("✅" if change < -args.threshold or new["count"] < old["count"] else "  ")
+        print(f"{marker} {key:<56} {old['ms']:>9.3f}→{new['ms']:<9.3f} {change:>+7.1f}% {counts:>10}")
+    
+    for key in sorted(before.keys() - after.keys()):
+        print(f"   {key:<56} only in {args.before}")
+    for key in sorted(after.keys() - before.keys()):
+        print(f"   {key:<56} only in {args.after}")
+    
+    if regressions:
+        print(f"\n❌ {regressions} regression(s) over {args.threshold:.0f}% or with more {count_label}")
+        sys.exit(1)
+    print(f"\n✅ No regressions over {args.threshold:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
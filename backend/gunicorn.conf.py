@@ -0,0 +1,53 @@
+"""
+Gunicorn configuration for production.
+
+Start from backend/ with either of:
+    gunicorn app.main:app
+    python scripts/run_server.py
+
+Every value comes from Settings, so the worker count, recycling and timeouts
+are set with the same environment variables as the app. Set the worker
+count with WEB_CONCURRENCY, not -w: each worker sizes its database pool and
+bcrypt pool from it (see Settings.db_connections_per_worker).
+"""
+
+from app.core.config import settings
+
+bind = f"{settings.host}:{settings.port}"
+workers = settings.web_concurrency
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Recycle workers to cap slow memory growth; jitter keeps them from restarting together
+max_requests = settings.server_max_requests
+max_requests_jitter = settings.server_max_requests_jitter
+
+graceful_timeout = settings.server_graceful_timeout
+timeout = settings.server_timeout
+keepalive = settings.server_keepalive
+backlog = settings.server_backlog
+
+# Import the app once in the master; workers fork with it loaded
+preload_app = settings.server_preload
+
+loglevel = settings.log_level.lower()
+accesslog = "-"
+
+
+def on_starting(server):
+    """Log the sizing and warn when -w disagrees with WEB_CONCURRENCY."""
+    if server.cfg.workers != settings.web_concurrency:
+        server.log.warning(
+            "Running %s workers but WEB_CONCURRENCY=%s: database pools are sized for %s",
+            server.cfg.workers, settings.web_concurrency, settings.web_concurrency,
+        )
+    server.log.info(
+        "Database pool per worker: %s + %s overflow (DB_MAX_CONNECTIONS=%s, %s reserved)",
+        settings.db_pool_size, settings.db_max_overflow,
+        settings.db_max_connections, settings.db_reserved_connections,
+    )
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master (preload_app)."""
+    from app.core.database import sync_engine
+    sync_engine.dispose(close=False)
@@ -0,0 +1,19 @@
+"""
+Load-test harness for the API.
+
+Boots the app with uvicorn against a scratch database (a temporary SQLite
+file by default, or any Postgres URL), seeds societies, contractors and open
+requests, swaps every OTP and notification channel for the fake provider
+(configurable latency and failure rate, nothing sent), and drives scenarios
+with concurrent virtual users, reporting throughput and p50/p95/p99 latency
+per operation.
+
+Usage (from backend/):
+    python -m loadtest
+    python -m loadtest --scenarios feed,search --concurrency 50 --duration 30
+    python -m loadtest --database-url postgresql://localhost/cc_loadtest --workers 4 --output before.json
+
+The database is dropped and recreated, so only point --database-url at a
+scratch database. Use Postgres for numbers you intend to compare; SQLite
+serialises writes and does not use the Postgres-specific indexes.
+"""
@@ -0,0 +1,107 @@
+"""
+Command-line entry point: python -m loadtest (run from backend/).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "loadtest-secret")
+
+from loadtest.environment import APIServer, create_scratch_engine, reset_schema, seed
+from loadtest.runner import run_scenario
+from loadtest.scenarios import SCENARIOS, LoadContext
+from loadtest.stats import print_report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Load-test the API")
+    parser.add_argument(
+        "--database-url",
+        help="Scratch database, dropped and recreated (default: a temporary SQLite file)"
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios to run (default: all of {', '.join(SCENARIOS)})"
+    )
+    parser.add_argument("--concurrency", type=int, default=20, help="Virtual users per scenario")
+    parser.add_argument("--duration", type=float, default=15.0, help="Measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each read scenario")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the API server")
+    parser.add_argument("--societies", type=int, default=20, help="Seeded society accounts")
+    parser.add_argument("--contractors", type=int, default=2000, help="Seeded contractor accounts")
+    parser.add_argument("--requests", type=int, default=1000, help="Seeded open requests")
+    parser.add_argument("--provider-latency-ms", type=int, default=150, help="Simulated OTP gateway latency")
+    parser.add_argument("--provider-failure-rate", type=float, default=0.0, help="Fraction of OTP sends that fail")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        sys.exit(f"Unknown scenario(s): {', '.join(unknown)}. Choose from: {', '.join(SCENARIOS)}")
+    
+    workdir = Path(tempfile.mkdtemp(prefix="loadtest-"))
+    database_url = args.database_url or f"sqlite:///{workdir / 'loadtest.db'}"
+    if database_url.startswith("sqlite") and args.workers > 1:
+        print("⚠️ SQLite allows one writer at a time; use Postgres for multi-worker numbers")
+    
+    engine = create_scratch_engine(database_url)
+    print(f"🗄️  Seeding {engine.url.render_as_string(hide_password=True)}")
+    reset_schema(engine)
+    data = seed(engine, args.societies, args.contractors, args.requests)
+    print(f"   {len(data.society_ids)} societies, {len(data.contractor_ids)} contractors, {len(data.request_ids)} requests")
+    
+    server = APIServer(
+        database_url,
+        port=args.port,
+        workers=args.workers,
+        env={
+            "OTP_DELIVERY_METHOD": "fake",
+            "OTP_FALLBACK_METHOD": "none",
+            "SMTP_ENABLED": "true",
+            "FAKE_PROVIDER_LATENCY_MS": str(args.provider_latency_ms),
+            "FAKE_PROVIDER_FAILURE_RATE": str(args.provider_failure_rate),
+            "NOTIFICATION_DELIVERY_METHOD": "fake",
+        },
+        log_path=workdir / "server.log",
+    )
+    print(f"🚀 Starting API server ({args.workers} worker(s)); log: {server.log_path}")
+    server.start()
+    
+    results = {}
+    try:
+        ctx = LoadContext(data, engine)
+        for name in names:
+            scenario = SCENARIOS[name]
+            print(f"\n⏱️  {scenario.description}: {args.concurrency} users for {args.duration:.0f}s")
+            recorder = asyncio.run(run_scenario(
+                server.base_url, scenario, ctx, args.concurrency, args.duration, args.warmup
+            ))
+            print_report(name, recorder)
+            results[name] = recorder.summary()
+    finally:
+        server.stop()
+        engine.dispose()
+    
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key != "output"}
+        config["database_url"] = engine.url.render_as_string(hide_password=True)
+        Path(args.output).write_text(json.dumps({"config": config, "scenarios": results}, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Scratch database, seed data and API server for load-test runs.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base
+from app.core.security import create_access_token
+from app.models.request import Request, RequestCategory, RequestStatus
+from app.models.user import User, UserRole, UserStatus
+from app.repositories.counter_repository import CounterRepository
+import app.models  # noqa: F401  (register all tables)
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+CITIES = ["Mumbai", "Pune", "Bengaluru", "Delhi", "Hyderabad", "Chennai"]
+
+WORDS = ["leaking", "terrace", "waterproofing", "plaster", "painting", "wiring", "tiles", "lift", "pump", "gate"]
+
+
+@dataclass
+class SeedData:
+    """IDs and credentials the scenarios draw from."""
+    
+    society_ids: List[int] = field(default_factory=list)
+    contractor_ids: List[int] = field(default_factory=list)
+    contractor_phones: List[str] = field(default_factory=list)
+    request_ids: List[int] = field(default_factory=list)
+    storm_request_id: Optional[int] = None
+    tokens: Dict[int, str] = field(default_factory=dict)
+    
+    def auth(self, user_id: int) -> Dict[str, str]:
+        """Authorization header for a seeded user."""
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+
+def create_scratch_engine(database_url: str) -> Engine:
+    """Engine for the harness's own reads and writes (no pooling)."""
+    if database_url.startswith("sqlite"):
+        return create_engine(database_url, poolclass=NullPool, connect_args={"check_same_thread": False})
+    return create_engine(database_url, poolclass=NullPool)
+
+
+def reset_schema(engine: Engine) -> None:
+    """Drop and recreate every table (scratch databases only)."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def seed(engine: Engine, societies: int, contractors: int, requests: int) -> SeedData:
+    """
+    Insert users and open requests in bulk and mint their access tokens.
+    
+    Args:
+        engine: Scratch database engine
+        societies: Society accounts (request owners)
+        contractors: Contractor accounts (bidders and OTP logins)
+        requests: Open requests spread over the societies
+    
+    Returns:
+        SeedData for the scenarios
+    """
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    data = SeedData()
+    session = sessionmaker(bind=engine)()
+    try:
+        session.execute(insert(User), [
+            {
+                "phone_number": f"+9170{i:08d}",
+                "email": f"society{i}@loadtest.local",
+                "role": UserRole.SOCIETY,
+                "status": UserStatus.ACTIVE,
+                "is_verified": True,
+                "name": f"Society {i}",
+                "city": CITIES[i % len(CITIES)],
+                "state": "Maharashtra",
+            }
+            for i in range(societies)
+        ])
+        session.execute(insert(User), [
+            {
+                "phone_number": f"+9180{i:08d}",
+                "email": f"contractor{i}@loadtest.local",
+                "role": UserRole.CONTRACTOR,
+                "status": UserStatus.ACTIVE,
+                "is_verified": True,
+                "name": f"Contractor {i}",
+                "description": " ".join(rng.sample(WORDS, 4)),
+                "city": CITIES[i % len(CITIES)],
+                "state": "Maharashtra",
+            }
+            for i in range(contractors)
+        ])
+        session.commit()
+        
+        for user_id, phone, role in session.execute(
+            select(User.id, User.phone_number, User.role).order_by(User.id)
+        ):
+            if role == UserRole.SOCIETY:
+                data.society_ids.append(user_id)
+            else:
+                data.contractor_ids.append(user_id)
+                data.contractor_phones.append(phone)
+            data.tokens[user_id] = create_access_token(
+                {"user_id": user_id, "phone_number": phone, "role": role.value}
+            )
+        
+        categories = list(RequestCategory)
+        session.execute(insert(Request), [
+            {
+                "society_id": data.society_ids[i % societies],
+                "title": f"{rng.choice(WORDS).title()} repair {i}",
+                "description": " ".join(rng.choices(WORDS, k=40)),
+                "category": categories[i % len(categories)],
+                "status": RequestStatus.OPEN,
+                "city": CITIES[i % len(CITIES)],
+                "state": "Maharashtra",
+                "pincode": "400001",
+                "required_skills": rng.sample(WORDS, 2),
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in range(requests)
+        ])
+        session.commit()
+        CounterRepository(session).reconcile(touch_requests=False)
+        
+        data.request_ids = list(session.scalars(select(Request.id).order_by(Request.id)))
+        data.storm_request_id = data.request_ids[0]
+    finally:
+        session.close()
+    return data
+
+
+def latest_otp(engine: Engine, phone_number: str) -> Optional[str]:
+    """Read the newest unused login OTP for a phone (the fake provider sends nothing)."""
+    with engine.connect() as conn:
+        return conn.execute(
+            text(
+                "SELECT otp_code FROM otps WHERE phone_number = :phone AND is_used = false "
+                "ORDER BY id DESC LIMIT 1"
+            ),
+            {"phone": phone_number},
+        ).scalar()
+
+
+class APIServer:
+    """uvicorn running the app in a child process against the scratch database."""
+    
+    def __init__(self, database_url: str, port: int, workers: int, env: Dict[str, str], log_path: Path):
+        """
+        Prepare the server command (nothing starts until start()).
+        
+        Args:
+            database_url: Scratch database URL
+            port: Port to listen on (127.0.0.1)
+            workers: uvicorn worker processes
+            env: Extra environment for the app (provider settings etc.)
+            log_path: File receiving the server's output
+        """
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.command = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log",
+        ]
+        self.env = {**os.environ, "DATABASE_URL": database_url, **env}
+        self.log_path = log_path
+        self._process: Optional[subprocess.Popen] = None
+        self._log = None
+    
+    def start(self, timeout: float = 60.0, poll_interval: float = 0.25) -> None:
+        """
+        Start the server and wait for /ready (the startup warm-up has run).
+        
+        Args:
+            timeout: Seconds to wait for the server to become ready
+            poll_interval: Seconds between /ready probes
+        
+        Raises:
+            RuntimeError: If the server exits or is not ready in time
+        """
+        self._log = open(self.log_path, "w")
+        self._process = subprocess.Popen(
+            self.command, cwd=BACKEND_DIR, env=self.env, stdout=self._log, stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"API server exited with code {self._process.returncode}; see {self.log_path}")
+            try:
+                if httpx.get(f"{self.base_url}/ready", timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(poll_interval)
+        self.stop()
+        raise RuntimeError(f"API server not ready after {timeout:.0f}s; see {self.log_path}")
+    
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._log is not None:
+            self._log.close()
@@ -0,0 +1,70 @@
+"""
+Drive a scenario with concurrent virtual users for a fixed time.
+"""
+
+import asyncio
+import random
+import time
+
+import httpx
+
+from loadtest.scenarios import LoadContext, Scenario
+from loadtest.stats import Recorder
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: LoadContext,
+    recorder: Recorder,
+    rng: random.Random,
+    deadline: float,
+) -> None:
+    """Repeat the scenario step until the deadline or until it runs out of work."""
+    while time.monotonic() < deadline:
+        if not await scenario.step(client, ctx, recorder, rng):
+            return
+
+
+async def run_scenario(
+    base_url: str,
+    scenario: Scenario,
+    ctx: LoadContext,
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    seed: int = 0,
+) -> Recorder:
+    """
+    Run one scenario against a live server.
+    
+    Args:
+        base_url: Server URL
+        scenario: Scenario to run
+        ctx: Seed data and shared cursors
+        concurrency: Virtual users (each keeps one request in flight)
+        duration: Measured seconds
+        warmup: Unmeasured seconds first (skipped for scenarios that use up data)
+        seed: Base seed for the per-user random generators
+    
+    Returns:
+        Recorder with the measured requests
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        if warmup and scenario.warmup:
+            throwaway = Recorder()
+            deadline = time.monotonic() + warmup
+            await asyncio.gather(*(
+                _virtual_user(client, scenario, ctx, throwaway, random.Random(seed - i - 1), deadline)
+                for i in range(concurrency)
+            ))
+        
+        recorder = Recorder()
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(
+            _virtual_user(client, scenario, ctx, recorder, random.Random(seed + i), deadline)
+            for i in range(concurrency)
+        ))
+        recorder.stop()
+    return recorder
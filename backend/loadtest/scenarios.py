@@ -0,0 +1,134 @@
+"""
+Load-test scenarios.
+
+Each scenario is a step that one virtual user repeats until the run ends.
+A step returns False when the scenario has run out of work (for example
+every contractor has already bid), which ends that virtual user early.
+"""
+
+import asyncio
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict
+
+import httpx
+from sqlalchemy.engine import Engine
+
+from loadtest.environment import WORDS, CITIES, SeedData, latest_otp
+from loadtest.stats import Recorder
+
+
+API = "/api/v1"
+
+# OTPService.create_otp allows 3 OTP requests per identifier per 5 minutes
+OTP_REQUESTS_PER_USER = 3
+
+
+class LoadContext:
+    """Seed data plus the shared cursors scenarios hand out work from."""
+    
+    def __init__(self, data: SeedData, engine: Engine):
+        """
+        Initialize the context.
+        
+        Args:
+            data: Seeded users, requests and tokens
+            engine: Scratch database engine (OTP lookups)
+        """
+        self.data = data
+        self.engine = engine
+        # JSONB skill containment only exists on Postgres
+        self.skill_filter = engine.dialect.name == "postgresql"
+        # Virtual users run on one event loop, so plain iterators are safe
+        self.bidders = iter(data.contractor_ids)
+        self.logins = itertools.islice(
+            itertools.cycle(data.contractor_phones),
+            len(data.contractor_phones) * OTP_REQUESTS_PER_USER,
+        )
+
+
+Step = Callable[[httpx.AsyncClient, LoadContext, Recorder, random.Random], Awaitable[bool]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named step and whether it can be warmed up without using up its data."""
+    
+    name: str
+    description: str
+    step: Step
+    warmup: bool = True
+
+
+async def browse_feed(client: httpx.AsyncClient, ctx: LoadContext, recorder: Recorder, rng: random.Random) -> bool:
+    """Page through open requests, open one, and load a contractor's recommendations."""
+    data = ctx.data
+    await recorder.timed("list requests", client.get(
+        f"{API}/requests/", params={"skip": rng.randrange(0, 200, 20), "limit": 20, "status": "open"}
+    ))
+    await recorder.timed("request detail", client.get(f"{API}/requests/{rng.choice(data.request_ids)}"))
+    await recorder.timed("recommended feed", client.get(
+        f"{API}/requests/recommended", headers=data.auth(rng.choice(data.contractor_ids))
+    ))
+    return True
+
+
+async def search(client: httpx.AsyncClient, ctx: LoadContext, recorder: Recorder, rng: random.Random) -> bool:
+    """Keyword search, alone and combined with city and skill filters."""
+    await recorder.timed("search keyword", client.get(
+        f"{API}/requests/search", params={"search_query": rng.choice(WORDS)}
+    ))
+    params = {"search_query": rng.choice(WORDS), "city": rng.choice(CITIES)}
+    if ctx.skill_filter:
+        params["skills"] = rng.choice(WORDS)
+    await recorder.timed("search filtered", client.get(f"{API}/requests/search", params=params))
+    return True
+
+
+async def bid_storm(client: httpx.AsyncClient, ctx: LoadContext, recorder: Recorder, rng: random.Random) -> bool:
+    """Every contractor bids on the same request, as fast as possible."""
+    contractor_id = next(ctx.bidders, None)
+    if contractor_id is None:
+        return False
+    await recorder.timed("submit bid", client.post(
+        f"{API}/bids/",
+        json={
+            "request_id": ctx.data.storm_request_id,
+            "amount": rng.randint(10000, 90000),
+            "proposal": "Experienced team, all materials included, can start this week. " * 2,
+            "estimated_duration_days": rng.randint(2, 30),
+        },
+        headers=ctx.data.auth(contractor_id),
+    ))
+    return True
+
+
+async def otp_login(client: httpx.AsyncClient, ctx: LoadContext, recorder: Recorder, rng: random.Random) -> bool:
+    """Request a login OTP, read it back from the database, and verify it."""
+    phone_number = next(ctx.logins, None)
+    if phone_number is None:
+        return False
+    response = await recorder.timed("request otp", client.post(
+        f"{API}/auth/login", json={"phone_number": phone_number}
+    ))
+    if response is None or response.status_code != 200:
+        return True
+    
+    otp_code = await asyncio.to_thread(latest_otp, ctx.engine, phone_number)
+    if otp_code is not None:
+        await recorder.timed("verify otp", client.post(
+            f"{API}/auth/verify-otp", json={"phone_number": phone_number, "otp_code": otp_code}
+        ))
+    return True
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("feed", "Browse the request feed", browse_feed),
+        Scenario("search", "Search requests", search),
+        Scenario("bid_storm", "All contractors bid on one request", bid_storm, warmup=False),
+        Scenario("otp_login", "OTP login storm", otp_login, warmup=False),
+    )
+}
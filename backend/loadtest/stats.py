@@ -0,0 +1,101 @@
+"""
+Latency recording and percentile reports for load-test runs.
+"""
+
+import time
+from collections import Counter, defaultdict
+from typing import Awaitable, Dict, List, Optional
+
+import httpx
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile (0-100)
+    
+    Returns:
+        The value at that rank, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Recorder:
+    """Per-operation latencies and status codes for one scenario run."""
+    
+    def __init__(self):
+        """Initialize empty series."""
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+    
+    async def timed(self, label: str, call: Awaitable[httpx.Response]) -> Optional[httpx.Response]:
+        """
+        Await one HTTP call and record its latency under a label.
+        
+        Args:
+            label: Operation name shown in the report
+            call: Pending client request
+        
+        Returns:
+            The response, or None if the request itself failed
+        """
+        start = time.perf_counter()
+        try:
+            response = await call
+            status = response.status_code
+        except httpx.HTTPError as e:
+            response, status = None, type(e).__name__
+        self.latencies[label].append((time.perf_counter() - start) * 1000)
+        self.statuses[label][status] += 1
+        return response
+    
+    def stop(self) -> None:
+        """Mark the end of the run (for throughput)."""
+        self.finished = time.perf_counter()
+    
+    def summary(self) -> List[dict]:
+        """
+        Summarise each operation.
+        
+        Returns:
+            One dict per label with count, errors, rps and p50/p95/p99/max in ms
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        rows = []
+        for label, values in self.latencies.items():
+            ordered = sorted(values)
+            statuses = self.statuses[label]
+            errors = sum(n for status, n in statuses.items() if not (isinstance(status, int) and status < 400))
+            rows.append({
+                "operation": label,
+                "count": len(ordered),
+                "errors": errors,
+                "rps": len(ordered) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(ordered, 50),
+                "p95_ms": percentile(ordered, 95),
+                "p99_ms": percentile(ordered, 99),
+                "max_ms": ordered[-1] if ordered else 0.0,
+                "statuses": {str(status): n for status, n in sorted(statuses.items(), key=str)},
+            })
+        return rows
+
+
+def print_report(scenario: str, recorder: Recorder) -> None:
+    """Print one scenario's summary table."""
+    print(f"\n📈 {scenario}")
+    print(f"  {'operation':<22} {'count':>7} {'errors':>7} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for row in recorder.summary():
+        print(
+            f"  {row['operation']:<22} {row['count']:>7} {row['errors']:>7} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+        if row["errors"]:
+            print(f"  {'':<22} statuses: {row['statuses']}")
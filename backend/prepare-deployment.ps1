@@ -151,7 +151,7 @@ Write-Host "📌 Render Deployment Command:" -ForegroundColor Yellow
 Write-Host "   pip install -r requirements.txt && alembic upgrade head" -ForegroundColor Cyan
 Write-Host ""
 Write-Host "📌 Start Command:" -ForegroundColor Yellow
-Write-Host "   uvicorn app.main:app --host 0.0.0.0 --port `$PORT" -ForegroundColor Cyan
+Write-Host "   python scripts/run_server.py" -ForegroundColor Cyan
 Write-Host ""
 
 Write-Host "=================================================" -ForegroundColor Cyan
@@ -0,0 +1,93 @@
+"""
+Benchmark access-token verification.
+
+Compares python-jose (the verifier the API uses), PyJWT when installed, and
+decode_token with the verified-token cache cold and warm. Prints the cost
+per verification; every authenticated request pays one.
+
+Usage: python scripts/benchmark_jwt.py [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jose import jwt as jose_jwt  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import (  # noqa: E402
+    create_access_token,
+    decode_token,
+    clear_token_cache,
+)
+
+try:
+    import jwt as pyjwt
+except ImportError:
+    pyjwt = None
+
+
+def report(name, seconds, iterations):
+    per_call = seconds / iterations * 1e6
+    print(f"  {name:<28} {per_call:8.2f} µs/op {iterations / seconds:12,.0f} ops/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JWT verification")
+    parser.add_argument(
+        "--iterations", type=int, default=20000, help="Verifications per backend"
+    )
+    args = parser.parse_args()
+    n = args.iterations
+
+    token = create_access_token(
+        {"user_id": 1, "phone_number": "9876543210", "role": "CONTRACTOR"}
+    )
+    key, algorithms = settings.secret_key, [settings.algorithm]
+
+    print(f"🔐 Verifying one {settings.algorithm} access token {n:,} times")
+
+    report(
+        "python-jose",
+        timeit.timeit(
+            lambda: jose_jwt.decode(token, key, algorithms=algorithms), number=n
+        ),
+        n,
+    )
+
+    if pyjwt is not None:
+        assert pyjwt.decode(token, key, algorithms=algorithms) == jose_jwt.decode(
+            token, key, algorithms=algorithms
+        )
+        report(
+            "PyJWT",
+            timeit.timeit(
+                lambda: pyjwt.decode(token, key, algorithms=algorithms), number=n
+            ),
+            n,
+        )
+    else:
+        print("  PyJWT                        skipped (pip install PyJWT)")
+
+    # Distinct tokens, so every call misses the cache
+    fresh = iter([create_access_token({"user_id": i}) for i in range(n)])
+    clear_token_cache()
+    report(
+        "decode_token (cache miss)",
+        timeit.timeit(lambda: decode_token(next(fresh)), number=n),
+        n,
+    )
+    decode_token(token)
+    report(
+        "decode_token (cache hit)",
+        timeit.timeit(lambda: decode_token(token), number=n),
+        n,
+    )
+
+
+if __name__ == "__main__":
+    main()
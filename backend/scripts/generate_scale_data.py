@@ -0,0 +1,474 @@
+"""
+Generate a large, realistic dataset for benchmarking.
+
+Creates societies, contractors, requests, bids and OTP history with skewed
+distributions: a few big cities hold most users and requests, popular
+categories dominate, and bids per request follow a power law (most requests
+get a handful, a few get hundreds). The same --seed always produces the same
+rows, so timings from different runs or branches are comparable.
+
+Rows are streamed with PostgreSQL COPY (other databases fall back to batched
+multi-row inserts). IDs are assigned here and the sequences are moved past
+them at the end.
+
+Usage:
+    python scripts/generate_scale_data.py --truncate
+    python scripts/generate_scale_data.py --truncate --requests 2000000 --seed 7
+
+Loads into DATABASE_URL; --truncate empties every table first, so only use it
+on a benchmark database. Run scripts/rebuild_match_index.py afterwards if you
+need recommendation feeds.
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import Base, sync_engine  # noqa: E402
+from app.core.geo import PINCODE_DATA_PATH, locate_pincode  # noqa: E402
+from app.models.bid import Bid, BidStatus  # noqa: E402
+from app.models.otp import OTP  # noqa: E402
+from app.models.request import Request, RequestCategory, RequestStatus  # noqa: E402
+from app.models.user import User, UserRole, UserStatus  # noqa: E402
+from app.repositories.counter_repository import CounterRepository  # noqa: E402
+import app.models  # noqa: E402,F401  (register all tables)
+
+# (city, state, pincode prefix), most populous first; weights fall off as 1/rank
+CITIES = [
+    ("Mumbai", "Maharashtra", "400"),
+    ("Delhi", "Delhi", "110"),
+    ("Bengaluru", "Karnataka", "560"),
+    ("Pune", "Maharashtra", "411"),
+    ("Hyderabad", "Telangana", "500"),
+    ("Chennai", "Tamil Nadu", "600"),
+    ("Kolkata", "West Bengal", "700"),
+    ("Ahmedabad", "Gujarat", "380"),
+    ("Jaipur", "Rajasthan", "302"),
+    ("Gurugram", "Haryana", "122"),
+]
+CITY_WEIGHTS = [1 / rank**1.1 for rank in range(1, len(CITIES) + 1)]
+
+# Share of requests per category and the skills they ask for
+CATEGORIES = {
+    RequestCategory.PLUMBING: (18, ["plumbing", "pipe fitting", "leak repair"]),
+    RequestCategory.PAINTING: (16, ["painting", "waterproofing", "putty"]),
+    RequestCategory.ELECTRICAL: (14, ["wiring", "electrical", "lighting"]),
+    RequestCategory.RENOVATION: (10, ["masonry", "tiling", "plastering"]),
+    RequestCategory.STRUCTURAL_FIX: (7, ["masonry", "waterproofing", "plastering"]),
+    RequestCategory.CARPENTRY: (7, ["carpentry", "furniture", "polishing"]),
+    RequestCategory.CLEANING: (6, ["cleaning", "tank cleaning", "pest control"]),
+    RequestCategory.FLOORING: (5, ["tiling", "flooring", "polishing"]),
+    RequestCategory.ROOFING: (4, ["roofing", "waterproofing", "sheet metal"]),
+    RequestCategory.CONSTRUCTION: (4, ["masonry", "concrete", "steel work"]),
+    RequestCategory.LANDSCAPING: (3, ["gardening", "landscaping", "irrigation"]),
+    RequestCategory.INTERIOR_DESIGN: (
+        3,
+        ["interior design", "false ceiling", "carpentry"],
+    ),
+    RequestCategory.OTHER: (3, ["general maintenance"]),
+}
+CATEGORY_LIST = list(CATEGORIES)
+CATEGORY_WEIGHTS = [CATEGORIES[category][0] for category in CATEGORY_LIST]
+
+REQUEST_STATUSES = [
+    RequestStatus.OPEN,
+    RequestStatus.IN_PROGRESS,
+    RequestStatus.COMPLETED,
+    RequestStatus.CANCELLED,
+    RequestStatus.ON_HOLD,
+]
+REQUEST_STATUS_WEIGHTS = [35, 15, 40, 7, 3]
+
+# Bids per request: (Pareto(BID_ALPHA) - 1) * scale, so the mean is --bids-per-request
+BID_ALPHA = 1.5
+MAX_BIDS_PER_REQUEST = 500
+
+WORDS = (
+    "repair leaking terrace wall seepage building society wing lobby staircase "
+    "parking basement pump motor tank overhead lift shaft corridor flat gate "
+    "compound drainage line crack plaster paint coat cabling meter room"
+).split()
+
+
+def pick_pincodes() -> dict:
+    """Pincodes from the bundled dataset, grouped by city."""
+    by_prefix = {prefix: [] for _, _, prefix in CITIES}
+    with open(PINCODE_DATA_PATH, newline="") as f:
+        for row in csv.DictReader(f):
+            prefix = row["pincode"][:3]
+            if prefix in by_prefix:
+                by_prefix[prefix].append(row["pincode"])
+    return {city: by_prefix[prefix] or [None] for city, _, prefix in CITIES}
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words)).capitalize()
+
+
+def skewed_index(rng: random.Random, n: int) -> int:
+    """Index in [0, n) biased towards the front (a few very active users)."""
+    return int(n * rng.random() ** 2)
+
+
+def generate_users(rng, societies, contractors, pincodes, locations, now, days):
+    """Yield user rows; societies first, then contractors."""
+    for i in range(societies + contractors):
+        is_society = i < societies
+        city, state, _ = rng.choices(CITIES, CITY_WEIGHTS)[0]
+        pincode = rng.choice(pincodes[city])
+        location = locations[pincode]
+        status = rng.choices(
+            [UserStatus.ACTIVE, UserStatus.PENDING, UserStatus.INACTIVE], [90, 7, 3]
+        )[0]
+        created_at = now - timedelta(days=days * rng.random())
+        if is_society:
+            name, description = f"{rng.choice(WORDS).title()} Heights CHS {i}", None
+        else:
+            category = rng.choices(CATEGORY_LIST, CATEGORY_WEIGHTS)[0]
+            trade = category.value.title().replace("_", " ")
+            name = f"{rng.choice(WORDS).title()} {trade} Works {i}"
+            description = (
+                ", ".join(CATEGORIES[category][1])
+                + f". {rng.randint(1, 25)} years of experience."
+            )
+        yield {
+            "id": i + 1,
+            "phone_number": f"+91{6000000000 + i}",
+            "email": f"user{i}@example.com",
+            "role": UserRole.SOCIETY if is_society else UserRole.CONTRACTOR,
+            "status": status,
+            "name": name,
+            "description": description,
+            "city": city,
+            "state": state,
+            "pincode": pincode,
+            "latitude": location["latitude"],
+            "longitude": location["longitude"],
+            "geohash": location["geohash"],
+            "is_verified": status != UserStatus.PENDING,
+            "is_active": status != UserStatus.INACTIVE,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "last_login_at": created_at + (now - created_at) * rng.random()
+            if status == UserStatus.ACTIVE
+            else None,
+        }
+
+
+def generate_requests(rng, args, pincodes, locations, now):
+    """
+    Yield (request row, bid rows) pairs; bids are generated with their request
+    so the accepted bid and the assigned contractor agree.
+    """
+    first_contractor = args.societies + 1
+    bid_scale = args.bids_per_request * (BID_ALPHA - 1)
+    bid_id = 0
+    for request_id in range(1, args.requests + 1):
+        category = rng.choices(CATEGORY_LIST, CATEGORY_WEIGHTS)[0]
+        status = rng.choices(REQUEST_STATUSES, REQUEST_STATUS_WEIGHTS)[0]
+        city, state, _ = rng.choices(CITIES, CITY_WEIGHTS)[0]
+        pincode = rng.choice(pincodes[city])
+        location = locations[pincode]
+        created_at = now - timedelta(days=args.days * rng.random() ** 1.5)
+
+        bids = min(
+            int((rng.paretovariate(BID_ALPHA) - 1) * bid_scale),
+            MAX_BIDS_PER_REQUEST,
+            args.contractors,
+        )
+        awarded = status in (RequestStatus.IN_PROGRESS, RequestStatus.COMPLETED)
+        if awarded:
+            bids = max(bids, 1)
+        bidders = set()
+        while len(bidders) < bids:
+            bidders.add(first_contractor + skewed_index(rng, args.contractors))
+        bidders = list(bidders)
+        winner = rng.choice(bidders) if awarded else None
+        bid_rows = []
+
+        base_amount = rng.lognormvariate(10.5, 0.8)
+        for contractor_id in bidders:
+            if awarded:
+                bid_status = (
+                    BidStatus.ACCEPTED
+                    if contractor_id == winner
+                    else BidStatus.REJECTED
+                )
+            elif status == RequestStatus.OPEN:
+                bid_status = rng.choices(
+                    [BidStatus.PENDING, BidStatus.WITHDRAWN], [95, 5]
+                )[0]
+            else:
+                bid_status = rng.choice([BidStatus.REJECTED, BidStatus.WITHDRAWN])
+            bid_at = created_at + timedelta(hours=72 * rng.random())
+            bid_id += 1
+            bid_rows.append(
+                {
+                    "id": bid_id,
+                    "request_id": request_id,
+                    "contractor_id": contractor_id,
+                    "amount": round(base_amount * rng.uniform(0.7, 1.4), -2),
+                    "proposal": sentence(rng, rng.randint(15, 40)) + ".",
+                    "status": bid_status,
+                    "created_at": bid_at,
+                    "updated_at": bid_at,
+                }
+            )
+
+        started_at = (
+            created_at + timedelta(days=rng.uniform(3, 10)) if awarded else None
+        )
+        completed_at = (
+            started_at + timedelta(days=rng.uniform(2, 30))
+            if status == RequestStatus.COMPLETED
+            else None
+        )
+        request = {
+            "id": request_id,
+            "society_id": 1 + skewed_index(rng, args.societies),
+            "assigned_contractor_id": winner,
+            "title": (
+                f"{rng.choice(WORDS).title()} "
+                f"{category.value.lower().replace('_', ' ')} work"
+            ),
+            "description": sentence(rng, rng.randint(30, 80)) + ".",
+            "category": category,
+            "status": status,
+            "location": f"Wing {rng.choice('ABCDEFG')}, {rng.randint(1, 40)} floors",
+            "city": city,
+            "state": state,
+            "pincode": pincode,
+            "latitude": location["latitude"],
+            "longitude": location["longitude"],
+            "geohash": location["geohash"],
+            "estimated_duration_days": rng.randint(1, 60),
+            "required_skills": rng.sample(
+                CATEGORIES[category][1], rng.randint(1, len(CATEGORIES[category][1]))
+            ),
+            "images": [
+                f"https://cdn.example.com/requests/{request_id}/{n}.jpg"
+                for n in range(rng.randint(0, 3))
+            ],
+            "created_at": created_at,
+            "updated_at": completed_at or started_at or created_at,
+            "started_at": started_at,
+            "completed_at": completed_at,
+        }
+        yield request, bid_rows
+
+
+def generate_otps(rng, users, per_user, now):
+    """Yield OTP history: mostly used or expired codes, a few still live."""
+    otp_id = 0
+    for user_id in range(1, users + 1):
+        for _ in range(rng.randint(0, 2 * per_user)):
+            otp_id += 1
+            created_at = now - timedelta(minutes=60 * 24 * 30 * rng.random())
+            used = rng.random() < 0.8
+            yield {
+                "id": otp_id,
+                "user_id": user_id,
+                "phone_number": f"+91{6000000000 + user_id - 1}",
+                "email": None,
+                "delivery_method": "sms",
+                "otp_code": f"{rng.randrange(10 ** 6):06d}",
+                "purpose": "login",
+                "is_used": used,
+                "is_verified": used,
+                "created_at": created_at,
+                "expires_at": created_at + timedelta(minutes=5),
+                "verified_at": created_at + timedelta(minutes=rng.uniform(0.2, 4))
+                if used
+                else None,
+            }
+
+
+def copy_value(value):
+    """Render a value for COPY ... CSV (None becomes NULL)."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, list):
+        return json.dumps(value)
+    return value
+
+
+def load(conn, table, rows, batch_size: int) -> int:
+    """Load rows into a table in batches (COPY on PostgreSQL). Returns the row count."""
+    rows = iter(rows)
+    total = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return total
+        columns = list(batch[0])
+        if conn.dialect.name == "postgresql":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                writer.writerow([copy_value(row[column]) for column in columns])
+            buffer.seek(0)
+            cursor = conn.connection.cursor()
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        else:
+            conn.execute(insert(table), batch)
+        total += len(batch)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate benchmark data")
+    parser.add_argument("--societies", type=int, default=20000)
+    parser.add_argument("--contractors", type=int, default=80000)
+    parser.add_argument("--requests", type=int, default=500000)
+    parser.add_argument(
+        "--bids-per-request",
+        type=float,
+        default=8.0,
+        help="Mean of the power-law bid count",
+    )
+    parser.add_argument(
+        "--otps-per-user", type=float, default=2.0, help="Mean OTP rows per user"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=365,
+        help="Spread creation dates over this many days",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Same seed, same rows")
+    parser.add_argument(
+        "--as-of",
+        type=datetime.fromisoformat,
+        default=datetime(2026, 1, 1),
+        help="Reference date for all timestamps (fixed, so runs repeat exactly)",
+    )
+    parser.add_argument("--batch-size", type=int, default=50000)
+    parser.add_argument(
+        "--truncate", action="store_true", help="Empty every table first"
+    )
+    return parser
+
+
+def populate(conn, args, log=print) -> None:
+    """
+    Load the dataset described by parsed arguments into empty tables.
+
+    Also used by benchmarks/bench_suite.py to seed each dataset size.
+    """
+    rng = random.Random(args.seed)
+    now = args.as_of
+    pincodes = pick_pincodes()
+    locations = {
+        pincode: locate_pincode(pincode)
+        for codes in pincodes.values()
+        for pincode in codes
+    }
+    started = time.perf_counter()
+
+    users = args.societies + args.contractors
+    count = load(
+        conn,
+        User.__table__,
+        generate_users(
+            rng, args.societies, args.contractors, pincodes, locations, now, args.days
+        ),
+        args.batch_size,
+    )
+    log(f"👥 {count:,} users ({time.perf_counter() - started:.0f}s)")
+
+    # Requests and bids are generated together and flushed in batches
+    request_rows, bid_rows = [], []
+    request_count = bid_count = 0
+    for request, bids in generate_requests(rng, args, pincodes, locations, now):
+        request_rows.append(request)
+        bid_rows.extend(bids)
+        if len(request_rows) >= args.batch_size:
+            request_count += load(
+                conn, Request.__table__, request_rows, args.batch_size
+            )
+            bid_count += load(conn, Bid.__table__, bid_rows, args.batch_size)
+            request_rows.clear()
+            bid_rows.clear()
+    request_count += load(conn, Request.__table__, request_rows, args.batch_size)
+    bid_count += load(conn, Bid.__table__, bid_rows, args.batch_size)
+    log(
+        f"📋 {request_count:,} requests, {bid_count:,} bids "
+        f"({time.perf_counter() - started:.0f}s)"
+    )
+
+    count = load(
+        conn,
+        OTP.__table__,
+        generate_otps(rng, users, args.otps_per_user, now),
+        args.batch_size,
+    )
+    log(f"🔑 {count:,} OTPs ({time.perf_counter() - started:.0f}s)")
+
+    # Fill the denormalised bid and request counters from the loaded rows
+    CounterRepository(Session(bind=conn)).reconcile(touch_requests=False)
+    log(f"🔢 Counters filled ({time.perf_counter() - started:.0f}s)")
+
+    if conn.dialect.name == "postgresql":
+        for table in (User.__table__, Request.__table__, Bid.__table__, OTP.__table__):
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"
+                )
+            )
+
+
+def main():
+    args = build_parser().parse_args()
+    tables = {table.name: table for table in Base.metadata.sorted_tables}
+    started = time.perf_counter()
+
+    with sync_engine.begin() as conn:
+        if args.truncate:
+            if conn.dialect.name == "postgresql":
+                conn.execute(
+                    text(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
+                )
+            else:
+                for table in reversed(Base.metadata.sorted_tables):
+                    conn.execute(table.delete())
+            print("🗑️  Emptied all tables")
+        elif conn.execute(select(func.count()).select_from(User.__table__)).scalar():
+            sys.exit(
+                "❌ The users table is not empty; "
+                "rerun with --truncate (benchmark databases only)"
+            )
+
+        populate(conn, args)
+
+    if sync_engine.dialect.name == "postgresql":
+        with sync_engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(text("ANALYZE users, requests, bids, otps"))
+    print(f"✅ Done in {time.perf_counter() - started:.0f}s (seed {args.seed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Rebuild the bundled pincode dataset (app/data/pincodes.csv) from a source CSV,
+and optionally re-locate existing requests and users.
+
+The source is any CSV with pincode, latitude and longitude columns, such as
+the India Post "All India Pincode Directory" export (columns Pincode,
+Latitude, Longitude; one row per post office). Post offices sharing a
+pincode are averaged into a single point; rows with missing or out-of-range
+coordinates are skipped.
+
+Usage:
+    python scripts/import_pincodes.py pincode_directory.csv
+    python scripts/import_pincodes.py pincode_directory.csv --backfill
+    python scripts/import_pincodes.py --backfill
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.geo import (  # noqa: E402
+    PINCODE_DATA_PATH,
+    locate_pincode,
+    normalize_pincode,
+)
+
+# Bounding box of India, to drop swapped or garbage coordinates
+LATITUDE_RANGE = (6.0, 37.5)
+LONGITUDE_RANGE = (68.0, 97.5)
+
+
+def read_source(path: Path) -> dict:
+    """Average the coordinates of every post office per pincode."""
+    sums = {}
+    skipped = 0
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        reader = csv.DictReader(f)
+        columns = {name.strip().lower(): name for name in reader.fieldnames or []}
+        missing = {"pincode", "latitude", "longitude"} - columns.keys()
+        if missing:
+            raise SystemExit(
+                f"❌ Source is missing columns: {', '.join(sorted(missing))}"
+            )
+
+        for row in reader:
+            pincode = normalize_pincode(row[columns["pincode"]])
+            try:
+                latitude = float(row[columns["latitude"]])
+                longitude = float(row[columns["longitude"]])
+            except (TypeError, ValueError):
+                skipped += 1
+                continue
+            if (
+                not pincode
+                or not LATITUDE_RANGE[0] <= latitude <= LATITUDE_RANGE[1]
+                or not LONGITUDE_RANGE[0] <= longitude <= LONGITUDE_RANGE[1]
+            ):
+                skipped += 1
+                continue
+
+            total = sums.setdefault(pincode, [0.0, 0.0, 0])
+            total[0] += latitude
+            total[1] += longitude
+            total[2] += 1
+
+    print(f"⏭️  Skipped {skipped} rows without usable coordinates")
+    return {
+        pincode: (round(lat / count, 4), round(lng / count, 4))
+        for pincode, (lat, lng, count) in sums.items()
+    }
+
+
+def write_dataset(points: dict) -> None:
+    """Write the bundled dataset, sorted by pincode."""
+    with open(PINCODE_DATA_PATH, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["pincode", "latitude", "longitude"])
+        for pincode in sorted(points):
+            writer.writerow([pincode, *points[pincode]])
+    print(f"📍 Wrote {len(points)} pincodes to {PINCODE_DATA_PATH}")
+
+
+def backfill() -> None:
+    """Recompute stored coordinates of every request and user with a pincode."""
+    from app.core.database import SessionLocal
+    from app.core.cache import cache, REQUEST_FEED_NAMESPACE
+    from app.models.request import Request
+    from app.models.user import User
+
+    db = SessionLocal()
+    try:
+        for model in (Request, User):
+            rows = db.query(model).filter(model.pincode.isnot(None)).all()
+            located = 0
+            for row in rows:
+                location = locate_pincode(row.pincode)
+                for key, value in location.items():
+                    setattr(row, key, value)
+                located += location["geohash"] is not None
+            db.commit()
+            print(
+                f"✅ {model.__tablename__}: "
+                f"located {located} of {len(rows)} rows with a pincode"
+            )
+        cache.bump(REQUEST_FEED_NAMESPACE)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import pincode coordinates")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        type=Path,
+        help="CSV with pincode, latitude and longitude columns",
+    )
+    parser.add_argument(
+        "--backfill", action="store_true", help="Re-locate existing requests and users"
+    )
+    args = parser.parse_args()
+
+    if not args.source and not args.backfill:
+        parser.error("nothing to do: give a source CSV and/or --backfill")
+
+    if args.source:
+        write_dataset(read_source(args.source))
+    if args.backfill:
+        # The dataset may have just been rewritten; backfill runs in this
+        # process, so reload it rather than use a stale cached copy
+        from app.core import geo
+
+        geo._load_pincodes.cache_clear()
+        backfill()
+
+
+if __name__ == "__main__":
+    main()
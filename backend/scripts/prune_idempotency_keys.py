@@ -0,0 +1,56 @@
+"""
+Idempotency key pruner.
+
+Keys older than IDEMPOTENCY_TTL_HOURS are already treated as unused, so
+their stored responses are no longer needed. Every
+IDEMPOTENCY_PRUNE_INTERVAL_SECONDS this deletes them, which keeps the
+idempotency_keys table bounded. Run one long-lived process, or from cron
+with --once.
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.repositories.idempotency_repository import (  # noqa: E402
+    IdempotencyKeyRepository,
+)
+
+
+def run_once():
+    db = SessionLocal()
+    try:
+        deleted = IdempotencyKeyRepository(db).prune(datetime.utcnow())
+        print(f"🧹 Deleted {deleted} expired idempotency keys")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete expired idempotency keys")
+    parser.add_argument(
+        "--once", action="store_true", help="Run a single pass and exit"
+    )
+    args = parser.parse_args()
+
+    while True:
+        try:
+            run_once()
+        except Exception as e:
+            if args.once:
+                raise
+            print(f"❌ Idempotency key pruning failed: {str(e)}")
+        if args.once:
+            break
+        time.sleep(settings.idempotency_prune_interval_seconds)
+
+
+if __name__ == "__main__":
+    main()
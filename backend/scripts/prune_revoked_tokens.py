@@ -0,0 +1,31 @@
+"""
+Delete revoked token IDs whose tokens have expired.
+
+An expired token is rejected on its own, so its revocation row is no longer
+needed. Safe to run daily from cron.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.repositories.revoked_token_repository import (  # noqa: E402
+    RevokedTokenRepository,
+)
+
+
+def main():
+    db = SessionLocal()
+    try:
+        deleted = RevokedTokenRepository(db).prune(datetime.utcnow())
+        print(f"🧹 Deleted {deleted} expired token revocations")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Delete sync tombstones older than the retention window.
+
+Clients whose cursor is older than the window get a full resync instead,
+so these rows are no longer needed. Safe to run daily from cron.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.repositories.sync_repository import SyncRepository  # noqa: E402
+from app.services.sync_service import SYNC_TOMBSTONE_RETENTION_DAYS  # noqa: E402
+
+
+def main():
+    db = SessionLocal()
+    try:
+        before = datetime.utcnow() - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+        deleted = SyncRepository(db).prune_tombstones(before)
+        print(
+            f"🧹 Deleted {deleted} sync tombstones "
+            f"older than {SYNC_TOMBSTONE_RETENTION_DAYS} days"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Rebuild the matching index and every contractor's recommendation feed.
+
+The index is normally maintained as requests and profiles change; run this
+after deploying the matching tables, or after changing the term weights in
+app/services/matching_service.py.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.request import Request, RequestStatus  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories.matching_repository import MatchingRepository  # noqa: E402
+from app.services.matching_service import MatchingService  # noqa: E402
+
+
+def main():
+    db = SessionLocal()
+    try:
+        service = MatchingService(MatchingRepository(db))
+
+        # Requests first, so contractor rebuilds see the full index
+        requests = db.query(Request).filter(Request.status == RequestStatus.OPEN).all()
+        for request in requests:
+            service.on_request_saved(request)
+        print(f"📇 Indexed {len(requests)} open requests")
+
+        contractors = (
+            db.query(User)
+            .filter(User.role == UserRole.CONTRACTOR, User.is_active.is_(True))
+            .all()
+        )
+        for contractor in contractors:
+            service.on_contractor_changed(contractor)
+        print(f"👷 Rebuilt feeds for {len(contractors)} contractors")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Recompute the denormalised bid and request counters.
+
+requests.bid_count / pending_bid_count and users.open_request_count /
+active_bid_count are kept up to date by the repositories; this fixes any
+that drifted (rows written outside the app, manual SQL, bulk loads).
+Corrected requests get a new updated_at so clients refetch them. Safe to
+run nightly from cron.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.repositories.counter_repository import CounterRepository  # noqa: E402
+
+
+def main():
+    db = SessionLocal()
+    try:
+        fixed = CounterRepository(db).reconcile()
+        print(
+            f"🔢 Corrected counters on {fixed['requests']} requests "
+            f"and {fixed['users']} users"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Analytics refresher.
+
+Keeps the admin summary tables (analytics_request_daily, analytics_bid_daily,
+analytics_users) up to date: every ANALYTICS_REFRESH_INTERVAL_SECONDS it
+recomputes the days with changed requests and bids, and rebuilds everything
+every ANALYTICS_FULL_REFRESH_HOURS. Run one long-lived process (more are
+safe: each table's refresh locks its state row), or from cron with --once.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.analytics_service import AnalyticsService  # noqa: E402
+
+
+def run_once(full):
+    db = SessionLocal()
+    try:
+        result = AnalyticsService(db).refresh(full=full)
+        summary = ", ".join(
+            f"{table.name}: {'full' if table.full else f'{table.days} days'} "
+            f"-> {table.rows} rows"
+            for table in result.tables
+        )
+        print(f"📊 Refreshed analytics in {result.ms:.0f} ms ({summary})")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Refresh the admin analytics summaries"
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Run a single pass and exit"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Rebuild from scratch on the first pass"
+    )
+    args = parser.parse_args()
+
+    full = args.full
+    while True:
+        try:
+            run_once(full)
+            full = False
+        except Exception as e:
+            if args.once:
+                raise
+            print(f"❌ Analytics refresh failed: {str(e)}")
+        if args.once:
+            break
+        time.sleep(settings.analytics_refresh_interval_seconds)
+
+
+if __name__ == "__main__":
+    main()
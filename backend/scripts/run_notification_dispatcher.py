@@ -0,0 +1,97 @@
+"""
+Notification dispatcher.
+
+Turns outbox events into inbox notifications and sends each user at most one
+digest per window (NOTIFICATION_DIGEST_WINDOW_MINUTES) through
+NOTIFICATION_DELIVERY_METHOD. Run one long-lived process (more are safe: rows
+are claimed with SKIP LOCKED), or from cron with --once.
+"""
+
+import argparse
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.repositories.notification_repository import (  # noqa: E402
+    NotificationRepository,
+)
+from app.services.notification_service import (  # noqa: E402
+    NotificationService,
+    OUTBOX_BATCH_SIZE,
+)
+from app.services.providers import OTPDeliveryProvider, get_otp_provider  # noqa: E402
+
+
+def get_digest_provider():
+    method = settings.notification_delivery_method
+    if not method or method == "none":
+        print("🔕 Digests disabled; notifications are only kept for the in-app inbox")
+        return None
+    provider = get_otp_provider(method)
+    if type(provider).send_message is OTPDeliveryProvider.send_message:
+        raise SystemExit(
+            f"❌ {provider.get_provider_name()} cannot send notification digests"
+        )
+    print(f"📦 Sending digests via {provider.get_provider_name()}")
+    return provider
+
+
+def run_once(provider, window):
+    db = SessionLocal()
+    try:
+        service = NotificationService(NotificationRepository(db), provider)
+
+        processed = 0
+        while True:
+            batch = service.process_outbox()
+            processed += batch
+            if batch < OUTBOX_BATCH_SIZE:
+                break
+
+        sent = service.send_digests(window)
+        pruned = service.prune_outbox()
+        if processed or sent:
+            print(
+                f"🔔 Processed {processed} events, sent {sent} digests, "
+                f"pruned {pruned} old events"
+            )
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatch notifications")
+    parser.add_argument(
+        "--once", action="store_true", help="Run a single pass and exit"
+    )
+    parser.add_argument(
+        "--window-minutes",
+        type=float,
+        default=settings.notification_digest_window_minutes,
+        help="Digest window (default: NOTIFICATION_DIGEST_WINDOW_MINUTES)",
+    )
+    args = parser.parse_args()
+
+    provider = get_digest_provider()
+    window = timedelta(minutes=args.window_minutes)
+
+    while True:
+        try:
+            run_once(provider, window)
+        except Exception as e:
+            if args.once:
+                raise
+            print(f"❌ Dispatcher pass failed: {str(e)}")
+        if args.once:
+            break
+        time.sleep(settings.notification_dispatch_interval_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Start the API for production.
+
+Runs gunicorn with uvicorn workers and gunicorn.conf.py, so the worker count,
+recycling, timeouts and per-worker pool sizes all come from Settings. Where
+gunicorn is unavailable (Windows), falls back to uvicorn's own multi-process
+mode with the same settings, minus worker recycling: uvicorn does not
+replace a worker that exits.
+
+Usage:
+    python scripts/run_server.py [extra gunicorn options]
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Add parent directory to path
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.config import settings  # noqa: E402
+
+
+def main():
+    os.chdir(BACKEND_DIR)
+    print(
+        f"🚀 {settings.web_concurrency} worker(s) on {settings.host}:{settings.port}; "
+        f"DB pool per worker {settings.db_pool_size} "
+        f"+ {settings.db_max_overflow} overflow"
+    )
+
+    if os.name != "nt" and importlib.util.find_spec("gunicorn") is not None:
+        os.execv(
+            sys.executable,
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "app.main:app",
+                "--config",
+                "gunicorn.conf.py",
+                *sys.argv[1:],
+            ],
+        )
+
+    import uvicorn
+
+    print(
+        "⚠️ gunicorn not available; "
+        "using uvicorn workers without max-requests recycling"
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.web_concurrency,
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        log_level=settings.log_level.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()